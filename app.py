@@ -21,15 +21,17 @@ Année : 2024
 #####################
 
 from shiny import App, ui, reactive
-from shinywidgets import render_widget, render_plotly, output_widget
+from shinywidgets import render_plotly, output_widget
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
+import plotly.colors as pc
 import colorlover as cl
 import shinyswatch
-import datetime
-import orjson
+import math
+import os
+from functools import lru_cache
+from types import MappingProxyType
 
 
 
@@ -1086,6 +1088,927 @@ app_ui = ui.page_navbar(
 
 
 
+#####################
+## BLOC CONSTANTES ##
+#####################
+
+# définir les annotations communes aux graphiques (construites une seule fois) :
+# les sources des données, affichées sous chaque graphique
+_SOURCE_ANNOTATION = dict(
+    xref='paper', # utiliser la largeur totale du graphique comme référence
+    yref='paper', # utiliser la hauteur totale du graphique comme référence
+    x=0.5, # placer le point d'ancrage au milieu de la largeur
+    y=-0.1, # valeur à ajuster pour positionner verticalement le texte sous le graphique
+    xanchor='center', # centrer le texte par rapport au point d'ancrage
+    yanchor='top',
+    text=
+        'Enquête électorale française pour les ' +
+        'élections européennes de juin 2024, ' +
+        'par Ipsos Sopra Steria, Cevipof, ' +
+        'Le Monde, Fondation Jean Jaurès et ' +
+        'Institut Montaigne (2024)',
+    font=dict(
+        size=10,
+        color='grey'
+    ),
+    showarrow=False
+)
+
+# et le cadre de la légende personnalisée, dont seul le texte est à compléter
+_LEGEND_ANNOTATION_TEMPLATE = dict(
+    valign="top", # aligner le texte en haut de chaque marqueur de la légende
+    x=0.75, # position horizontale de la légende (1 = à droite du graphique)
+    y=1.00, # position verticale de la légende (1 = en haut)
+    xref='paper',
+    yref='paper',
+    xanchor='left', # ancrer la légende à gauche de sa position x
+    yanchor='top', # ancrer la légende en haut de sa position y
+    showarrow=False,
+    font=dict(size=12),
+    align='left',
+    bgcolor='rgba(255,255,255,0.8)', # fond légèrement transparent
+)
+
+# définir la mise en forme fixe des graphiques des votes en faveur des candidats
+# (1er et 2e tours des législatives), construite une seule fois au chargement de l'application
+_BASE_LAYOUT_CAND_LEGIS = dict(
+    # définir le titre du graphique et son apparence
+    title=dict(
+        text="Vote en faveur des candidats (couleurs politiques)",
+        y=0.98,
+        x=0.01,
+        xanchor='left',
+        yanchor='top'
+    ),
+    # définir le titre de l'axe des ordonnées et son apparence
+    yaxis=dict(
+        title=dict(
+            text='Pourcentage de répondants (%)',
+            font=dict(size=12)
+        )
+    ),
+    # configurer l'axe des abscisses pour n'afficher que des nombres entiers
+    xaxis=dict(
+        tickmode='linear',
+        tick0=1,
+        dtick=1,
+        tickfont=dict(size=12),
+        tickangle=0
+    ),
+    # définir l'affichage séparé des valeurs de % affichées au-dessus de
+    # chaque barre verticale quand la souris la survole
+    hovermode="closest",
+    # définir le thème général de l'apparence du graphique
+    template="plotly_white",
+    # définir les marges de la zone graphique
+    # (augmentées à droite pour le cadre fixe de la légende)
+    margin=dict(
+        b=50, # b = bottom
+        t=50,  # t = top
+        l=50, # l = left
+        r=200 # r = right
+    )
+)
+
+# définir la mise en forme commune des graphiques croisés avec une variable
+# socio-démographique (élections législatives) ; seuls le texte du titre et
+# le titre de la légende dépendent du graphique et de la variable choisie
+_BASE_LAYOUT_CROISE = dict(
+    barmode='group', # barres séparées et groupées pour les modalités de la VarSD choisie
+    # définir la position du titre
+    title=dict(
+        y=0.98,
+        x=0.01,
+        xanchor='left',
+        yanchor='top'
+    ),
+    # définir l'affichage séparé des valeurs de % affichées au-dessus de
+    # chaque barre verticale quand la souris la survole
+    hovermode="closest",
+    # définir le thème général de l'apparence du graphique
+    template="plotly_white",
+    # définir le titre de l'axe des ordonnées et son apparence
+    yaxis=dict(
+        title=dict(
+            text='Pourcentage de répondants (%)',
+            font=dict(size=12)
+        )
+    ),
+    # définir les sources des données
+    annotations=[_SOURCE_ANNOTATION],
+    # définir les marges de la zone graphique
+    # (augmentées à droite pour le cadre fixe de la légende)
+    margin=dict(
+        b=50, # b = bottom
+        t=50,  # t = top
+        l=50, # l = left
+        r=200 # r = right
+    ),
+    # fixer la position de la légende
+    legend=dict(
+        orientation="v",
+        valign='top',  # aligner le texte en haut de chaque marqueur de la légende
+        x=1.02, # position horizontale de la légende (1 = à droite du graphique)
+        y=1, # position verticale de la légende (1 = en haut)
+        xanchor='left', # ancrer la légende à gauche de sa position x
+        yanchor='top', # ancrer la légende en haut de sa position y
+        bgcolor='rgba(255,255,255,0.8)' # fond légèrement transparent
+    )
+)
+
+# définir les colonnes des fichiers de données qui ne sont utilisées par aucun graphique
+# (effectifs et informations sur la vague de l'enquête), écartées dès la lecture
+_COLONNES_NON_UTILISEES = frozenset({"n", "unweighted_n", "VAGUE", "TAILLEECH"})
+
+# précalculer les palettes de couleurs des graphiques :
+# palette 'Set1' de colorlover (9 couleurs au maximum, les palettes plus
+# courtes en étant les premières couleurs), et palette qualitative de Plotly
+_SET1 = tuple(cl.scales['9']['qual']['Set1'])
+_PLOTLY_QUAL = tuple(pc.qualitative.Plotly)
+
+
+# définir les dictionnaires des variables socio-démographiques (vague 7),
+# communs à tous les onglets des élections législatives et figés (lecture seule)
+
+# définir, pour chaque variable socio-démographique, sa description affichée dans
+# la fenêtre d'information : (nom de la variable, question de l'enquête associée,
+# modalités de réponse à cette question)
+_VARSD_INFO = MappingProxyType({
+    "Y7SEXEST": (
+        "Genre",
+        "Êtes-vous ?",
+        "1 = 'Homme' ; 2 = 'Femme'"
+    ),
+    "Y7AGERST": (
+        "Âge",
+        "Quelle est votre date de naissance ?",
+        "1 = '18 à 24 ans' ; 2 = '25 à 34 ans' ; 3 = '35 à 49 ans' ; 4 = '50 à 59 ans' ; 5 = '60 ans et plus'"
+    ),
+    "Y7REG13ST": (
+        "Région",
+        "Veuillez indiquer le département et la commune où vous résidez.",
+        "1 = 'Ile de France' ; 2 = 'Nord et Est (Hauts de France, Grand Est et Bourgogne Franche Comté)' ; 3 = 'Ouest (Normandie, Bretagne, Pays de la Loire et Centre Val de Loire)' ; 4 = 'Sud ouest (Nouvelle Aquitaine et Occitanie)' ; 5 = 'Sud est (Auvergne Rhône Alpes, Provence Alpes Côte d'Azur et Corse)'"
+    ),
+    "Y7AGGLO5ST": (
+        "Taille d'agglomération",
+        "Veuillez indiquer le département et la commune où vous résidez.",
+        "1 = 'Zone rurale (moins de 2 000 habitants)' ; 2 = 'Zone urbaine de 2 000 à 9 999 habitants' ; 3 = 'Zone urbaine de 10 000 à 49 999 habitants' ; 4 = 'Zone urbaine de 50 000 à 199 999 habitants' ; 5 = 'Zone urbaine de 200 000 habitants et plus'"
+    ),
+    "Y7EMPST": (
+        "Type d'emploi occupé",
+        "Quelle est votre situation professionnelle actuelle ?",
+        "1 = 'Salarié (salarié à plein temps ou à temps partiel)' ; 2 = 'Indépendant (travaille à mon compte)' ; 3 = 'Sans emploi (ne travaille pas actuellement tout en recherchant un emploi ou non, personne au foyer, retraité, étudiant ou élève)'"
+    ),
+    "Y7PCSIST": (
+        "Catégorie professionnelle",
+        "Quelle est votre situation professionnelle actuelle ?",
+        "1 = 'Agriculteur exploitant, artisan, commerçant, chef d entreprise' ; 2 = 'Cadre supérieur' ; 3 = 'Profession intermédiaire' ; 4 = 'Employé' ; 5 = 'Ouvrier' ; 6 = 'Retraité, inactif'"
+    ),
+    "Y7EDUST": (
+        "Niveau de scolarité atteint",
+        "Choisissez votre niveau de scolarité le plus élevé.",
+        "1 = 'Aucun diplôme' ; 2 = 'CAP, BEP' ; 3 = 'Baccalauréat' ; 4 = 'Bac +2' ; 5 = 'Bac +3 et plus'"
+    ),
+    "Y7REL1ST": (
+        "Religion",
+        "Quelle est votre religion, si vous en avez une ?",
+        "1 = 'Catholique' ; 2 = 'Juive' ; 3 = 'Musulmane' ; 4 = 'Autre religion (protestante, boudhiste ou autre)' ; 5 = 'Sans religion'"
+    ),
+    "Y7ECO2ST2": (
+        "Revenu mensuel du foyer",
+        " Pour finir, nous avons besoin de connaître, à des fins statistiques uniquement, la tranche dans laquelle se situe le revenu MENSUEL NET de votre FOYER après déduction des impôts sur le revenu (veuillez considérer toutes vos sources de revenus: salaires, bourses, prestations retraite et sécurité sociale, dividendes, revenus immobiliers, pensions alimentaires etc.).",
+        "1 = 'Moins de 1 250 euros' ; 2 = 'De 1 250 euros à 1 999 euros' ; 3 = 'De 2 000 à 3 499 euros' ; 4 = 'De 3 500 à 4 999 euros' ; 5 = '5 000 euros et plus'"
+    ),
+    "Y7INTPOLST": (
+        "Intérêt pour la politique",
+        "De manière générale, diriez-vous que vous vous intéressez à la politique ?",
+        "1 = 'Beaucoup' ; 2 = 'Un peu' ; 3 = 'Pas vraiment' ; 4 = 'Pas du tout'"
+    ),
+    "Y7Q7ST": (
+        "Positionnement idéologique",
+        "Sur une échelle de 0 à 10, où 0 correspond à la gauche et 10 correspond à la droite, où diriez-vous que vous vous situez ?",
+        "1 = 'Très à gauche' ; 2 = 'Plutôt à gauche' ; 3 = 'Au centre' ; 4 = 'Plutôt à droite' ; 5 = 'Très à droite'"
+    ),
+    "Y7PROXST": (
+        "Préférence partisane",
+        "De quel parti vous sentez-vous proche ou moins éloigné que les autres ?",
+        "1 = 'Très à gauche (Lutte Ouvrière, Nouveau Parti Anticapitaliste, Parti Communiste Français, France Insoumise)' ; 2 = 'Gauche (Parti Socialiste, Europe Ecologie - Les Verts)' ; 3 = 'Centre (Renaissance, Le MoDem (Mouvement Démocrate), Horizons, UDI (Union des Démocrates et Indépendants))' ; 4 = 'Droite (Les Républicains)' ; 5 = 'Très à droite (Debout la France, Rassemblement national (ex Front National), Reconquête!)' ; 6 = 'Autre parti ou aucun parti'"
+    )
+})
+
+# définir la partie variable du titre
+_DICO_TITRE = MappingProxyType({
+    "Y7SEXEST": "du genre",
+    "Y7AGERST": "de l'âge",
+    "Y7REG13ST": "de la région de résidence",
+    "Y7AGGLO5ST": "de la taille de l'agglomération de résidence",
+    "Y7EMPST": "du type d'emploi occupé",
+    "Y7PCSIST": "de la catégorie socio-professionnelle",
+    "Y7EDUST": "du niveau de scolarité atteint",
+    "Y7REL1ST": "de la religion",
+    "Y7ECO2ST2": "du revenu mensuel du foyer",
+    "Y7INTPOLST": "de l'intérêt pour la politique",
+    "Y7Q7ST": "du positionnement idéologique",
+    "Y7PROXST": "de la préférence partisane"
+})
+
+# définir la partie variable du titre de la légende
+_DICO_LEGENDE = MappingProxyType({
+    "Y7SEXEST": "Genre",
+    "Y7AGERST": "Âge",
+    "Y7REG13ST": "Région",
+    "Y7AGGLO5ST": "Taille d'agglomération",
+    "Y7EMPST": "Type d'emploi occupé",
+    "Y7PCSIST": "Catégorie professionnelle",
+    "Y7EDUST": "Niveau de scolarité atteint",
+    "Y7REL1ST": "Religion",
+    "Y7ECO2ST2": "Revenu mensuel du foyer",
+    "Y7INTPOLST": "Intérêt pour la politique",
+    "Y7Q7ST": "Positionnement idéologique",
+    "Y7PROXST": "Préférence partisane"
+})
+
+# définir un dictionnaire qui contient l'ordre figé des modalités pour chaque variable socio-démographique
+_DICO_ORDRE_MODALITES = MappingProxyType({
+    "Y7SEXEST": (
+        "Homme",
+        "Femme"
+    ),
+    "Y7AGERST": (
+        "18 à 24 ans",
+        "25 à 34 ans",
+        "35 à 49 ans",
+        "50 à 59 ans",
+        "60 ans et plus"
+    ),
+    "Y7REG13ST": (
+        "Ile de France",
+        "Nord et Est (Hauts de France, Grand Est et Bourgogne Franche Comté)",
+        "Ouest (Normandie, Bretagne, Pays de la Loire et Centre Val de Loire)",
+        "Sud ouest (Nouvelle Aquitaine et Occitanie)",
+        "Sud est (Auvergne Rhône Alpes, Provence Alpes Côte d'Azur et Corse)"
+    ),
+    "Y7AGGLO5ST": (
+        "Zone rurale (moins de 2 000 habitants)",
+        "Zone urbaine de 2 000 à 9 999 habitants",
+        "Zone urbaine de 10 000 à 49 999 habitants",
+        "Zone urbaine de 50 000 à 199 999 habitants",
+        "Zone urbaine de 200 000 habitants et plus"
+    ),
+    "Y7EMPST": (
+        "Salarié (salarié à plein temps ou à temps partiel)",
+        "Indépendant (travaille à mon compte)",
+        "Sans emploi (ne travaille pas actuellement tout en recherchant un emploi ou non, personne au foyer, retraité, étudiant ou élève)"
+    ),
+    "Y7PCSIST": (
+        "Agriculteur exploitant, artisan, commerçant, chef d entreprise",
+        "Cadre supérieur",
+        "Profession intermédiaire",
+        "Employé",
+        "Ouvrier",
+        "Retraité, inactif"
+    ),
+    "Y7EDUST": (
+        "Aucun diplôme",
+        "CAP, BEP",
+        "Baccalauréat",
+        "Bac +2",
+        "Bac +3 et plus"
+    ),
+    "Y7REL1ST": (
+        "Catholique",
+        "Juive",
+        "Musulmane",
+        "Autre religion (protestante, boudhiste ou autre)",
+        "Sans religion"
+    ),
+    "Y7ECO2ST2": (
+        "Moins de 1 250 euros",
+        "De 1 250 euros à 1 999 euros",
+        "De 2 000 à 3 499 euros",
+        "De 3 500 à 4 999 euros",
+        "5 000 euros et plus"
+    ),
+    "Y7INTPOLST": (
+        "Beaucoup",
+        "Un peu",
+        "Pas vraiment",
+        "Pas du tout"
+    ),
+    "Y7Q7ST": (
+        "Très à gauche",
+        "Plutôt à gauche",
+        "Au centre",
+        "Plutôt à droite",
+        "Très à droite"
+    ),
+    "Y7PROXST": (
+        "Très à gauche (Lutte Ouvrière, Nouveau Parti Anticapitaliste, Parti Communiste Français, France Insoumise)",
+        "Gauche (Parti Socialiste, Europe Ecologie - Les Verts)",
+        "Centre (Renaissance, Le MoDem (Mouvement Démocrate), Horizons, UDI (Union des Démocrates et Indépendants))",
+        "Droite (Les Républicains)",
+        "Très à droite (Debout la France, Rassemblement national (ex Front National), Reconquête!)",
+        "Autre parti ou aucun parti"
+    )
+})
+
+# définir l'ordre des modalités de la participation au 2e tour des législatives (Y7PARTL24BST)
+_ORDRE_PART_LEGIS_T2 = (
+    "Vous avez voté",
+    "Vous n'avez pas voté"
+)
+
+# définir le fichier de données de la participation au 2e tour des législatives
+# pour chaque variable socio-démographique (chemins construits une seule fois)
+_CSV_PART_LEGIS_T2 = MappingProxyType({
+    var_sd: "data/T_w7_partl24bst_%s.csv" % var_sd.lower()[2:]
+    for var_sd in _DICO_ORDRE_MODALITES
+})
+
+# définir l'ordre des modalités du sentiment personnel sur les résultats des
+# élections législatives (Y7PL4ST) ; la modalité "Indifférence" n'est pas représentée
+_ORDRE_SENTRES_LEGIS_T2 = (
+    "Sentiment positif (joie, espoir ou soulagement)",
+    "Sentiment négatif (déception, colère ou peur)"
+)
+
+# définir le fichier de données du sentiment personnel sur les résultats des élections
+# législatives pour chaque variable socio-démographique (chemins construits une seule fois)
+_CSV_SENTRES_LEGIS_T2 = MappingProxyType({
+    var_sd: "data/T_w7_pl4st_%s.csv" % var_sd.lower()[2:]
+    for var_sd in _DICO_ORDRE_MODALITES
+})
+
+# définir l'ordre des modalités de l'avis sur le front républicain (Y7PL5ST)
+_ORDRE_AVFR_LEGIS_T2 = (
+    "Le RN est une menace pour la démocratie",
+    "Tactique des partis traditionnels pour garder le pouvoir"
+)
+
+# définir le fichier de données de l'avis sur le front républicain
+# pour chaque variable socio-démographique (chemins construits une seule fois)
+_CSV_AVFR_LEGIS_T2 = MappingProxyType({
+    var_sd: "data/T_w7_pl5st_%s.csv" % var_sd.lower()[2:]
+    for var_sd in _DICO_ORDRE_MODALITES
+})
+
+# définir l'ordre des modalités de l'accord de vues avec l'entourage (Y7PL6ST)
+_ORDRE_ACCVUES_LEGIS_T2 = (
+    "Souvent",
+    "Rarement ou jamais"
+)
+
+# définir le fichier de données de l'accord de vues avec l'entourage
+# pour chaque variable socio-démographique (chemins construits une seule fois)
+_CSV_ACCVUES_LEGIS_T2 = MappingProxyType({
+    var_sd: "data/T_w7_pl6st_%s.csv" % var_sd.lower()[2:]
+    for var_sd in _DICO_ORDRE_MODALITES
+})
+
+# définir l'ordre des modalités de l'avis sur les conséquences de la dissolution
+# de l'Assemblée nationale (Y7PL13ST)
+_ORDRE_AVCONSDISS_LEGIS_T2 = (
+    "Des conséquences positives",
+    "Des conséquences négatives"
+)
+
+# définir le fichier de données de l'avis sur les conséquences de la dissolution
+# pour chaque variable socio-démographique (chemins construits une seule fois)
+_CSV_AVCONSDISS_LEGIS_T2 = MappingProxyType({
+    var_sd: "data/T_w7_pl13st_%s.csv" % var_sd.lower()[2:]
+    for var_sd in _DICO_ORDRE_MODALITES
+})
+
+# définir l'ordre des modalités du degré de confiance envers la nouvelle
+# Assemblée nationale (Y7PL15ST)
+_ORDRE_DEGCONFAN_LEGIS_T2 = (
+    "Confiance",
+    "Pas confiance"
+)
+
+# définir le fichier de données du degré de confiance envers la nouvelle Assemblée
+# pour chaque variable socio-démographique (chemins construits une seule fois)
+_CSV_DEGCONFAN_LEGIS_T2 = MappingProxyType({
+    var_sd: "data/T_w7_pl15st_%s.csv" % var_sd.lower()[2:]
+    for var_sd in _DICO_ORDRE_MODALITES
+})
+
+# définir les fichiers de données des votes en faveur des candidats
+# au 1er et au 2e tour des législatives
+_CSV_CAND_LEGIS_T1 = "data/T_w7_leg24axst.csv"
+_CSV_CAND_LEGIS_T2 = "data/T_w7_leg24bxst.csv"
+
+# définir les tableaux croisés précalculés par le script "scripts/bake_pivots.py" :
+# fichiers de données (un par variable socio-démographique), variable croisée
+# et ordre de ses modalités
+_TABLEAUX_CROISES_PRECALCULES = (
+    (_CSV_PART_LEGIS_T2, 'Y7PARTL24BST', _ORDRE_PART_LEGIS_T2),
+    (_CSV_SENTRES_LEGIS_T2, 'Y7PL4ST', _ORDRE_SENTRES_LEGIS_T2),
+    (_CSV_AVFR_LEGIS_T2, 'Y7PL5ST', _ORDRE_AVFR_LEGIS_T2),
+    (_CSV_ACCVUES_LEGIS_T2, 'Y7PL6ST', _ORDRE_ACCVUES_LEGIS_T2),
+    (_CSV_AVCONSDISS_LEGIS_T2, 'Y7PL13ST', _ORDRE_AVCONSDISS_LEGIS_T2),
+    (_CSV_DEGCONFAN_LEGIS_T2, 'Y7PL15ST', _ORDRE_DEGCONFAN_LEGIS_T2)
+)
+
+# définir les fichiers de données lus par "_load_static_csv" (fichiers des votes en
+# faveur des candidats et des tableaux croisés), convertis au format Parquet par le
+# script "scripts/convert_to_parquet.py"
+_FICHIERS_DONNEES_PARQUET = (
+    _CSV_CAND_LEGIS_T1,
+    _CSV_CAND_LEGIS_T2,
+    *(
+        csvfile
+        for csvfiles, _, _ in _TABLEAUX_CROISES_PRECALCULES
+        for csvfile in csvfiles.values()
+    )
+)
+
+# construire une seule fois les fenêtres d'information des boutons
+# (textes fixes, identiques pour toutes les sessions)
+
+# fenêtre de description de la question sur le vote au 1er tour des législatives
+_MODAL_CAND_QUESTION_LEGIS_T1 = ui.modal(
+    "La question posée aux répondants est la suivante : 'Pour quel candidat avez-vous voté au premier tour des élections législatives dans votre circonscription ?'",
+    title="Informations complémentaires sur la question contenue dans l'enquête :",
+    easy_close=False
+)
+
+# fenêtre de description de la variable du vote au 1er tour des législatives
+_MODAL_CAND_INFO_LEGIS_T1 = ui.modal(
+    "La variable sur la couleur politique du candidat ayant reçu le vote du répondant contient à l'origine 12 modalités. \
+    La variable du vote en faveur de la couleur politique du candidat présentée ici sur les graphiques est simplifiée : \
+    seules les 4 couleurs politiques ayant récolté le plus de suffrages sont retenues. \
+    Ainsi, les modalités de réponse synthétiques retenues pour cette variable sont les suivantes : \
+    1 = 'Rassemblement national (RN)', \
+    2 = 'Nouveau Front Populaire (NFP)', \
+    3 = 'Ensemble', \
+    4 = 'Les Républicains (LR) / Divers Droite (DVD)'.",
+    title="Informations complémentaires sur la variable choisie pour les graphiques :",
+    easy_close=False
+)
+
+# fenêtre de description de la question sur la participation au 2e tour des législatives
+_MODAL_PART_QUESTION_LEGIS_T2 = ui.modal(
+    "La question posée aux répondants est la suivante : 'Un électeur sur trois n’a pas voté au second tour des élections législatives le 7 juillet 2024. Dans votre cas personnel, qu’est ce qui correspond le mieux à votre attitude à cette occasion ?'",
+    title="Informations complémentaires sur la question contenue dans l'enquête :",
+    easy_close=False
+)
+
+# fenêtre de description de la variable de participation au 2e tour des législatives
+_MODAL_PARTST_INFO_LEGIS_T2 = ui.modal(
+    "La variable sur la participation aux élections législatives présentée ici sur les graphiques est une modalité synthétique de la question posée aux répondants de l'enquête. \
+    Ainsi, à partir des quatre modalités de réponse à la question de l'enquête, on en construit deux : 'Vous avez voté' ou 'Vous n'avez pas voté'.",
+    title="Informations complémentaires sur la variable choisie pour les graphiques :",
+    easy_close=False
+)
+
+# fenêtre de description de la question sur le vote au 2e tour des législatives
+_MODAL_CAND_QUESTION_LEGIS_T2 = ui.modal(
+    "La question posée aux répondants est la suivante : 'Voici les candidats qui se présentaient au second tour des élections législatives dans votre circonscription. Pouvez-vous dire celui pour lequel vous avez voté ?'",
+    title="Informations complémentaires sur la question contenue dans l'enquête :",
+    easy_close=False
+)
+
+# fenêtre de description de la variable du vote au 2e tour des législatives
+_MODAL_CAND_INFO_LEGIS_T2 = ui.modal(
+    "La variable sur la couleur politique du candidat ayant reçu le vote du répondant contient à l'origine 7 modalités. \
+    La variable du vote en faveur de la couleur politique du candidat présentée ici sur les graphiques est simplifiée : \
+    seules les 4 couleurs politiques ayant récolté le plus de suffrages sont retenues. \
+    Ainsi, les modalités de réponse synthétiques retenues pour cette variable sont les suivantes : \
+    1 = 'Rassemblement national (RN) et alliés', \
+    2 = 'Ensemble', \
+    3 = 'Nouveau Front Populaire (NFP)', \
+    4 = 'Les Républicains (LR) / Divers Droite (DVD)'.",
+    title="Informations complémentaires sur la variable choisie pour les graphiques :",
+    easy_close=False
+)
+
+# fenêtre de description de la question sur le sentiment personnel concernant les résultats des législatives
+_MODAL_SENTRES_QUESTION_LEGIS_T2 = ui.modal(
+    "La question posée aux répondants est la suivante : 'Et quand vous pensez aux résultats des élections législatives des 30 juin et 7 juillet dernier, lequel des sentiments suivants est le plus proche de ce que vous ressentez ?'",
+    title="Informations complémentaires sur la question contenue dans l'enquête :",
+    easy_close=False
+)
+
+# fenêtre de description de la variable du sentiment personnel concernant les résultats des législatives
+_MODAL_SENTRESST_INFO_LEGIS_T2 = ui.modal(
+    "La variable sur le sentiment personnel des répondants concernant les résultats des élections législatives (2e tour) présentée ici sur les graphiques est une modalité synthétique de la question posée aux répondants de l'enquête. \
+    Ainsi, à partir des sept modalités de réponse à la question de l'enquête, on en construit deux : 'Sentiment positif (joie, espoir ou soulagement)' ou 'Sentiment négatif (déception, colère ou peur)'.",
+    title="Informations complémentaires sur la variable choisie pour les graphiques :",
+    easy_close=False
+)
+
+# fenêtre de description de la question sur le front républicain
+_MODAL_AVFR_QUESTION_LEGIS_T2 = ui.modal(
+    "La question posée aux répondants est la suivante : 'Le Front Républicain est le fait d’appeler les électeurs de gauche et de droite à voter au second tour d’une élection pour un même candidat, afin d’empêcher l’élection d’un candidat du Rassemblement National. De laquelle des deux opinions suivantes vous sentez-vous le plus proche ?'",
+    title="Informations complémentaires sur la question contenue dans l'enquête :",
+    easy_close=False
+)
+
+# fenêtre de description de la variable de l'avis sur le front républicain
+_MODAL_AVFRST_INFO_LEGIS_T2 = ui.modal(
+    "La variable sur l'avis des répondants concernant le front républicain aux élections législatives (2e tour) \
+    présentée ici sur les graphiques contient deux modalités de réponse : \
+    'L’appel au Front Républicain exprime l’inquiétude de ceux qui pensent que le Rassemblement National est une menace pour la démocratie' \
+    et 'Le Front Républicain est une tactique permettant aux partis traditionnels de conserver le pouvoir'.",
+    title="Informations complémentaires sur la variable choisie pour les graphiques :",
+    easy_close=False
+)
+
+# fenêtre de description de chaque variable socio-démographique (texte complet
+# construit une seule fois pour chacun des choix possibles), pour la vague 6
+# (élections européennes, variables "Y6...") comme pour la vague 7 (élections
+# législatives, variables "Y7..."), dont les questions sont identiques
+_MODAL_VARSD_INFO = MappingProxyType({
+    vague + var_sd[2:]: ui.modal(
+        f"La variable '{nom}' correspond à ou est calculée à partir de la question suivante posée aux répondants : \
+        '{question}', \
+        et ses modalités de réponse (inchangées par rapport au questionnaire ou regroupées pour les présents graphiques) sont : \
+        {modalites}.",
+        title="Informations complémentaires sur la variable socio-démographique choisie :",
+        easy_close=False
+    )
+    for vague in ("Y6", "Y7")
+    for var_sd, (nom, question, modalites) in _VARSD_INFO.items()
+})
+
+
+
+####################
+## BLOC FONCTIONS ##
+####################
+
+# définir une fonction qui affiche les étiquettes
+# des modalités de la variable SD choisie dans la légende
+# sur plusieurs lignes si leur longueur initiale dépasse la
+# largeur du cadre de la légende (le découpage est mémorisé pour chaque
+# étiquette, les modalités étant toujours les mêmes d'un graphique à l'autre)
+@lru_cache(maxsize=256)
+def wrap_label(label, max_length=20):
+    # si le label est absent ou NaN
+    if label is None or (isinstance(label, float) and math.isnan(label)):
+        return "Non renseigné"
+    # convertir en string si ce n'est pas déjà le cas
+    label = str(label).strip()
+    # si la chaîne est vide après nettoyage
+    if not label:
+        return "Non renseigné"
+    if len(label) <= max_length:
+        return label
+    words = label.split()
+    lines = []
+    current_line = []
+    current_length = 0
+    for word in words:
+        if current_length + len(word) > max_length:
+            lines.append(' '.join(current_line))
+            current_line = [word]
+            current_length = len(word)
+        else:
+            current_line.append(word)
+            current_length += len(word) + 1
+    if current_line:
+        lines.append(' '.join(current_line))
+    return '<br>'.join(lines)
+
+
+# définir une fonction qui lit un fichier CSV de données en ne conservant que les
+# colonnes utilisées par les graphiques ; la première colonne (sans nom) des fichiers
+# est lue comme index de la table, et la colonne des pourcentages est lue directement
+# comme nombres décimaux (sans détection du type)
+def _read_data_csv(csvfile):
+    return pd.read_csv(
+        csvfile,
+        index_col=0,
+        usecols=lambda colonne: colonne not in _COLONNES_NON_UTILISEES,
+        dtype={"pct": "float64"}
+    )
+
+
+# définir une fonction qui lit un fichier CSV de données une seule fois
+# (les fichiers du dossier "data" sont statiques : la table lue est
+# conservée en mémoire et réutilisée à chaque nouvel affichage du graphique) ;
+# si la version Parquet du fichier a été produite par le script
+# "scripts/convert_to_parquet.py" et n'est pas plus ancienne que le fichier CSV,
+# c'est elle qui est lue (lecture plus rapide), sinon le fichier CSV est lu
+# (la table lue est partagée : elle ne doit pas être modifiée par les graphiques)
+@lru_cache(maxsize=None)
+def _load_static_csv(csvfile):
+    parquetfile = os.path.splitext(csvfile)[0] + ".parquet"
+    if (
+        os.path.exists(parquetfile)
+        and os.path.getmtime(parquetfile) >= os.path.getmtime(csvfile)
+    ):
+        return pd.read_parquet(parquetfile, engine="pyarrow")
+    return _read_data_csv(csvfile)
+
+
+# définir une fonction qui renvoie les couleurs de la palette 'Set1' pour le nombre
+# de modalités indiqué (au-delà de 9 modalités, les couleurs de la palette sont répétées)
+@lru_cache(maxsize=None)
+def _couleurs_set1(nb_modalites):
+    return tuple(_SET1[i % len(_SET1)] for i in range(nb_modalites))
+
+
+# définir une fonction qui renvoie les couleurs de la palette qualitative de Plotly pour
+# le nombre de modalités indiqué (au-delà de 10 modalités, les couleurs sont répétées)
+@lru_cache(maxsize=None)
+def _couleurs_plotly(nb_modalites):
+    return tuple(_PLOTLY_QUAL[i % len(_PLOTLY_QUAL)] for i in range(nb_modalites))
+
+
+# définir une fonction qui construit, une seule fois par fichier, le texte de la
+# légende personnalisée des graphiques de vote en faveur des candidats
+# (correspondance entre les étiquettes courtes, numérotées à partir de 1,
+# et les étiquettes longues, c'est-à-dire les modalités de la variable)
+@lru_cache(maxsize=None)
+def _legende_text(csvfile, variable):
+    data = _load_static_csv(csvfile)
+    etiquettes_courtes = pd.Series(range(1, len(data) + 1), index=data.index).astype(str)
+    return "<br>".join((etiquettes_courtes + ": " + data[variable].astype(str)).tolist())
+
+
+# définir une fonction qui construit, une seule fois par fichier, le graphique des
+# votes en faveur des candidats (1er ou 2e tour des législatives) : les données étant
+# statiques, le même graphique est renvoyé à chaque affichage (shinywidgets en fait
+# une copie pour chaque session, le graphique mémorisé n'est donc jamais modifié)
+@lru_cache(maxsize=None)
+def _fig_cand_legis(csvfile, variable):
+    # importer les données
+    data = _load_static_csv(csvfile)
+    # identifier les étiquettes courtes (chiffres démarrant à 1)
+    etiquettes_courtes = np.arange(1, len(data) + 1)
+    # créer la liste des couleurs en fonction du nombre de modalités
+    couleurs_cl = _couleurs_set1(len(data[variable]))
+    # créer le texte de la légende (correspondance entre les étiquettes courtes et les étiquettes longues)
+    legende_text = _legende_text(csvfile, variable)
+    # créer le graphique en une seule fois à partir des données et de la mise
+    # en forme fixe "_BASE_LAYOUT_CAND_LEGIS" (sans appels successifs à "update_layout")
+    fig = go.Figure({
+        "data": [
+            {
+                "type": "bar",
+                # on représente la colonne des étiquettes courtes (et non la variable elle-même, car
+                # cette colonne correspond aux étiquettes longues de la légende)
+                "x": etiquettes_courtes,
+                "y": data["pct"],
+                # changer de couleur en fonction de la modalité de réponse
+                "marker": {"color": couleurs_cl},
+                # afficher les valeurs sous le format 'xx.x%' dans la bulle qui s'affiche
+                # au survol de la courbe par la souris, et supprimer toutes les autres
+                # informations qui pourraient s'afficher en plus (nom de la modalité)
+                "hovertemplate": '%{y:.1f}%<extra></extra>'
+            }
+        ],
+        "layout": {
+            **_BASE_LAYOUT_CAND_LEGIS,
+            # définir deux annotations : les sources des données
+            # et la légende personnalisée
+            "annotations": [
+                _SOURCE_ANNOTATION,
+                {**_LEGEND_ANNOTATION_TEMPLATE, "text": f"<b>Légende :</b><br>{legende_text}"}
+            ]
+        }
+    })
+    return fig
+
+
+# définir une fonction qui construit un graphique croisé (une barre par modalité de la
+# variable socio-démographique) directement à partir de dictionnaires, en un seul appel
+# à "go.Figure" sur la mise en forme commune "_BASE_LAYOUT_CROISE" (sans appels
+# successifs à "add_trace" et "update_layout", qui valident le graphique à chaque fois)
+def _fig_croise(df_pivot, ordre_modalites, titre, var_sd):
+    # extraire une seule fois les valeurs et les modalités du tableau croisé
+    # (évite une recherche par étiquette dans le tableau pour chaque barre)
+    y_matrix = df_pivot.to_numpy(dtype=float)
+    labels = df_pivot.index.tolist()
+    # créer une palette de couleurs automatique
+    palette = _couleurs_plotly(len(labels))
+    return go.Figure({
+        "data": [
+            {
+                "type": "bar",
+                "x": ordre_modalites,
+                "y": y_matrix[i].tolist(),
+                "name": wrap_label(VarSD),
+                "marker": {"color": palette[i]},
+                # afficher les valeurs sous le format 'xx.x%' dans la bulle qui s'affiche
+                # au survol de la courbe par la souris, et supprimer toutes les autres
+                # informations qui pourraient s'afficher en plus (nom de la modalité)
+                "hovertemplate": '%{y:.1f}%<extra></extra>'
+            }
+            for i, VarSD in enumerate(labels)
+        ],
+        "layout": {
+            **_BASE_LAYOUT_CROISE,
+            # définir le titre du graphique
+            "title": dict(
+                _BASE_LAYOUT_CROISE["title"],
+                text="%s en fonction %s" % (titre, _DICO_TITRE[var_sd])
+            ),
+            # définir le titre de la légende
+            "legend": dict(
+                _BASE_LAYOUT_CROISE["legend"],
+                title=dict(
+                    text=_DICO_LEGENDE[var_sd]
+                )
+            )
+        }
+    })
+
+
+# définir une fonction qui enregistre, dans la session en cours, l'affichage de la
+# fenêtre de description de la variable socio-démographique choisie (fenêtre
+# préconstruite dans "_MODAL_VARSD_INFO") lorsque le bouton correspondant est cliqué
+def _show_varsd_info(bouton, select_var_sd):
+    @reactive.effect
+    @reactive.event(bouton)
+    def _():
+        ui.modal_show(_MODAL_VARSD_INFO[select_var_sd()])
+    return _
+
+
+# définir une fonction qui calcule le tableau croisé (en %) d'une variable
+# avec la variable socio-démographique choisie, à partir de la table des données
+def _pivot_croise(df, var_sd, variable, ordre_modalites):
+    # numéroter les modalités des deux variables selon leur ordre figé (les modalités
+    # absentes de "_DICO_ORDRE_MODALITES" ou de "ordre_modalites", dont les
+    # non-réponses, reçoivent le numéro -1 et sont écartées)
+    ordre_sd = _DICO_ORDRE_MODALITES[var_sd]
+    codes_sd = pd.Index(ordre_sd).get_indexer(df[var_sd])
+    codes_var = pd.Index(ordre_modalites).get_indexer(df[variable])
+    garder = (codes_sd >= 0) & (codes_var >= 0)
+    # placer directement chaque pourcentage dans le tableau croisé
+    # (sans passer par "pivot", inutilement coûteux pour un si petit tableau)
+    valeurs = np.full((len(ordre_sd), len(ordre_modalites)), np.nan)
+    valeurs[codes_sd[garder], codes_var[garder]] = df['pct'].to_numpy()[garder]
+    # ne garder que les modalités de la variable SD présentes dans les données
+    presentes = np.zeros(len(ordre_sd), dtype=bool)
+    presentes[codes_sd[garder]] = True
+    return pd.DataFrame(
+        valeurs[presentes],
+        index=pd.Index(ordre_sd, name=var_sd)[presentes],
+        columns=pd.Index(ordre_modalites, name=variable)
+    )
+
+
+# définir une fonction qui calcule le tableau croisé (en %) d'une variable
+# avec la variable socio-démographique choisie, à partir du fichier de données
+def _build_pivot_croise(csvfile, var_sd, variable, ordre_modalites):
+    return _pivot_croise(_load_static_csv(csvfile), var_sd, variable, ordre_modalites)
+
+
+# définir une fonction qui renvoie le fichier du tableau croisé précalculé
+# (par le script "scripts/bake_pivots.py") correspondant à un fichier de données
+def _pivot_path(csvfile):
+    return os.path.splitext(csvfile)[0] + "_pivot.parquet"
+
+
+# définir une fonction qui renvoie, une seule fois par fichier de données, le tableau
+# croisé d'une variable avec la variable socio-démographique choisie : le tableau
+# précalculé par le script "scripts/bake_pivots.py" est lu s'il existe et n'est pas
+# plus ancien que le fichier de données, sinon il est calculé à partir de ce fichier
+@lru_cache(maxsize=None)
+def _load_pivot_croise(csvfile, var_sd, variable, ordre_modalites):
+    pivotfile = _pivot_path(csvfile)
+    if (
+        os.path.exists(pivotfile)
+        and os.path.getmtime(pivotfile) >= os.path.getmtime(csvfile)
+    ):
+        return pd.read_parquet(pivotfile, engine="pyarrow")
+    return _build_pivot_croise(csvfile, var_sd, variable, ordre_modalites)
+
+
+# définir une fonction qui renvoie le tableau croisé de la participation au
+# 2e tour des législatives en fonction de la variable socio-démographique choisie
+def _load_pivot_part_legis_t2(var_sd):
+    return _load_pivot_croise(
+        _CSV_PART_LEGIS_T2[var_sd],
+        var_sd,
+        'Y7PARTL24BST',
+        _ORDRE_PART_LEGIS_T2
+    )
+
+
+# définir une fonction qui renvoie le tableau croisé du sentiment personnel sur les
+# résultats des élections législatives en fonction de la variable socio-démographique choisie
+def _load_pivot_sentres_legis_t2(var_sd):
+    return _load_pivot_croise(
+        _CSV_SENTRES_LEGIS_T2[var_sd],
+        var_sd,
+        'Y7PL4ST',
+        _ORDRE_SENTRES_LEGIS_T2
+    )
+
+
+# définir une fonction qui renvoie le tableau croisé de l'avis sur le front
+# républicain en fonction de la variable socio-démographique choisie
+def _load_pivot_avfr_legis_t2(var_sd):
+    return _load_pivot_croise(
+        _CSV_AVFR_LEGIS_T2[var_sd],
+        var_sd,
+        'Y7PL5ST',
+        _ORDRE_AVFR_LEGIS_T2
+    )
+
+
+# définir une fonction qui renvoie le tableau croisé de l'accord de vues avec
+# l'entourage en fonction de la variable socio-démographique choisie
+def _load_pivot_accvues_legis_t2(var_sd):
+    return _load_pivot_croise(
+        _CSV_ACCVUES_LEGIS_T2[var_sd],
+        var_sd,
+        'Y7PL6ST',
+        _ORDRE_ACCVUES_LEGIS_T2
+    )
+
+
+# définir une fonction qui renvoie le tableau croisé de l'avis sur les conséquences
+# de la dissolution en fonction de la variable socio-démographique choisie
+def _load_pivot_avconsdiss_legis_t2(var_sd):
+    return _load_pivot_croise(
+        _CSV_AVCONSDISS_LEGIS_T2[var_sd],
+        var_sd,
+        'Y7PL13ST',
+        _ORDRE_AVCONSDISS_LEGIS_T2
+    )
+
+
+# définir une fonction qui renvoie le tableau croisé du degré de confiance envers la
+# nouvelle Assemblée en fonction de la variable socio-démographique choisie
+def _load_pivot_degconfan_legis_t2(var_sd):
+    return _load_pivot_croise(
+        _CSV_DEGCONFAN_LEGIS_T2[var_sd],
+        var_sd,
+        'Y7PL15ST',
+        _ORDRE_DEGCONFAN_LEGIS_T2
+    )
+
+
+# définir une fonction qui construit, une seule fois par variable socio-démographique,
+# le graphique croisé de l'accord de vues avec l'entourage (le graphique ne dépend que de
+# cette variable ; shinywidgets en crée une copie pour chaque session, le graphique
+# mémorisé n'est donc jamais modifié)
+@lru_cache(maxsize=None)
+def _fig_croise_accvues_legis_t2(var_sd):
+    # créer et retourner le graphique à partir du tableau croisé mémorisé des données
+    return _fig_croise(
+        _load_pivot_accvues_legis_t2(var_sd),
+        _ORDRE_ACCVUES_LEGIS_T2,
+        "Accord de vues avec l'entourage",
+        var_sd
+    )
+
+
+# définir une fonction qui construit, une seule fois par variable socio-démographique,
+# le graphique croisé de l'avis sur les conséquences de la dissolution (le graphique ne dépend que de
+# cette variable ; shinywidgets en crée une copie pour chaque session, le graphique
+# mémorisé n'est donc jamais modifié)
+@lru_cache(maxsize=None)
+def _fig_croise_avconsdiss_legis_t2(var_sd):
+    # créer et retourner le graphique à partir du tableau croisé mémorisé des données
+    return _fig_croise(
+        _load_pivot_avconsdiss_legis_t2(var_sd),
+        _ORDRE_AVCONSDISS_LEGIS_T2,
+        "Avis sur les conséquences de la dissolution",
+        var_sd
+    )
+
+
+# définir une fonction qui construit, une seule fois par variable socio-démographique,
+# le graphique croisé du degré de confiance envers la nouvelle Assemblée (le graphique ne
+# dépend que de cette variable ; shinywidgets en crée une copie pour chaque session, le
+# graphique mémorisé n'est donc jamais modifié)
+@lru_cache(maxsize=None)
+def _fig_croise_degconfan_legis_t2(var_sd):
+    # créer et retourner le graphique à partir du tableau croisé mémorisé des données
+    return _fig_croise(
+        _load_pivot_degconfan_legis_t2(var_sd),
+        _ORDRE_DEGCONFAN_LEGIS_T2,
+        "Degré de confiance envers la nouvelle Assemblée nationale",
+        var_sd
+    )
+
+
+# précharger au démarrage de l'application les tableaux croisés du sentiment
+# personnel sur les résultats des élections législatives (un par variable
+# socio-démographique, lus dans les tableaux précalculés s'ils sont à jour) :
+# à l'affichage, seul le graphique reste à construire
+_PIVOTS_SENTRES_LEGIS_T2 = MappingProxyType({
+    var_sd: _load_pivot_sentres_legis_t2(var_sd)
+    for var_sd in _DICO_ORDRE_MODALITES
+})
+
+# précharger au démarrage de l'application les tableaux croisés de l'avis
+# sur le front républicain (un par variable socio-démographique, lus dans les
+# tableaux précalculés s'ils sont à jour)
+_PIVOTS_AVFR_LEGIS_T2 = MappingProxyType({
+    var_sd: _load_pivot_avfr_legis_t2(var_sd)
+    for var_sd in _DICO_ORDRE_MODALITES
+})
+
+
+
 #################
 ## BLOC SERVER ##
 #################
@@ -1131,71 +2054,7 @@ def server(input, output, session):
         ui.modal_show(m)
 
     # bouton 03 : afficher la description de la variable socio-démographique choisie
-    # avec plusieurs parties de texte qui dépendent de ce choix (via des dictionnaires)
-    @reactive.effect
-    @reactive.event(input.Show_VarSD_Part_Info)
-    def _():
-        # définir le nom de la variable socio-démographique choisie
-        dico_nom_var = {
-            "Y6SEXEST": "Genre",
-            "Y6AGERST": "Âge",
-            "Y6REG13ST": "Région",
-            "Y6AGGLO5ST": "Taille d'agglomération",
-            "Y6EMPST": "Type d'emploi occupé",
-            "Y6PCSIST": "Catégorie professionnelle",
-            "Y6EDUST": "Niveau de scolarité atteint",
-            "Y6REL1ST": "Religion",
-            "Y6ECO2ST2": "Revenu mensuel du foyer",
-            "Y6INTPOLST": "Intérêt pour la politique",
-            "Y6Q7ST": "Positionnement idéologique",
-            "Y6PROXST": "Préférence partisane"
-        }
-        # définir la question de l'enquête associée à la variable socio-démographique choisie
-        dico_question_var = {
-            "Y6SEXEST": "Êtes-vous ?",
-            "Y6AGERST": "Quelle est votre date de naissance ?",
-            "Y6REG13ST": "Veuillez indiquer le département et la commune où vous résidez.",
-            "Y6AGGLO5ST": "Veuillez indiquer le département et la commune où vous résidez.",
-            "Y6EMPST": "Quelle est votre situation professionnelle actuelle ?",
-            "Y6PCSIST": "Quelle est votre situation professionnelle actuelle ?",
-            "Y6EDUST": "Choisissez votre niveau de scolarité le plus élevé.",
-            "Y6REL1ST": "Quelle est votre religion, si vous en avez une ?",
-            "Y6ECO2ST2": " Pour finir, nous avons besoin de connaître, à des fins statistiques uniquement, la tranche dans laquelle se situe le revenu MENSUEL NET de votre FOYER après déduction des impôts sur le revenu (veuillez considérer toutes vos sources de revenus: salaires, bourses, prestations retraite et sécurité sociale, dividendes, revenus immobiliers, pensions alimentaires etc.).",
-            "Y6INTPOLST": "De manière générale, diriez-vous que vous vous intéressez à la politique ?",
-            "Y6Q7ST": "Sur une échelle de 0 à 10, où 0 correspond à la gauche et 10 correspond à la droite, où diriez-vous que vous vous situez ?",
-            "Y6PROXST": "De quel parti vous sentez-vous proche ou moins éloigné que les autres ?"
-        }
-        # définir les modalités de réponse à la question de l'enquête associée à la variable socio-démographique choisie
-        dico_modalite_var = {
-            "Y6SEXEST": "1 = 'Homme' ; 2 = 'Femme'",
-            "Y6AGERST": "1 = '18 à 24 ans' ; 2 = '25 à 34 ans' ; 3 = '35 à 49 ans' ; 4 = '50 à 59 ans' ; 5 = '60 ans et plus'",
-            "Y6REG13ST": "1 = 'Ile de France' ; 2 = 'Nord et Est (Hauts de France, Grand Est et Bourgogne Franche Comté)' ; 3 = 'Ouest (Normandie, Bretagne, Pays de la Loire et Centre Val de Loire)' ; 4 = 'Sud ouest (Nouvelle Aquitaine et Occitanie)' ; 5 = 'Sud est (Auvergne Rhône Alpes, Provence Alpes Côte d'Azur et Corse)'",
-            "Y6AGGLO5ST": "1 = 'Zone rurale (moins de 2 000 habitants)' ; 2 = 'Zone urbaine de 2 000 à 9 999 habitants' ; 3 = 'Zone urbaine de 10 000 à 49 999 habitants' ; 4 = 'Zone urbaine de 50 000 à 199 999 habitants' ; 5 = 'Zone urbaine de 200 000 habitants et plus'",
-            "Y6EMPST": "1 = 'Salarié (salarié à plein temps ou à temps partiel)' ; 2 = 'Indépendant (travaille à mon compte)' ; 3 = 'Sans emploi (ne travaille pas actuellement tout en recherchant un emploi ou non, personne au foyer, retraité, étudiant ou élève)'",
-            "Y6PCSIST": "1 = 'Agriculteur exploitant, artisan, commerçant, chef d entreprise' ; 2 = 'Cadre supérieur' ; 3 = 'Profession intermédiaire' ; 4 = 'Employé' ; 5 = 'Ouvrier' ; 6 = 'Retraité, inactif'",
-            "Y6EDUST": "1 = 'Aucun diplôme' ; 2 = 'CAP, BEP' ; 3 = 'Baccalauréat' ; 4 = 'Bac +2' ; 5 = 'Bac +3 et plus'",
-            "Y6REL1ST": "1 = 'Catholique' ; 2 = 'Juive' ; 3 = 'Musulmane' ; 4 = 'Autre religion (protestante, boudhiste ou autre)' ; 5 = 'Sans religion'",
-            "Y6ECO2ST2": "1 = 'Moins de 1 250 euros' ; 2 = 'De 1 250 euros à 1 999 euros' ; 3 = 'De 2 000 à 3 499 euros' ; 4 = 'De 3 500 à 4 999 euros' ; 5 = '5 000 euros et plus'",
-            "Y6INTPOLST": "1 = 'Beaucoup' ; 2 = 'Un peu' ; 3 = 'Pas vraiment' ; 4 = 'Pas du tout'",
-            "Y6Q7ST": "1 = 'Très à gauche' ; 2 = 'Plutôt à gauche' ; 3 = 'Au centre' ; 4 = 'Plutôt à droite' ; 5 = 'Très à droite'",
-            "Y6PROXST": "1 = 'Extême gauche (Lutte Ouvrière, Nouveau Parti Anticapitaliste, Parti Communiste Français, France Insoumise)' ; 2 = 'Gauche (Parti Socialiste, Europe Ecologie - Les Verts)' ; 3 = 'Centre (Renaissance, Le MoDem (Mouvement Démocrate), Horizons, UDI (Union des Démocrates et Indépendants))' ; 4 = 'Droite (Les Républicains)' ; 5 = 'Très à droite (Debout la France, Rassemblement national (ex Front National), Reconquête!)' ; 6 = 'Autre parti ou aucun parti'"
-        }
-        # définir le texte complet à afficher (avec parties fixes et variables en fonction du choix effectué)
-        m = ui.modal(
-            "La variable '%s' correspond à ou est calculée à partir de la question suivante posée aux répondants : \
-            '%s', \
-            et ses modalités de réponse (inchangées par rapport au questionnaire ou regroupées pour les présents graphiques) sont : \
-            %s." % (
-                dico_nom_var.get(
-                    "%s" % input.Select_VarSD_Part()
-                ),
-                dico_question_var.get("%s" % input.Select_VarSD_Part()),
-                dico_modalite_var.get("%s" % input.Select_VarSD_Part())
-            ),
-            title="Informations complémentaires sur la variable socio-démographique choisie :",
-            easy_close=False
-        )
-        ui.modal_show(m)
+    _show_varsd_info(input.Show_VarSD_Part_Info, input.Select_VarSD_Part)
 
     # graphique
     @output
@@ -1413,7 +2272,7 @@ def server(input, output, session):
         df_pivot = df_pivot.reindex(columns=ordre_modalites)
         # créer une palette de couleurs automatique
         nb_couleurs = len(df_pivot.index)
-        palette = px.colors.qualitative.Plotly[:nb_couleurs]
+        palette = pc.qualitative.Plotly[:nb_couleurs]
         # créer le graphique
         fig = go.Figure()
         # ajouter les données
@@ -1427,14 +2286,7 @@ def server(input, output, session):
                     # afficher les valeurs sous le format 'xx.x%' dans la bulle qui s'affiche
                     # au survol de la courbe par la souris, et supprimer toutes les autres
                     # informations qui pourraient s'afficher en plus (nom de la modalité)
-                    hovertemplate='%{y:.1f}%<extra></extra>',
-                    # n'afficher la bulle contenant la valeur 'y' en % uniquement
-                    # au-dessus de la barre verticale survolée par la souris
-                    hoverinfo='y',
-                    # aligner ce texte 'y' dans la bulle de manière automatique
-                    hoverlabel=dict(
-                        align='auto'
-                    )
+                    hovertemplate='%{y:.1f}%<extra></extra>'
                 )
             )
          # mettre en forme le graphique
@@ -1576,14 +2428,7 @@ def server(input, output, session):
                 # afficher les valeurs sous le format 'xx.x%' dans la bulle qui s'affiche
                 # au survol de la courbe par la souris, et supprimer toutes les autres
                 # informations qui pourraient s'afficher en plus (nom de la modalité)
-                hovertemplate='%{y:.1f}%<extra></extra>',
-                # n'afficher la bulle contenant la valeur 'y' en % uniquement
-                # au-dessus de la barre verticale survolée par la souris
-                hoverinfo='y',
-                # centrer ce texte 'y' dans la bulle
-                hoverlabel=dict(
-                   align='auto'
-                )
+                hovertemplate='%{y:.1f}%<extra></extra>'
             )
         )
         # créer le texte de la légende (correspondance entre les étiquettes courtes et les étiquettes longues)
@@ -1836,69 +2681,7 @@ def server(input, output, session):
 
 
     # bouton 03 : afficher la description de la variable socio-démographique choisie
-    # avec plusieurs parties de texte qui dépendent de ce choix (via des dictionnaires)
-    @reactive.effect
-    @reactive.event(input.Show_VarSD_Enj_Info)
-    def _():
-        # définir le nom de la variable socio-démographique choisie
-        dico_nom_var = {
-            "Y6SEXEST": "Genre",
-            "Y6AGERST": "Âge",
-            "Y6REG13ST": "Région",
-            "Y6AGGLO5ST": "Taille d'agglomération",
-            "Y6EMPST": "Type d'emploi occupé",
-            "Y6PCSIST": "Catégorie professionnelle",
-            "Y6EDUST": "Niveau de scolarité atteint",
-            "Y6REL1ST": "Religion",
-            "Y6ECO2ST2": "Revenu mensuel du foyer",
-            "Y6INTPOLST": "Intérêt pour la politique",
-            "Y6Q7ST": "Positionnement idéologique",
-            "Y6PROXST": "Préférence partisane"
-        }
-        # définir la question de l'enquête associée à la variable socio-démographique choisie
-        dico_question_var = {
-            "Y6SEXEST": "Êtes-vous ?",
-            "Y6AGERST": "Quelle est votre date de naissance ?",
-            "Y6REG13ST": "Veuillez indiquer le département et la commune où vous résidez.",
-            "Y6AGGLO5ST": "Veuillez indiquer le département et la commune où vous résidez.",
-            "Y6EMPST": "Quelle est votre situation professionnelle actuelle ?",
-            "Y6PCSIST": "Quelle est votre situation professionnelle actuelle ?",
-            "Y6EDUST": "Choisissez votre niveau de scolarité le plus élevé.",
-            "Y6REL1ST": "Quelle est votre religion, si vous en avez une ?",
-            "Y6ECO2ST2": " Pour finir, nous avons besoin de connaître, à des fins statistiques uniquement, la tranche dans laquelle se situe le revenu MENSUEL NET de votre FOYER après déduction des impôts sur le revenu (veuillez considérer toutes vos sources de revenus: salaires, bourses, prestations retraite et sécurité sociale, dividendes, revenus immobiliers, pensions alimentaires etc.).",
-            "Y6INTPOLST": "De manière générale, diriez-vous que vous vous intéressez à la politique ?",
-            "Y6Q7ST": "Sur une échelle de 0 à 10, où 0 correspond à la gauche et 10 correspond à la droite, où diriez-vous que vous vous situez ?",
-            "Y6PROXST": "De quel parti vous sentez-vous proche ou moins éloigné que les autres ?"
-        }
-        # définir les modalités de réponse à la question de l'enquête associée à la variable socio-démographique choisie
-        dico_modalite_var = {
-            "Y6SEXEST": "1 = 'Homme' ; 2 = 'Femme'",
-            "Y6AGERST": "1 = '18 à 24 ans' ; 2 = '25 à 34 ans' ; 3 = '35 à 49 ans' ; 4 = '50 à 59 ans' ; 5 = '60 ans et plus'",
-            "Y6REG13ST": "1 = 'Ile de France' ; 2 = 'Nord et Est (Hauts de France, Grand Est et Bourgogne Franche Comté)' ; 3 = 'Ouest (Normandie, Bretagne, Pays de la Loire et Centre Val de Loire)' ; 4 = 'Sud ouest (Nouvelle Aquitaine et Occitanie)' ; 5 = 'Sud est (Auvergne Rhône Alpes, Provence Alpes Côte d'Azur et Corse)'",
-            "Y6AGGLO5ST": "1 = 'Zone rurale (moins de 2 000 habitants)' ; 2 = 'Zone urbaine de 2 000 à 9 999 habitants' ; 3 = 'Zone urbaine de 10 000 à 49 999 habitants' ; 4 = 'Zone urbaine de 50 000 à 199 999 habitants' ; 5 = 'Zone urbaine de 200 000 habitants et plus'",
-            "Y6EMPST": "1 = 'Salarié (salarié à plein temps ou à temps partiel)' ; 2 = 'Indépendant (travaille à mon compte)' ; 3 = 'Sans emploi (ne travaille pas actuellement tout en recherchant un emploi ou non, personne au foyer, retraité, étudiant ou élève)'",
-            "Y6PCSIST": "1 = 'Agriculteur exploitant, artisan, commerçant, chef d entreprise' ; 2 = 'Cadre supérieur' ; 3 = 'Profession intermédiaire' ; 4 = 'Employé' ; 5 = 'Ouvrier' ; 6 = 'Retraité, inactif'",
-            "Y6EDUST": "1 = 'Aucun diplôme' ; 2 = 'CAP, BEP' ; 3 = 'Baccalauréat' ; 4 = 'Bac +2' ; 5 = 'Bac +3 et plus'",
-            "Y6REL1ST": "1 = 'Catholique' ; 2 = 'Juive' ; 3 = 'Musulmane' ; 4 = 'Autre religion (protestante, boudhiste ou autre)' ; 5 = 'Sans religion'",
-            "Y6ECO2ST2": "1 = 'Moins de 1 250 euros' ; 2 = 'De 1 250 euros à 1 999 euros' ; 3 = 'De 2 000 à 3 499 euros' ; 4 = 'De 3 500 à 4 999 euros' ; 5 = '5 000 euros et plus'",
-            "Y6INTPOLST": "1 = 'Beaucoup' ; 2 = 'Un peu' ; 3 = 'Pas vraiment' ; 4 = 'Pas du tout'",
-            "Y6Q7ST": "1 = 'Très à gauche' ; 2 = 'Plutôt à gauche' ; 3 = 'Au centre' ; 4 = 'Plutôt à droite' ; 5 = 'Très à droite'",
-            "Y6PROXST": "1 = 'Très à gauche (Lutte Ouvrière, Nouveau Parti Anticapitaliste, Parti Communiste Français, France Insoumise)' ; 2 = 'Gauche (Parti Socialiste, Europe Ecologie - Les Verts)' ; 3 = 'Centre (Renaissance, Le MoDem (Mouvement Démocrate), Horizons, UDI (Union des Démocrates et Indépendants))' ; 4 = 'Droite (Les Républicains)' ; 5 = 'Très à droite (Debout la France, Rassemblement national (ex Front National), Reconquête!)' ; 6 = 'Autre parti ou aucun parti'"
-        }
-        # définir le texte complet à afficher (avec parties fixes et variables en fonction du choix effectué)
-        m = ui.modal(
-            "La variable '%s' correspond à ou est calculée à partir de la question suivante posée aux répondants : \
-            '%s', \
-            et ses modalités de réponse (inchangées par rapport au questionnaire ou regroupées pour les présents graphiques) sont : \
-            %s." % (
-                dico_nom_var.get("%s" % input.Select_VarSD_Enj()),
-                dico_question_var.get("%s" % input.Select_VarSD_Enj()),
-                dico_modalite_var.get("%s" % input.Select_VarSD_Enj())
-            ),
-            title="Informations complémentaires sur la variable socio-démographique choisie :",
-            easy_close=False
-        )
-        ui.modal_show(m)
+    _show_varsd_info(input.Show_VarSD_Enj_Info, input.Select_VarSD_Enj)
 
     # graphique
     @output
@@ -2118,7 +2901,7 @@ def server(input, output, session):
         df_pivot = df_pivot.reindex(columns=ordre_modalites)
         # créer une palette de couleurs automatique
         nb_couleurs = len(df_pivot.index)
-        palette = px.colors.qualitative.Plotly[:nb_couleurs]
+        palette = pc.qualitative.Plotly[:nb_couleurs]
         # créer le graphique
         fig = go.Figure()
         # ajouter les données 
@@ -2132,14 +2915,7 @@ def server(input, output, session):
                     # afficher les valeurs sous le format 'xx.x%' dans la bulle qui s'affiche
                     # au survol de la courbe par la souris, et supprimer toutes les autres
                     # informations qui pourraient s'afficher en plus (nom de la modalité)
-                    hovertemplate='%{y:.1f}%<extra></extra>',
-                    # n'afficher la bulle contenant la valeur 'y' en % uniquement
-                    # au-dessus de la barre verticale survolée par la souris
-                    hoverinfo='y',
-                    # centrer ce texte 'y' dans la bulle
-                    hoverlabel=dict(
-                        align='auto'
-                    )
+                    hovertemplate='%{y:.1f}%<extra></extra>'
                 )
             )
         # mettre en forme le graphique
@@ -2309,14 +3085,7 @@ def server(input, output, session):
                 # afficher les valeurs sous le format 'xx.x%' dans la bulle qui s'affiche
                 # au survol de la courbe par la souris, et supprimer toutes les autres
                 # informations qui pourraient s'afficher en plus (nom de la modalité)
-                hovertemplate='%{y:.1f}%<extra></extra>',
-                # n'afficher la bulle contenant la valeur 'y' en % uniquement
-                # au-dessus de la barre verticale survolée par la souris
-                hoverinfo='y',
-                # centrer ce texte 'y' dans la bulle
-                hoverlabel=dict(
-                    align='auto'
-                )
+                hovertemplate='%{y:.1f}%<extra></extra>'
             )
         )
         # créer le texte de la légende (correspondance entre les étiquettes courtes et les étiquettes longues)
@@ -2484,14 +3253,7 @@ def server(input, output, session):
                 # afficher les valeurs sous le format 'xx.x%' dans la bulle qui s'affiche
                 # au survol de la courbe par la souris, et supprimer toutes les autres
                 # informations qui pourraient s'afficher en plus (nom de la modalité)
-                hovertemplate='%{y:.1f}%<extra></extra>',
-                # n'afficher la bulle contenant la valeur 'y' en % uniquement
-                # au-dessus de la barre verticale survolée par la souris
-                hoverinfo='y',
-                # centrer ce texte 'y' dans la bulle
-                hoverlabel=dict(
-                    align='auto'
-                )
+                hovertemplate='%{y:.1f}%<extra></extra>'
             )
         )
         # mettre en forme le graphique
@@ -2582,71 +3344,7 @@ def server(input, output, session):
         ui.modal_show(m)
 
     # bouton 03 : afficher la description de la variable socio-démographique choisie
-    # avec plusieurs parties de texte qui dépendent de ce choix (via des dictionnaires)
-    @reactive.effect
-    @reactive.event(input.Show_VarSD_Part_Info_Legis_T1)
-    def _():
-        # définir le nom de la variable socio-démographique choisie
-        dico_nom_var = {
-            "Y7SEXEST": "Genre",
-            "Y7AGERST": "Âge",
-            "Y7REG13ST": "Région",
-            "Y7AGGLO5ST": "Taille d'agglomération",
-            "Y7EMPST": "Type d'emploi occupé",
-            "Y7PCSIST": "Catégorie professionnelle",
-            "Y7EDUST": "Niveau de scolarité atteint",
-            "Y7REL1ST": "Religion",
-            "Y7ECO2ST2": "Revenu mensuel du foyer",
-            "Y7INTPOLST": "Intérêt pour la politique",
-            "Y7Q7ST": "Positionnement idéologique",
-            "Y7PROXST": "Préférence partisane"
-        }
-        # définir la question de l'enquête associée à la variable socio-démographique choisie
-        dico_question_var = {
-            "Y7SEXEST": "Êtes-vous ?",
-            "Y7AGERST": "Quelle est votre date de naissance ?",
-            "Y7REG13ST": "Veuillez indiquer le département et la commune où vous résidez.",
-            "Y7AGGLO5ST": "Veuillez indiquer le département et la commune où vous résidez.",
-            "Y7EMPST": "Quelle est votre situation professionnelle actuelle ?",
-            "Y7PCSIST": "Quelle est votre situation professionnelle actuelle ?",
-            "Y7EDUST": "Choisissez votre niveau de scolarité le plus élevé.",
-            "Y7REL1ST": "Quelle est votre religion, si vous en avez une ?",
-            "Y7ECO2ST2": " Pour finir, nous avons besoin de connaître, à des fins statistiques uniquement, la tranche dans laquelle se situe le revenu MENSUEL NET de votre FOYER après déduction des impôts sur le revenu (veuillez considérer toutes vos sources de revenus: salaires, bourses, prestations retraite et sécurité sociale, dividendes, revenus immobiliers, pensions alimentaires etc.).",
-            "Y7INTPOLST": "De manière générale, diriez-vous que vous vous intéressez à la politique ?",
-            "Y7Q7ST": "Sur une échelle de 0 à 10, où 0 correspond à la gauche et 10 correspond à la droite, où diriez-vous que vous vous situez ?",
-            "Y7PROXST": "De quel parti vous sentez-vous proche ou moins éloigné que les autres ?"
-        }
-        # définir les modalités de réponse à la question de l'enquête associée à la variable socio-démographique choisie
-        dico_modalite_var = {
-            "Y7SEXEST": "1 = 'Homme' ; 2 = 'Femme'",
-            "Y7AGERST": "1 = '18 à 24 ans' ; 2 = '25 à 34 ans' ; 3 = '35 à 49 ans' ; 4 = '50 à 59 ans' ; 5 = '60 ans et plus'",
-            "Y7REG13ST": "1 = 'Ile de France' ; 2 = 'Nord et Est (Hauts de France, Grand Est et Bourgogne Franche Comté)' ; 3 = 'Ouest (Normandie, Bretagne, Pays de la Loire et Centre Val de Loire)' ; 4 = 'Sud ouest (Nouvelle Aquitaine et Occitanie)' ; 5 = 'Sud est (Auvergne Rhône Alpes, Provence Alpes Côte d'Azur et Corse)'",
-            "Y7AGGLO5ST": "1 = 'Zone rurale (moins de 2 000 habitants)' ; 2 = 'Zone urbaine de 2 000 à 9 999 habitants' ; 3 = 'Zone urbaine de 10 000 à 49 999 habitants' ; 4 = 'Zone urbaine de 50 000 à 199 999 habitants' ; 5 = 'Zone urbaine de 200 000 habitants et plus'",
-            "Y7EMPST": "1 = 'Salarié (salarié à plein temps ou à temps partiel)' ; 2 = 'Indépendant (travaille à mon compte)' ; 3 = 'Sans emploi (ne travaille pas actuellement tout en recherchant un emploi ou non, personne au foyer, retraité, étudiant ou élève)'",
-            "Y7PCSIST": "1 = 'Agriculteur exploitant, artisan, commerçant, chef d entreprise' ; 2 = 'Cadre supérieur' ; 3 = 'Profession intermédiaire' ; 4 = 'Employé' ; 5 = 'Ouvrier' ; 6 = 'Retraité, inactif'",
-            "Y7EDUST": "1 = 'Aucun diplôme' ; 2 = 'CAP, BEP' ; 3 = 'Baccalauréat' ; 4 = 'Bac +2' ; 5 = 'Bac +3 et plus'",
-            "Y7REL1ST": "1 = 'Catholique' ; 2 = 'Juive' ; 3 = 'Musulmane' ; 4 = 'Autre religion (protestante, boudhiste ou autre)' ; 5 = 'Sans religion'",
-            "Y7ECO2ST2": "1 = 'Moins de 1 250 euros' ; 2 = 'De 1 250 euros à 1 999 euros' ; 3 = 'De 2 000 à 3 499 euros' ; 4 = 'De 3 500 à 4 999 euros' ; 5 = '5 000 euros et plus'",
-            "Y7INTPOLST": "1 = 'Beaucoup' ; 2 = 'Un peu' ; 3 = 'Pas vraiment' ; 4 = 'Pas du tout'",
-            "Y7Q7ST": "1 = 'Très à gauche' ; 2 = 'Plutôt à gauche' ; 3 = 'Au centre' ; 4 = 'Plutôt à droite' ; 5 = 'Très à droite'",
-            "Y7PROXST": "1 = 'Extême gauche (Lutte Ouvrière, Nouveau Parti Anticapitaliste, Parti Communiste Français, France Insoumise)' ; 2 = 'Gauche (Parti Socialiste, Europe Ecologie - Les Verts)' ; 3 = 'Centre (Renaissance, Le MoDem (Mouvement Démocrate), Horizons, UDI (Union des Démocrates et Indépendants))' ; 4 = 'Droite (Les Républicains)' ; 5 = 'Très à droite (Debout la France, Rassemblement national (ex Front National), Reconquête!)' ; 6 = 'Autre parti ou aucun parti'"
-        }
-        # définir le texte complet à afficher (avec parties fixes et variables en fonction du choix effectué)
-        m = ui.modal(
-            "La variable '%s' correspond à ou est calculée à partir de la question suivante posée aux répondants : \
-            '%s', \
-            et ses modalités de réponse (inchangées par rapport au questionnaire ou regroupées pour les présents graphiques) sont : \
-            %s." % (
-                dico_nom_var.get(
-                    "%s" % input.Select_VarSD_Part_Legis_T1()
-                ),
-                dico_question_var.get("%s" % input.Select_VarSD_Part_Legis_T1()),
-                dico_modalite_var.get("%s" % input.Select_VarSD_Part_Legis_T1())
-            ),
-            title="Informations complémentaires sur la variable socio-démographique choisie :",
-            easy_close=False
-        )
-        ui.modal_show(m)
+    _show_varsd_info(input.Show_VarSD_Part_Info_Legis_T1, input.Select_VarSD_Part_Legis_T1)
 
     # graphique
     @output
@@ -2864,7 +3562,7 @@ def server(input, output, session):
         df_pivot = df_pivot.reindex(columns=ordre_modalites)
         # créer une palette de couleurs automatique
         nb_couleurs = len(df_pivot.index)
-        palette = px.colors.qualitative.Plotly[:nb_couleurs]
+        palette = pc.qualitative.Plotly[:nb_couleurs]
         # créer le graphique
         fig = go.Figure()
         # ajouter les données
@@ -2878,14 +3576,7 @@ def server(input, output, session):
                     # afficher les valeurs sous le format 'xx.x%' dans la bulle qui s'affiche
                     # au survol de la courbe par la souris, et supprimer toutes les autres
                     # informations qui pourraient s'afficher en plus (nom de la modalité)
-                    hovertemplate='%{y:.1f}%<extra></extra>',
-                    # n'afficher la bulle contenant la valeur 'y' en % uniquement
-                    # au-dessus de la barre verticale survolée par la souris
-                    hoverinfo='y',
-                    # centrer ce texte 'y' dans la bulle
-                    hoverlabel=dict(
-                        align='auto'
-                    )
+                    hovertemplate='%{y:.1f}%<extra></extra>'
                 )
             )
          # mettre en forme le graphique
@@ -2964,154 +3655,20 @@ def server(input, output, session):
     @reactive.effect
     @reactive.event(input.Show_CAND_Question_Legis_T1)
     def _():
-        m = ui.modal(
-            "La question posée aux répondants est la suivante : 'Pour quel candidat avez-vous voté au premier tour des élections législatives dans votre circonscription ?'",
-            title="Informations complémentaires sur la question contenue dans l'enquête :",
-            easy_close=False
-        )
-        ui.modal_show(m)
+        ui.modal_show(_MODAL_CAND_QUESTION_LEGIS_T1)
 
     # bouton 02 : décrire la variable
     @reactive.effect
     @reactive.event(input.Show_CAND_Info_Legis_T1)
     def _():
-        m = ui.modal(
-            "La variable sur la couleur politique du candidat ayant reçu le vote du répondant contient à l'origine 12 modalités. \
-            La variable du vote en faveur de la couleur politique du candidat présentée ici sur les graphiques est simplifiée : \
-            seules les 4 couleurs politiques ayant récolté le plus de suffrages sont retenues. \
-            Ainsi, les modalités de réponse synthétiques retenues pour cette variable sont les suivantes : \
-            1 = 'Rassemblement national (RN)', \
-            2 = 'Nouveau Front Populaire (NFP)', \
-            3 = 'Ensemble', \
-            4 = 'Les Républicains (LR) / Divers Droite (DVD)'.",
-            title="Informations complémentaires sur la variable choisie pour les graphiques :",
-            easy_close=False
-        )
-        ui.modal_show(m)
+        ui.modal_show(_MODAL_CAND_INFO_LEGIS_T1)
 
     # graphique
     @output
     @render_plotly
     def Graph_Cand_Legis_T1():
-        # importer les données
-        csvfile = "data/T_w7_leg24axst.csv"
-        data = pd.read_csv(csvfile)
-        # supprimer la première colonne (vide) de la base de donnée
-        data = data.drop(
-            data.columns[0],
-            axis=1
-        )
-        # identifier les étiquettes courtes (chiffres démarrant à 1)
-        data['ETIQCOURTE'] = data.index + 1
-        etiquettes_courtes = data["ETIQCOURTE"]
-        # identifier les étiquettes longues (modalités de la variable dans la table lue)
-        etiquettes_longues = data["LEG24AXST"]
-        # créer la figure en mémoire
-        fig = go.Figure()
-        # créer la liste des couleurs en fonction du nombre de modalités
-        couleurs_cl = cl.scales[str(max(3, len(data["LEG24AXST"])))]['qual']['Set1']
-        # ajouter les données
-        fig.add_trace(
-            go.Bar(
-                # on représente la colonne des étiquettes courtes (et non la variable elle-même, car
-                # cette colonne correspond aux étiquettes longues de la légende)
-                x=data["ETIQCOURTE"],
-                y=data["pct"],
-                # changer de couleur en fonction de la modalité de réponse
-                marker_color=couleurs_cl,
-                # afficher les valeurs sous le format 'xx.x%' dans la bulle qui s'affiche
-                # au survol de la courbe par la souris, et supprimer toutes les autres
-                # informations qui pourraient s'afficher en plus (nom de la modalité)
-                hovertemplate='%{y:.1f}%<extra></extra>',
-                # n'afficher la bulle contenant la valeur 'y' en % uniquement
-                # au-dessus de la barre verticale survolée par la souris
-                hoverinfo='y',
-                # centrer ce texte 'y' dans la bulle
-                hoverlabel=dict(
-                    align='auto'
-                )
-            )
-        )
-        # créer le texte de la légende (correspondance entre les étiquettes courtes et les étiquettes longues)
-        legende_text = "<br>".join([f"{lettre}: {etiquette}" for lettre, etiquette in zip(etiquettes_courtes, etiquettes_longues)])
-        # mettre en forme le graphique
-        fig.update_layout(
-            # définir le titre du graphique et son apparence
-            title={
-                'text': "Vote en faveur des candidats (couleurs politiques)",
-                'y':0.98,
-                'x':0.01,
-                'xanchor': 'left',
-                'yanchor': 'top'
-            },
-            # définir le titre de l'axe des ordonnées et son apparence
-            yaxis_title=dict(
-                text='Pourcentage de répondants (%)',
-                font_size=12
-            ),
-            # définir l'affichage séparé des valeurs de % affichées au-dessus de
-            # chaque barre verticale quand la souris la survole
-            hovermode="closest",
-            # définir le thème général de l'apparence du graphique
-            template="plotly_white",
-            # définir deux annotations
-            annotations=[
-                # sources des données
-                dict(
-                    xref='paper', # utiliser la largeur totale du graphique comme référence
-                    yref='paper', # utiliser la hauteur totale du graphique comme référence
-                    x=0.5, # placer le point d'ancrage au milieu de la largeur
-                    y=-0.1, # valeur à ajuster pour positionner verticalement le texte sous le graphique
-                    xanchor='center', # centrer le texte par rapport au point d'ancrage
-                    yanchor='top',
-                    text=
-                        'Enquête électorale française pour les ' +
-                        'élections européennes de juin 2024, ' +
-                        'par Ipsos Sopra Steria, Cevipof, ' +
-                        'Le Monde, Fondation Jean Jaurès et ' +
-                        'Institut Montaigne (2024)',
-                    font=dict(
-                        size=10,
-                        color='grey'
-                    ),
-                    showarrow=False
-                ),
-                # légende personnalisée
-                dict(
-                    valign="top", # aligner le texte en haut de chaque marqueur de la légende
-                    x=0.75, # position horizontale de la légende (1 = à droite du graphique)
-                    y=1.00, # position verticale de la légende (1 = en haut)
-                    xref='paper',
-                    yref='paper',
-                    xanchor='left', # ancrer la légende à gauche de sa position x
-                    yanchor='top', # ancrer la légende en haut de sa position y
-                    text=f"<b>Légende :</b><br>{legende_text}",
-                    showarrow=False,
-                    font=dict(size=12),
-                    align='left',
-                    bgcolor='rgba(255,255,255,0.8)', # fond légèrement transparent
-                )
-            ],
-            # définir les marges de la zone graphique
-            # (augmentées à droite pour le cadre fixe de la légende)
-            margin=dict(
-                b=50, # b = bottom
-                t=50,  # t = top
-                l=50, # l = left
-                r=200 # r = right
-            )
-        )
-        # configurer l'axe des abscisses pour n'afficher que des nombres entiers
-        fig.update_xaxes(
-            tickmode='linear',
-            tick0=1,
-            dtick=1,
-            tickfont=dict(size=12),
-            tickangle=0
-        )
-
-        # retourner le graphique
-        return fig
+        # retourner le graphique mémorisé (construit lors du premier affichage)
+        return _fig_cand_legis(_CSV_CAND_LEGIS_T1, "LEG24AXST")
 
 
     ########################################
@@ -3121,9 +3678,141 @@ def server(input, output, session):
     # bouton 01 : décrire la question posée dans l'enquête
     @reactive.effect
     @reactive.event(input.Show_PART_Question_Legis_T2)
+    def _():
+        ui.modal_show(_MODAL_PART_QUESTION_LEGIS_T2)
+
+    # bouton 02 : décrire la variable de l'intention d'aller voter choisie
+    @reactive.effect
+    @reactive.event(input.Show_PARTST_Info_Legis_T2)
+    def _():
+        ui.modal_show(_MODAL_PARTST_INFO_LEGIS_T2)
+
+    # bouton 03 : afficher la description de la variable socio-démographique choisie
+    _show_varsd_info(input.Show_VarSD_Part_Info_Legis_T2, input.Select_VarSD_Part_Legis_T2)
+
+    # tableau croisé des données du graphique, recalculé uniquement lorsque la
+    # variable socio-démographique choisie change (et non à chaque nouvel affichage)
+    @reactive.calc
+    def Pivot_Croise_Part_Legis_T2():
+        return _load_pivot_part_legis_t2(input.Select_VarSD_Part_Legis_T2())
+
+    # graphique
+    @output
+    @render_plotly
+    def Graph_Croise_Part_Legis_T2():
+        # créer et retourner le graphique à partir du tableau croisé mémorisé des données
+        return _fig_croise(
+            Pivot_Croise_Part_Legis_T2(),
+            _ORDRE_PART_LEGIS_T2,
+            "Participation au vote",
+            input.Select_VarSD_Part_Legis_T2()
+        )
+
+
+    ########################################################################
+    # onglet 04 : VOTE POUR LES CANDIDATS (couleurs politiques) (2e tour)  #
+    ########################################################################
+
+    # bouton 01 : décrire la question posée dans l'enquête
+    @reactive.effect
+    @reactive.event(input.Show_CAND_Question_Legis_T2)
+    def _():
+        ui.modal_show(_MODAL_CAND_QUESTION_LEGIS_T2)
+
+    # bouton 02 : décrire la variable
+    @reactive.effect
+    @reactive.event(input.Show_CAND_Info_Legis_T2)
+    def _():
+        ui.modal_show(_MODAL_CAND_INFO_LEGIS_T2)
+
+    # graphique
+    @output
+    @render_plotly
+    def Graph_Cand_Legis_T2():
+        # retourner le graphique mémorisé (construit lors du premier affichage)
+        return _fig_cand_legis(_CSV_CAND_LEGIS_T2, "LEG24BXST")
+
+
+    #####################################################################
+    # onglet 05 : SENTIMENTS PERSONNELS SUR LES RESULTATS DE L'ELECTION #
+    #####################################################################
+
+    # bouton 01 : décrire la question posée dans l'enquête
+    @reactive.effect
+    @reactive.event(input.Show_SENTRES_Question_Legis_T2)
+    def _():
+        ui.modal_show(_MODAL_SENTRES_QUESTION_LEGIS_T2)
+
+    # bouton 02 : décrire la variable de l'intention d'aller voter choisie
+    @reactive.effect
+    @reactive.event(input.Show_SENTRESST_Info_Legis_T2)
+    def _():
+        ui.modal_show(_MODAL_SENTRESST_INFO_LEGIS_T2)
+
+    # bouton 03 : afficher la description de la variable socio-démographique choisie
+    _show_varsd_info(input.Show_VarSD_SentRes_Info_Legis_T2, input.Select_VarSD_SentRes_Legis_T2)
+
+    # graphique
+    @output
+    @render_plotly
+    def Graph_Croise_SentRes_Legis_T2():
+        # récupérer le tableau croisé préchargé des données
+        var_sd = input.Select_VarSD_SentRes_Legis_T2()
+        df_pivot = _PIVOTS_SENTRES_LEGIS_T2[var_sd]
+        # créer et retourner le graphique
+        return _fig_croise(
+            df_pivot,
+            _ORDRE_SENTRES_LEGIS_T2,
+            "Sentiment personnel sur les résultats des élections",
+            var_sd
+        )
+
+
+    #######################################################
+    # onglet 06 : AVIS SUR LE FRONT REPUBLICAIN (2e tour) #
+    #######################################################
+
+    # bouton 01 : décrire la question posée dans l'enquête
+    @reactive.effect
+    @reactive.event(input.Show_AVFR_Question_Legis_T2)
+    def _():
+        ui.modal_show(_MODAL_AVFR_QUESTION_LEGIS_T2)
+
+    # bouton 02 : décrire la variable de l'intention d'aller voter choisie
+    @reactive.effect
+    @reactive.event(input.Show_AVFRST_Info_Legis_T2)
+    def _():
+        ui.modal_show(_MODAL_AVFRST_INFO_LEGIS_T2)
+
+    # bouton 03 : afficher la description de la variable socio-démographique choisie
+    _show_varsd_info(input.Show_VarSD_AvFr_Info_Legis_T2, input.Select_VarSD_AvFr_Legis_T2)
+
+    # graphique
+    @output
+    @render_plotly
+    def Graph_Croise_AvFr_Legis_T2():
+        # récupérer le tableau croisé préchargé des données
+        var_sd = input.Select_VarSD_AvFr_Legis_T2()
+        df_pivot = _PIVOTS_AVFR_LEGIS_T2[var_sd]
+        # créer et retourner le graphique
+        return _fig_croise(
+            df_pivot,
+            _ORDRE_AVFR_LEGIS_T2,
+            "Avis sur le front républicain",
+            var_sd
+        )
+
+
+    ###############################################
+    # onglet 07 : ACCORD DE VUES AVEC L'ENTOURAGE #
+    ###############################################
+
+    # bouton 01 : décrire la question posée dans l'enquête
+    @reactive.effect
+    @reactive.event(input.Show_ACCVUES_Question_Legis_T2)
     def _():
         m = ui.modal(
-            "La question posée aux répondants est la suivante : 'Un électeur sur trois n’a pas voté au second tour des élections législatives le 7 juillet 2024. Dans votre cas personnel, qu’est ce qui correspond le mieux à votre attitude à cette occasion ?'",
+            "La question posée aux répondants est la suivante : 'À l’occasion de ces élections législatives, avez-vous eu de profonds désaccords ou des discussions animées avec des gens de votre entourage ?'",
             title="Informations complémentaires sur la question contenue dans l'enquête :",
             easy_close=False
         )
@@ -3131,2553 +3820,101 @@ def server(input, output, session):
 
     # bouton 02 : décrire la variable de l'intention d'aller voter choisie
     @reactive.effect
-    @reactive.event(input.Show_PARTST_Info_Legis_T2)
+    @reactive.event(input.Show_ACCVUESST_Info_Legis_T2)
     def _():
         m = ui.modal(
-            "La variable sur la participation aux élections législatives présentée ici sur les graphiques est une modalité synthétique de la question posée aux répondants de l'enquête. \
-            Ainsi, à partir des quatre modalités de réponse à la question de l'enquête, on en construit deux : 'Vous avez voté' ou 'Vous n'avez pas voté'.",
+            "La variable sur l'accord des points de vue des répondants avec leur entourage à l'occasion des élections législatives présentée ici sur les graphiques est une modalité synthétique de la question posée aux répondants de l'enquête. \
+            Ainsi, à partir des quatre modalités de réponse à la question de l'enquête, on en construit deux : 'Souvent (très souvent ou assez souvent)' ou 'Rarement ou jamais'.",
             title="Informations complémentaires sur la variable choisie pour les graphiques :",
             easy_close=False
         )
         ui.modal_show(m)
 
     # bouton 03 : afficher la description de la variable socio-démographique choisie
-    # avec plusieurs parties de texte qui dépendent de ce choix (via des dictionnaires)
+    _show_varsd_info(input.Show_VarSD_AccVues_Info_Legis_T2, input.Select_VarSD_AccVues_Legis_T2)
+
+    # graphique
+    @output
+    @render_plotly
+    def Graph_Croise_AccVues_Legis_T2():
+        # récupérer le graphique mémorisé pour la variable socio-démographique choisie
+        return _fig_croise_accvues_legis_t2(input.Select_VarSD_AccVues_Legis_T2())
+
+
+    ###########################################################
+    # onglet 08 : AVIS SUR LES CONSEQUENCES DE LA DISSOLUTION #
+    ###########################################################
+
+    # bouton 01 : décrire la question posée dans l'enquête
     @reactive.effect
-    @reactive.event(input.Show_VarSD_Part_Info_Legis_T2)
+    @reactive.event(input.Show_AVCONSDISS_Question_Legis_T2)
     def _():
-        # définir le nom de la variable socio-démographique choisie
-        dico_nom_var = {
-            "Y7SEXEST": "Genre",
-            "Y7AGERST": "Âge",
-            "Y7REG13ST": "Région",
-            "Y7AGGLO5ST": "Taille d'agglomération",
-            "Y7EMPST": "Type d'emploi occupé",
-            "Y7PCSIST": "Catégorie professionnelle",
-            "Y7EDUST": "Niveau de scolarité atteint",
-            "Y7REL1ST": "Religion",
-            "Y7ECO2ST2": "Revenu mensuel du foyer",
-            "Y7INTPOLST": "Intérêt pour la politique",
-            "Y7Q7ST": "Positionnement idéologique",
-            "Y7PROXST": "Préférence partisane"
-        }
-        # définir la question de l'enquête associée à la variable socio-démographique choisie
-        dico_question_var = {
-            "Y7SEXEST": "Êtes-vous ?",
-            "Y7AGERST": "Quelle est votre date de naissance ?",
-            "Y7REG13ST": "Veuillez indiquer le département et la commune où vous résidez.",
-            "Y7AGGLO5ST": "Veuillez indiquer le département et la commune où vous résidez.",
-            "Y7EMPST": "Quelle est votre situation professionnelle actuelle ?",
-            "Y7PCSIST": "Quelle est votre situation professionnelle actuelle ?",
-            "Y7EDUST": "Choisissez votre niveau de scolarité le plus élevé.",
-            "Y7REL1ST": "Quelle est votre religion, si vous en avez une ?",
-            "Y7ECO2ST2": " Pour finir, nous avons besoin de connaître, à des fins statistiques uniquement, la tranche dans laquelle se situe le revenu MENSUEL NET de votre FOYER après déduction des impôts sur le revenu (veuillez considérer toutes vos sources de revenus: salaires, bourses, prestations retraite et sécurité sociale, dividendes, revenus immobiliers, pensions alimentaires etc.).",
-            "Y7INTPOLST": "De manière générale, diriez-vous que vous vous intéressez à la politique ?",
-            "Y7Q7ST": "Sur une échelle de 0 à 10, où 0 correspond à la gauche et 10 correspond à la droite, où diriez-vous que vous vous situez ?",
-            "Y7PROXST": "De quel parti vous sentez-vous proche ou moins éloigné que les autres ?"
-        }
-        # définir les modalités de réponse à la question de l'enquête associée à la variable socio-démographique choisie
-        dico_modalite_var = {
-            "Y7SEXEST": "1 = 'Homme' ; 2 = 'Femme'",
-            "Y7AGERST": "1 = '18 à 24 ans' ; 2 = '25 à 34 ans' ; 3 = '35 à 49 ans' ; 4 = '50 à 59 ans' ; 5 = '60 ans et plus'",
-            "Y7REG13ST": "1 = 'Ile de France' ; 2 = 'Nord et Est (Hauts de France, Grand Est et Bourgogne Franche Comté)' ; 3 = 'Ouest (Normandie, Bretagne, Pays de la Loire et Centre Val de Loire)' ; 4 = 'Sud ouest (Nouvelle Aquitaine et Occitanie)' ; 5 = 'Sud est (Auvergne Rhône Alpes, Provence Alpes Côte d'Azur et Corse)'",
-            "Y7AGGLO5ST": "1 = 'Zone rurale (moins de 2 000 habitants)' ; 2 = 'Zone urbaine de 2 000 à 9 999 habitants' ; 3 = 'Zone urbaine de 10 000 à 49 999 habitants' ; 4 = 'Zone urbaine de 50 000 à 199 999 habitants' ; 5 = 'Zone urbaine de 200 000 habitants et plus'",
-            "Y7EMPST": "1 = 'Salarié (salarié à plein temps ou à temps partiel)' ; 2 = 'Indépendant (travaille à mon compte)' ; 3 = 'Sans emploi (ne travaille pas actuellement tout en recherchant un emploi ou non, personne au foyer, retraité, étudiant ou élève)'",
-            "Y7PCSIST": "1 = 'Agriculteur exploitant, artisan, commerçant, chef d entreprise' ; 2 = 'Cadre supérieur' ; 3 = 'Profession intermédiaire' ; 4 = 'Employé' ; 5 = 'Ouvrier' ; 6 = 'Retraité, inactif'",
-            "Y7EDUST": "1 = 'Aucun diplôme' ; 2 = 'CAP, BEP' ; 3 = 'Baccalauréat' ; 4 = 'Bac +2' ; 5 = 'Bac +3 et plus'",
-            "Y7REL1ST": "1 = 'Catholique' ; 2 = 'Juive' ; 3 = 'Musulmane' ; 4 = 'Autre religion (protestante, boudhiste ou autre)' ; 5 = 'Sans religion'",
-            "Y7ECO2ST2": "1 = 'Moins de 1 250 euros' ; 2 = 'De 1 250 euros à 1 999 euros' ; 3 = 'De 2 000 à 3 499 euros' ; 4 = 'De 3 500 à 4 999 euros' ; 5 = '5 000 euros et plus'",
-            "Y7INTPOLST": "1 = 'Beaucoup' ; 2 = 'Un peu' ; 3 = 'Pas vraiment' ; 4 = 'Pas du tout'",
-            "Y7Q7ST": "1 = 'Très à gauche' ; 2 = 'Plutôt à gauche' ; 3 = 'Au centre' ; 4 = 'Plutôt à droite' ; 5 = 'Très à droite'",
-            "Y7PROXST": "1 = 'Extême gauche (Lutte Ouvrière, Nouveau Parti Anticapitaliste, Parti Communiste Français, France Insoumise)' ; 2 = 'Gauche (Parti Socialiste, Europe Ecologie - Les Verts)' ; 3 = 'Centre (Renaissance, Le MoDem (Mouvement Démocrate), Horizons, UDI (Union des Démocrates et Indépendants))' ; 4 = 'Droite (Les Républicains)' ; 5 = 'Très à droite (Debout la France, Rassemblement national (ex Front National), Reconquête!)' ; 6 = 'Autre parti ou aucun parti'"
-        }
-        # définir le texte complet à afficher (avec parties fixes et variables en fonction du choix effectué)
-        m = ui.modal(
-            "La variable '%s' correspond à ou est calculée à partir de la question suivante posée aux répondants : \
-            '%s', \
-            et ses modalités de réponse (inchangées par rapport au questionnaire ou regroupées pour les présents graphiques) sont : \
-            %s." % (
-                dico_nom_var.get(
-                    "%s" % input.Select_VarSD_Part_Legis_T2()
-                ),
-                dico_question_var.get("%s" % input.Select_VarSD_Part_Legis_T2()),
-                dico_modalite_var.get("%s" % input.Select_VarSD_Part_Legis_T2())
-            ),
-            title="Informations complémentaires sur la variable socio-démographique choisie :",
-            easy_close=False
-        )
-        ui.modal_show(m)
-
-    # graphique
-    @output
-    @render_plotly
-    def Graph_Croise_Part_Legis_T2():
-        # définir la partie variable du titre
-        dico_titre = {
-            "Y7SEXEST": "du genre",
-            "Y7AGERST": "de l'âge",
-            "Y7REG13ST": "de la région de résidence",
-            "Y7AGGLO5ST": "de la taille de l'agglomération de résidence",
-            "Y7EMPST": "du type d'emploi occupé",
-            "Y7PCSIST": "de la catégorie socio-professionnelle",
-            "Y7EDUST": "du niveau de scolarité atteint",
-            "Y7REL1ST": "de la religion",
-            "Y7ECO2ST2": "du revenu mensuel du foyer",
-            "Y7INTPOLST": "de l'intérêt pour la politique",
-            "Y7Q7ST": "du positionnement idéologique",
-            "Y7PROXST": "de la préférence partisane"
-        }
-        # définir la partie variable du titre de la légende
-        dico_legende = {
-            "Y7SEXEST": "Genre",
-            "Y7AGERST": "Âge",
-            "Y7REG13ST": "Région",
-            "Y7AGGLO5ST": "Taille d'agglomération",
-            "Y7EMPST": "Type d'emploi occupé",
-            "Y7PCSIST": "Catégorie professionnelle",
-            "Y7EDUST": "Niveau de scolarité atteint",
-            "Y7REL1ST": "Religion",
-            "Y7ECO2ST2": "Revenu mensuel du foyer",
-            "Y7INTPOLST": "Intérêt pour la politique",
-            "Y7Q7ST": "Positionnement idéologique",
-            "Y7PROXST": "Préférence partisane"
-        }
-        # définir l'échelle de l'axe des ordonnées en fonction des
-        # valeurs prises par la variable socio-démographique choisie
-        dico_echelleY = {
-            "Y7SEXEST": [10, 40],
-            "Y7AGERST": [10, 45],
-            "Y7REG13ST": [15, 35],
-            "Y7AGGLO5ST": [15, 35],
-            "Y7EMPST": [15, 40],
-            "Y7PCSIST": [10, 45],
-            "Y7EDUST": [15, 40],
-            "Y7REL1ST": [10, 45],
-            "Y7ECO2ST2": [10, 45],
-            "Y7INTPOLST": [0, 75],
-            "Y7Q7ST": [5, 40],
-            "Y7PROXST": [5, 55],
-        }
-        # définir les modalités des variables socio-démo et leur ordre
-        dico_modalite_var = {
-            "Y7SEXEST": "1 = 'Homme' ; 2 = 'Femme'",
-            "Y7AGERST": "1 = '18 à 24 ans' ; 2 = '25 à 34 ans' ; 3 = '35 à 49 ans' ; 4 = '50 à 59 ans' ; 5 = '60 ans et plus'",
-            "Y7REG13ST": "1 = 'Ile de France' ; 2 = 'Nord et Est (Hauts de France, Grand Est et Bourgogne Franche Comté)' ; 3 = 'Ouest (Normandie, Bretagne, Pays de la Loire et Centre Val de Loire)' ; 4 = 'Sud ouest (Nouvelle Aquitaine et Occitanie)' ; 5 = 'Sud est (Auvergne Rhône Alpes, Provence Alpes Côte d'Azur et Corse)'",
-            "Y7AGGLO5ST": "1 = 'Zone rurale (moins de 2 000 habitants)' ; 2 = 'Zone urbaine de 2 000 à 9 999 habitants' ; 3 = 'Zone urbaine de 10 000 à 49 999 habitants' ; 4 = 'Zone urbaine de 50 000 à 199 999 habitants' ; 5 = 'Zone urbaine de 200 000 habitants et plus'",
-            "Y7EMPST": "1 = 'Salarié (salarié à plein temps ou à temps partiel)' ; 2 = 'Indépendant (travaille à mon compte)' ; 3 = 'Sans emploi (ne travaille pas actuellement tout en recherchant un emploi ou non, personne au foyer, retraité, étudiant ou élève)'",
-            "Y7PCSIST": "1 = 'Agriculteur exploitant, artisan, commerçant, chef d entreprise' ; 2 = 'Cadre supérieur' ; 3 = 'Profession intermédiaire' ; 4 = 'Employé' ; 5 = 'Ouvrier' ; 6 = 'Retraité, inactif'",
-            "Y7EDUST": "1 = 'Aucun diplôme' ; 2 = 'CAP, BEP' ; 3 = 'Baccalauréat' ; 4 = 'Bac +2' ; 5 = 'Bac +3 et plus'",
-            "Y7REL1ST": "1 = 'Catholique' ; 2 = 'Juive' ; 3 = 'Musulmane' ; 4 = 'Autre religion (protestante, boudhiste ou autre)' ; 5 = 'Sans religion'",
-            "Y7ECO2ST2": "1 = 'Moins de 1 250 euros' ; 2 = 'De 1 250 euros à 1 999 euros' ; 3 = 'De 2 000 à 3 499 euros' ; 4 = 'De 3 500 à 4 999 euros' ; 5 = '5 000 euros et plus'",
-            "Y7INTPOLST": "1 = 'Beaucoup' ; 2 = 'Un peu' ; 3 = 'Pas vraiment' ; 4 = 'Pas du tout'",
-            "Y7Q7ST": "1 = 'Très à gauche' ; 2 = 'Plutôt à gauche' ; 3 = 'Au centre' ; 4 = 'Plutôt à droite' ; 5 = 'Très à droite'",
-            "Y7PROXST": "1 = 'Très à gauche (Lutte Ouvrière, Nouveau Parti Anticapitaliste, Parti Communiste Français, France Insoumise)' ; 2 = 'Gauche (Parti Socialiste, Europe Ecologie - Les Verts)' ; 3 = 'Centre (Renaissance, Le MoDem (Mouvement Démocrate), Horizons, UDI (Union des Démocrates et Indépendants))' ; 4 = 'Droite (Les Républicains)' ; 5 = 'Très à droite (Debout la France, Rassemblement national (ex Front National), Reconquête!)' ; 6 = 'Autre parti ou aucun parti'"
-        }
-        # définir un dictionnaire qui contient l'ordre figé des modalités pour chaque variable socio-démographique
-        dico_ordre_modalites = {
-            "Y7SEXEST": [
-                "Homme",
-                "Femme"
-            ],
-            "Y7AGERST": [
-                "18 à 24 ans",
-                "25 à 34 ans",
-                "35 à 49 ans",
-                "50 à 59 ans",
-                "60 ans et plus"
-            ],
-            "Y7REG13ST": [
-                "Ile de France",
-                "Nord et Est (Hauts de France, Grand Est et Bourgogne Franche Comté)",
-                "Ouest (Normandie, Bretagne, Pays de la Loire et Centre Val de Loire)",
-                "Sud ouest (Nouvelle Aquitaine et Occitanie)",
-                "Sud est (Auvergne Rhône Alpes, Provence Alpes Côte d'Azur et Corse)"
-            ],
-            "Y7AGGLO5ST": [
-                "Zone rurale (moins de 2 000 habitants)",
-                "Zone urbaine de 2 000 à 9 999 habitants",
-                "Zone urbaine de 10 000 à 49 999 habitants",
-                "Zone urbaine de 50 000 à 199 999 habitants",
-                "Zone urbaine de 200 000 habitants et plus"
-            ],
-            "Y7EMPST": [
-                "Salarié (salarié à plein temps ou à temps partiel)",
-                "Indépendant (travaille à mon compte)",
-                "Sans emploi (ne travaille pas actuellement tout en recherchant un emploi ou non, personne au foyer, retraité, étudiant ou élève)"
-            ],
-            "Y7PCSIST": [
-                "Agriculteur exploitant, artisan, commerçant, chef d entreprise",
-                "Cadre supérieur",
-                "Profession intermédiaire",
-                "Employé",
-                "Ouvrier",
-                "Retraité, inactif"
-            ],
-            "Y7EDUST": [
-                "Aucun diplôme",
-                "CAP, BEP",
-                "Baccalauréat",
-                "Bac +2",
-                "Bac +3 et plus"
-            ],
-            "Y7REL1ST": [
-                "Catholique",
-                "Juive",
-                "Musulmane",
-                "Autre religion (protestante, boudhiste ou autre)",
-                "Sans religion"
-            ],
-            "Y7ECO2ST2": [
-                "Moins de 1 250 euros",
-                "De 1 250 euros à 1 999 euros",
-                "De 2 000 à 3 499 euros",
-                "De 3 500 à 4 999 euros",
-                "5 000 euros et plus"
-            ],
-            "Y7INTPOLST": [
-                "Beaucoup",
-                "Un peu",
-                "Pas vraiment",
-                "Pas du tout"
-            ],
-            "Y7Q7ST": [
-                "Très à gauche",
-                "Plutôt à gauche",
-                "Au centre",
-                "Plutôt à droite",
-                "Très à droite"
-            ],
-            "Y7PROXST": [
-                "Très à gauche (Lutte Ouvrière, Nouveau Parti Anticapitaliste, Parti Communiste Français, France Insoumise)",
-                "Gauche (Parti Socialiste, Europe Ecologie - Les Verts)",
-                "Centre (Renaissance, Le MoDem (Mouvement Démocrate), Horizons, UDI (Union des Démocrates et Indépendants))",
-                "Droite (Les Républicains)",
-                "Très à droite (Debout la France, Rassemblement national (ex Front National), Reconquête!)",
-                "Autre parti ou aucun parti"
-            ]
-        }
-        # définir une fonction qui affiche les étiquettes
-        # des modalités de la variablr SD choisie dans la légende
-        # sur plusieurs lignes si leur longueur initiale dépasse la
-        # largeur du cadre de la légende (version robuste avec gestion des erreurs)
-        def wrap_label(label, max_length=20):
-            try:
-                # Si le label est un float ou NaN
-                if pd.isna(label) or isinstance(label, float):
-                    return "Non renseigné"
-                # Convertir en string si ce n'est pas déjà le cas
-                label = str(label).strip()
-                # Si la chaîne est vide après nettoyage
-                if not label:
-                    return "Non renseigné"
-                if len(label) <= max_length:
-                    return label
-                words = label.split()
-                lines = []
-                current_line = []
-                current_length = 0
-                for word in words:
-                    if current_length + len(word) > max_length:
-                        lines.append(' '.join(current_line))
-                        current_line = [word]
-                        current_length = len(word)
-                    else:
-                        current_line.append(word)
-                        current_length += len(word) + 1  
-                if current_line:
-                    lines.append(' '.join(current_line))
-                return '<br>'.join(lines)
-            except Exception as e:
-                print(f"Erreur dans wrap_label avec {label}: {str(e)}")
-                return str(label) 
-                # retourner le label tel quel en cas d'erreur
-        # lire le fichier CSV des données
-        csvfile = "data/T_w7_partl24bst_" + "%s" % input.Select_VarSD_Part_Legis_T2().lower()[2:] + ".csv"
-        df = pd.read_csv(csvfile)
-        # nettoyer les données lues
-        var_sd = input.Select_VarSD_Part_Legis_T2()
-        df[var_sd] = df[var_sd].fillna("Non renseigné")  # Gérer les NaN
-        df[var_sd] = df[var_sd].astype(str)  # Convertir en string
-        df['Y7PARTL24BST'] = df['Y7PARTL24BST'].fillna("Non renseigné")
-        # s'assurer que toutes les modalités sont des chaînes de caractères dans "dico_ordre_modalites"
-        dico_ordre_modalites[var_sd] = [str(modal) for modal in dico_ordre_modalites[var_sd]]
-        # filtrer pour ne garder que les modalités définies dans "dico_ordre_modalites"
-        df = df[df[var_sd].isin(dico_ordre_modalites[var_sd])]
-        # définir l'ordre des modalités pour Y7PARTL24BST
-        ordre_modalites = [
-            "Vous avez voté",
-            "Vous n'avez pas voté"
-        ]
-        # créer une colonne catégorielle avec l'ordre souhaité pour la variable socio-démographique
-        var_sd = input.Select_VarSD_Part_Legis_T2()
-        df[var_sd] = pd.Categorical(
-            df[var_sd],
-            categories=dico_ordre_modalites[var_sd],
-            ordered=True
-        )
-        # filtrer et pivoter les données
-        df_pivot = df[df['Y7PARTL24BST'].isin(ordre_modalites)].pivot(
-            index=var_sd,
-            columns='Y7PARTL24BST',
-            values='pct'
-        )
-        df_pivot = df_pivot.reindex(columns=ordre_modalites)
-        # créer une palette de couleurs automatique
-        nb_couleurs = len(df_pivot.index)
-        palette = px.colors.qualitative.Plotly[:nb_couleurs]
-        # créer le graphique
-        fig = go.Figure()
-        # ajouter les données
-        for i, VarSD in enumerate(df_pivot.index):
-            fig.add_trace(
-                go.Bar(
-                    x=ordre_modalites,
-                    y=df_pivot.loc[VarSD],
-                    name=wrap_label(VarSD),
-                    marker_color=palette[i],
-                    # afficher les valeurs sous le format 'xx.x%' dans la bulle qui s'affiche
-                    # au survol de la courbe par la souris, et supprimer toutes les autres
-                    # informations qui pourraient s'afficher en plus (nom de la modalité)
-                    hovertemplate='%{y:.1f}%<extra></extra>',
-                    # n'afficher la bulle contenant la valeur 'y' en % uniquement
-                    # au-dessus de la barre verticale survolée par la souris
-                    hoverinfo='y',
-                    # centrer ce texte 'y' dans la bulle
-                    hoverlabel=dict(
-                        align='auto'
-                    )
-                )
-            )
-         # mettre en forme le graphique
-        fig.update_layout(
-            barmode='group', # barres séparées et groupées pour les modalités de la VarSD choisie
-            title={
-                'text': "Participation au vote en fonction %s" % dico_titre.get("%s" % input.Select_VarSD_Part_Legis_T2()),
-                'y':0.98,
-                'x':0.01,
-                'xanchor': 'left',
-                'yanchor': 'top'
-            },
-            # définir le titre de la légende
-            legend_title="%s" % dico_legende.get("%s" % input.Select_VarSD_Part_Legis_T2()),
-            # définir l'affichage séparé des valeurs de % affichées au-dessus de
-            # chaque barre verticale quand la souris la survole
-            hovermode="closest",
-            # définir le thème général de l'apparence du graphique
-            template="plotly_white",
-            # définir le titre de l'axe des ordonnées et son apparence
-            yaxis_title=dict(
-                text='Pourcentage de répondants (%)',
-                font_size=12
-            ),
-            # définir les sources des données
-            annotations=[
-                dict(
-                    xref='paper', # utiliser la largeur totale du graphique comme référence
-                    yref='paper', # utiliser la hauteur totale du graphique comme référence
-                    x=0.5, # placer le point d'ancrage au milieu de la largeur
-                    y=-0.1, # valeur à ajuster pour positionner verticalement le texte sous le graphique
-                    xanchor='center', # centrer le texte par rapport au point d'ancrage
-                    yanchor='top',
-                    text=
-                        'Enquête électorale française pour les ' +
-                        'élections européennes de juin 2024, ' +
-                        'par Ipsos Sopra Steria, Cevipof, ' +
-                        'Le Monde, Fondation Jean Jaurès et ' +
-                        'Institut Montaigne (2024)',
-                    font=dict(
-                        size=10,
-                        color='grey'
-                    ),
-                    showarrow=False
-                )
-            ],
-            # définir les marges de la zone graphique
-            # (augmentées à droite pour le cadre fixe de la légende)
-            margin=dict(
-                b=50, # b = bottom
-                t=50,  # t = top
-                l=50, # l = left
-                r=200 # r = right
-            ),
-            # fixer la position de la légende
-            legend=dict(
-                orientation="v",
-                valign='top',  # aligner le texte en haut de chaque marqueur de la légende
-                x=1.02, # position horizontale de la légende (1 = à droite du graphique)
-                y=1, # position verticale de la légende (1 = en haut)
-                xanchor='left', # ancrer la légende à gauche de sa position x
-                yanchor='top', # ancrer la légende en haut de sa position y
-                bgcolor='rgba(255,255,255,0.8)' # fond légèrement transparent
-            ),
-        )
-        # retourner le graphique
-        return fig
-
-
-    ########################################################################
-    # onglet 04 : VOTE POUR LES CANDIDATS (couleurs politiques) (2e tour)  #
-    ########################################################################
-
-    # bouton 01 : décrire la question posée dans l'enquête
-    @reactive.effect
-    @reactive.event(input.Show_CAND_Question_Legis_T2)
-    def _():
-        m = ui.modal(
-            "La question posée aux répondants est la suivante : 'Voici les candidats qui se présentaient au second tour des élections législatives dans votre circonscription. Pouvez-vous dire celui pour lequel vous avez voté ?'",
-            title="Informations complémentaires sur la question contenue dans l'enquête :",
-            easy_close=False
-        )
-        ui.modal_show(m)
-
-    # bouton 02 : décrire la variable
-    @reactive.effect
-    @reactive.event(input.Show_CAND_Info_Legis_T2)
-    def _():
-        m = ui.modal(
-            "La variable sur la couleur politique du candidat ayant reçu le vote du répondant contient à l'origine 7 modalités. \
-            La variable du vote en faveur de la couleur politique du candidat présentée ici sur les graphiques est simplifiée : \
-            seules les 4 couleurs politiques ayant récolté le plus de suffrages sont retenues. \
-            Ainsi, les modalités de réponse synthétiques retenues pour cette variable sont les suivantes : \
-            1 = 'Rassemblement national (RN) et alliés', \
-            2 = 'Ensemble', \
-            3 = 'Nouveau Front Populaire (NFP)', \
-            4 = 'Les Républicains (LR) / Divers Droite (DVD)'.",
-            title="Informations complémentaires sur la variable choisie pour les graphiques :",
-            easy_close=False
-        )
-        ui.modal_show(m)
-
-    # graphique
-    @output
-    @render_plotly
-    def Graph_Cand_Legis_T2():
-        # importer les données
-        csvfile = "data/T_w7_leg24bxst.csv"
-        data = pd.read_csv(csvfile)
-        # supprimer la première colonne (vide) de la base de donnée
-        data = data.drop(
-            data.columns[0],
-            axis=1
-        )
-        # identifier les étiquettes courtes (chiffres démarrant à 1)
-        data['ETIQCOURTE'] = data.index + 1
-        etiquettes_courtes = data["ETIQCOURTE"]
-        # identifier les étiquettes longues (modalités de la variable dans la table lue)
-        etiquettes_longues = data["LEG24BXST"]
-        # créer la figure en mémoire
-        fig = go.Figure()
-        # créer la liste des couleurs en fonction du nombre de modalités
-        couleurs_cl = cl.scales[str(max(3, len(data["LEG24BXST"])))]['qual']['Set1']
-        # ajouter les données
-        fig.add_trace(
-            go.Bar(
-                # on représente la colonne des étiquettes courtes (et non la variable elle-même, car
-                # cette colonne correspond aux étiquettes longues de la légende)
-                x=data["ETIQCOURTE"],
-                y=data["pct"],
-                # changer de couleur en fonction de la modalité de réponse
-                marker_color=couleurs_cl,
-                # afficher les valeurs sous le format 'xx.x%' dans la bulle qui s'affiche
-                # au survol de la courbe par la souris, et supprimer toutes les autres
-                # informations qui pourraient s'afficher en plus (nom de la modalité)
-                hovertemplate='%{y:.1f}%<extra></extra>',
-                # n'afficher la bulle contenant la valeur 'y' en % uniquement
-                # au-dessus de la barre verticale survolée par la souris
-                hoverinfo='y',
-                # centrer ce texte 'y' dans la bulle
-                hoverlabel=dict(
-                   align='auto'
-                )
-            )
-        )
-        # créer le texte de la légende (correspondance entre les étiquettes courtes et les étiquettes longues)
-        legende_text = "<br>".join([f"{lettre}: {etiquette}" for lettre, etiquette in zip(etiquettes_courtes, etiquettes_longues)])
-        # mettre en forme le graphique
-        fig.update_layout(
-            # définir le titre du graphique et son apparence
-            title={
-                'text': "Vote en faveur des candidats (couleurs politiques)",
-                'y':0.98,
-                'x':0.01,
-                'xanchor': 'left',
-                'yanchor': 'top'
-            },
-            # définir le titre de l'axe des ordonnées et son apparence
-            yaxis_title=dict(
-                text='Pourcentage de répondants (%)',
-                font_size=12
-            ),
-            # définir l'affichage séparé des valeurs de % affichées au-dessus de
-            # chaque barre verticale quand la souris la survole
-            hovermode="closest",
-            # définir le thème général de l'apparence du graphique
-            template="plotly_white",
-            # définir deux annotations
-            annotations=[
-                # sources des données
-                dict(
-                    xref='paper', # utiliser la largeur totale du graphique comme référence
-                    yref='paper', # utiliser la hauteur totale du graphique comme référence
-                    x=0.5, # placer le point d'ancrage au milieu de la largeur
-                    y=-0.1, # valeur à ajuster pour positionner verticalement le texte sous le graphique
-                    xanchor='center', # centrer le texte par rapport au point d'ancrage
-                    yanchor='top',
-                    text=
-                        'Enquête électorale française pour les ' +
-                        'élections européennes de juin 2024, ' +
-                        'par Ipsos Sopra Steria, Cevipof, ' +
-                        'Le Monde, Fondation Jean Jaurès et ' +
-                        'Institut Montaigne (2024)',
-                    font=dict(
-                        size=10,
-                        color='grey'
-                    ),
-                    showarrow=False
-                ),
-                # légende personnalisée
-                dict(
-                    valign="top", # aligner le texte en haut de chaque marqueur de la légende
-                    x=0.75, # position horizontale de la légende (1 = à droite du graphique)
-                    y=1.00, # position verticale de la légende (1 = en haut)
-                    xref='paper',
-                    yref='paper',
-                    xanchor='left', # ancrer la légende à gauche de sa position x
-                    yanchor='top', # ancrer la légende en haut de sa position y
-                    text=f"<b>Légende :</b><br>{legende_text}",
-                    showarrow=False,
-                    font=dict(size=12),
-                    align='left',
-                    bgcolor='rgba(255,255,255,0.8)', # fond légèrement transparent
-                )
-            ],
-            # définir les marges de la zone graphique
-            # (augmentées à droite pour le cadre fixe de la légende)
-            margin=dict(
-                b=50, # b = bottom
-                t=50,  # t = top
-                l=50, # l = left
-                r=200 # r = right
-            )
-        )
-        # configurer l'axe des abscisses pour n'afficher que des nombres entiers
-        fig.update_xaxes(
-            tickmode='linear',
-            tick0=1,
-            dtick=1,
-            tickfont=dict(size=12),
-            tickangle=0
-        )
-
-        # retourner le graphique
-        return fig
-
-
-    #####################################################################
-    # onglet 05 : SENTIMENTS PERSONNELS SUR LES RESULTATS DE L'ELECTION #
-    #####################################################################
-
-    # bouton 01 : décrire la question posée dans l'enquête
-    @reactive.effect
-    @reactive.event(input.Show_SENTRES_Question_Legis_T2)
-    def _():
-        m = ui.modal(
-            "La question posée aux répondants est la suivante : 'Et quand vous pensez aux résultats des élections législatives des 30 juin et 7 juillet dernier, lequel des sentiments suivants est le plus proche de ce que vous ressentez ?'",
-            title="Informations complémentaires sur la question contenue dans l'enquête :",
-            easy_close=False
-        )
-        ui.modal_show(m)
-
-    # bouton 02 : décrire la variable de l'intention d'aller voter choisie
-    @reactive.effect
-    @reactive.event(input.Show_SENTRESST_Info_Legis_T2)
-    def _():
-        m = ui.modal(
-            "La variable sur le sentiment personnel des répondants concernant les résultats des élections législatives (2e tour) présentée ici sur les graphiques est une modalité synthétique de la question posée aux répondants de l'enquête. \
-            Ainsi, à partir des sept modalités de réponse à la question de l'enquête, on en construit deux : 'Sentiment positif (joie, espoir ou soulagement)' ou 'Sentiment négatif (déception, colère ou peur)'.",
-            title="Informations complémentaires sur la variable choisie pour les graphiques :",
-            easy_close=False
-        )
-        ui.modal_show(m)
-
-    # bouton 03 : afficher la description de la variable socio-démographique choisie
-    # avec plusieurs parties de texte qui dépendent de ce choix (via des dictionnaires)
-    @reactive.effect
-    @reactive.event(input.Show_VarSD_SentRes_Info_Legis_T2)
-    def _():
-        # définir le nom de la variable socio-démographique choisie
-        dico_nom_var = {
-            "Y7SEXEST": "Genre",
-            "Y7AGERST": "Âge",
-            "Y7REG13ST": "Région",
-            "Y7AGGLO5ST": "Taille d'agglomération",
-            "Y7EMPST": "Type d'emploi occupé",
-            "Y7PCSIST": "Catégorie professionnelle",
-            "Y7EDUST": "Niveau de scolarité atteint",
-            "Y7REL1ST": "Religion",
-            "Y7ECO2ST2": "Revenu mensuel du foyer",
-            "Y7INTPOLST": "Intérêt pour la politique",
-            "Y7Q7ST": "Positionnement idéologique",
-            "Y7PROXST": "Préférence partisane"
-        }
-        # définir la question de l'enquête associée à la variable socio-démographique choisie
-        dico_question_var = {
-            "Y7SEXEST": "Êtes-vous ?",
-            "Y7AGERST": "Quelle est votre date de naissance ?",
-            "Y7REG13ST": "Veuillez indiquer le département et la commune où vous résidez.",
-            "Y7AGGLO5ST": "Veuillez indiquer le département et la commune où vous résidez.",
-            "Y7EMPST": "Quelle est votre situation professionnelle actuelle ?",
-            "Y7PCSIST": "Quelle est votre situation professionnelle actuelle ?",
-            "Y7EDUST": "Choisissez votre niveau de scolarité le plus élevé.",
-            "Y7REL1ST": "Quelle est votre religion, si vous en avez une ?",
-            "Y7ECO2ST2": " Pour finir, nous avons besoin de connaître, à des fins statistiques uniquement, la tranche dans laquelle se situe le revenu MENSUEL NET de votre FOYER après déduction des impôts sur le revenu (veuillez considérer toutes vos sources de revenus: salaires, bourses, prestations retraite et sécurité sociale, dividendes, revenus immobiliers, pensions alimentaires etc.).",
-            "Y7INTPOLST": "De manière générale, diriez-vous que vous vous intéressez à la politique ?",
-            "Y7Q7ST": "Sur une échelle de 0 à 10, où 0 correspond à la gauche et 10 correspond à la droite, où diriez-vous que vous vous situez ?",
-            "Y7PROXST": "De quel parti vous sentez-vous proche ou moins éloigné que les autres ?"
-        }
-        # définir les modalités de réponse à la question de l'enquête associée à la variable socio-démographique choisie
-        dico_modalite_var = {
-            "Y7SEXEST": "1 = 'Homme' ; 2 = 'Femme'",
-            "Y7AGERST": "1 = '18 à 24 ans' ; 2 = '25 à 34 ans' ; 3 = '35 à 49 ans' ; 4 = '50 à 59 ans' ; 5 = '60 ans et plus'",
-            "Y7REG13ST": "1 = 'Ile de France' ; 2 = 'Nord et Est (Hauts de France, Grand Est et Bourgogne Franche Comté)' ; 3 = 'Ouest (Normandie, Bretagne, Pays de la Loire et Centre Val de Loire)' ; 4 = 'Sud ouest (Nouvelle Aquitaine et Occitanie)' ; 5 = 'Sud est (Auvergne Rhône Alpes, Provence Alpes Côte d'Azur et Corse)'",
-            "Y7AGGLO5ST": "1 = 'Zone rurale (moins de 2 000 habitants)' ; 2 = 'Zone urbaine de 2 000 à 9 999 habitants' ; 3 = 'Zone urbaine de 10 000 à 49 999 habitants' ; 4 = 'Zone urbaine de 50 000 à 199 999 habitants' ; 5 = 'Zone urbaine de 200 000 habitants et plus'",
-            "Y7EMPST": "1 = 'Salarié (salarié à plein temps ou à temps partiel)' ; 2 = 'Indépendant (travaille à mon compte)' ; 3 = 'Sans emploi (ne travaille pas actuellement tout en recherchant un emploi ou non, personne au foyer, retraité, étudiant ou élève)'",
-            "Y7PCSIST": "1 = 'Agriculteur exploitant, artisan, commerçant, chef d entreprise' ; 2 = 'Cadre supérieur' ; 3 = 'Profession intermédiaire' ; 4 = 'Employé' ; 5 = 'Ouvrier' ; 6 = 'Retraité, inactif'",
-            "Y7EDUST": "1 = 'Aucun diplôme' ; 2 = 'CAP, BEP' ; 3 = 'Baccalauréat' ; 4 = 'Bac +2' ; 5 = 'Bac +3 et plus'",
-            "Y7REL1ST": "1 = 'Catholique' ; 2 = 'Juive' ; 3 = 'Musulmane' ; 4 = 'Autre religion (protestante, boudhiste ou autre)' ; 5 = 'Sans religion'",
-            "Y7ECO2ST2": "1 = 'Moins de 1 250 euros' ; 2 = 'De 1 250 euros à 1 999 euros' ; 3 = 'De 2 000 à 3 499 euros' ; 4 = 'De 3 500 à 4 999 euros' ; 5 = '5 000 euros et plus'",
-            "Y7INTPOLST": "1 = 'Beaucoup' ; 2 = 'Un peu' ; 3 = 'Pas vraiment' ; 4 = 'Pas du tout'",
-            "Y7Q7ST": "1 = 'Très à gauche' ; 2 = 'Plutôt à gauche' ; 3 = 'Au centre' ; 4 = 'Plutôt à droite' ; 5 = 'Très à droite'",
-            "Y7PROXST": "1 = 'Extême gauche (Lutte Ouvrière, Nouveau Parti Anticapitaliste, Parti Communiste Français, France Insoumise)' ; 2 = 'Gauche (Parti Socialiste, Europe Ecologie - Les Verts)' ; 3 = 'Centre (Renaissance, Le MoDem (Mouvement Démocrate), Horizons, UDI (Union des Démocrates et Indépendants))' ; 4 = 'Droite (Les Républicains)' ; 5 = 'Très à droite (Debout la France, Rassemblement national (ex Front National), Reconquête!)' ; 6 = 'Autre parti ou aucun parti'"
-        }
-        # définir le texte complet à afficher (avec parties fixes et variables en fonction du choix effectué)
-        m = ui.modal(
-            "La variable '%s' correspond à ou est calculée à partir de la question suivante posée aux répondants : \
-            '%s', \
-            et ses modalités de réponse (inchangées par rapport au questionnaire ou regroupées pour les présents graphiques) sont : \
-            %s." % (
-                dico_nom_var.get(
-                    "%s" % input.Select_VarSD_SentRes_Legis_T2()
-                ),
-                dico_question_var.get("%s" % input.Select_VarSD_SentRes_Legis_T2()),
-                dico_modalite_var.get("%s" % input.Select_VarSD_SentRes_Legis_T2())
-            ),
-            title="Informations complémentaires sur la variable socio-démographique choisie :",
-            easy_close=False
-        )
-        ui.modal_show(m)
-
-    # graphique
-    @output
-    @render_plotly
-    def Graph_Croise_SentRes_Legis_T2():
-        # définir la partie variable du titre
-        dico_titre = {
-            "Y7SEXEST": "du genre",
-            "Y7AGERST": "de l'âge",
-            "Y7REG13ST": "de la région de résidence",
-            "Y7AGGLO5ST": "de la taille de l'agglomération de résidence",
-            "Y7EMPST": "du type d'emploi occupé",
-            "Y7PCSIST": "de la catégorie socio-professionnelle",
-            "Y7EDUST": "du niveau de scolarité atteint",
-            "Y7REL1ST": "de la religion",
-            "Y7ECO2ST2": "du revenu mensuel du foyer",
-            "Y7INTPOLST": "de l'intérêt pour la politique",
-            "Y7Q7ST": "du positionnement idéologique",
-            "Y7PROXST": "de la préférence partisane"
-        }
-        # définir la partie variable du titre de la légende
-        dico_legende = {
-            "Y7SEXEST": "Genre",
-            "Y7AGERST": "Âge",
-            "Y7REG13ST": "Région",
-            "Y7AGGLO5ST": "Taille d'agglomération",
-            "Y7EMPST": "Type d'emploi occupé",
-            "Y7PCSIST": "Catégorie professionnelle",
-            "Y7EDUST": "Niveau de scolarité atteint",
-            "Y7REL1ST": "Religion",
-            "Y7ECO2ST2": "Revenu mensuel du foyer",
-            "Y7INTPOLST": "Intérêt pour la politique",
-            "Y7Q7ST": "Positionnement idéologique",
-            "Y7PROXST": "Préférence partisane"
-        }
-        # définir l'échelle de l'axe des ordonnées en fonction des
-        # valeurs prises par la variable socio-démographique choisie
-        dico_echelleY = {
-            "Y7SEXEST": [10, 40],
-            "Y7AGERST": [10, 45],
-            "Y7REG13ST": [15, 35],
-            "Y7AGGLO5ST": [15, 35],
-            "Y7EMPST": [15, 40],
-            "Y7PCSIST": [10, 45],
-            "Y7EDUST": [15, 40],
-            "Y7REL1ST": [10, 45],
-            "Y7ECO2ST2": [10, 45],
-            "Y7INTPOLST": [0, 75],
-            "Y7Q7ST": [5, 40],
-            "Y7PROXST": [5, 55],
-        }
-        # définir les modalités des variables socio-démo et leur ordre
-        dico_modalite_var = {
-            "Y7SEXEST": "1 = 'Homme' ; 2 = 'Femme'",
-            "Y7AGERST": "1 = '18 à 24 ans' ; 2 = '25 à 34 ans' ; 3 = '35 à 49 ans' ; 4 = '50 à 59 ans' ; 5 = '60 ans et plus'",
-            "Y7REG13ST": "1 = 'Ile de France' ; 2 = 'Nord et Est (Hauts de France, Grand Est et Bourgogne Franche Comté)' ; 3 = 'Ouest (Normandie, Bretagne, Pays de la Loire et Centre Val de Loire)' ; 4 = 'Sud ouest (Nouvelle Aquitaine et Occitanie)' ; 5 = 'Sud est (Auvergne Rhône Alpes, Provence Alpes Côte d'Azur et Corse)'",
-            "Y7AGGLO5ST": "1 = 'Zone rurale (moins de 2 000 habitants)' ; 2 = 'Zone urbaine de 2 000 à 9 999 habitants' ; 3 = 'Zone urbaine de 10 000 à 49 999 habitants' ; 4 = 'Zone urbaine de 50 000 à 199 999 habitants' ; 5 = 'Zone urbaine de 200 000 habitants et plus'",
-            "Y7EMPST": "1 = 'Salarié (salarié à plein temps ou à temps partiel)' ; 2 = 'Indépendant (travaille à mon compte)' ; 3 = 'Sans emploi (ne travaille pas actuellement tout en recherchant un emploi ou non, personne au foyer, retraité, étudiant ou élève)'",
-            "Y7PCSIST": "1 = 'Agriculteur exploitant, artisan, commerçant, chef d entreprise' ; 2 = 'Cadre supérieur' ; 3 = 'Profession intermédiaire' ; 4 = 'Employé' ; 5 = 'Ouvrier' ; 6 = 'Retraité, inactif'",
-            "Y7EDUST": "1 = 'Aucun diplôme' ; 2 = 'CAP, BEP' ; 3 = 'Baccalauréat' ; 4 = 'Bac +2' ; 5 = 'Bac +3 et plus'",
-            "Y7REL1ST": "1 = 'Catholique' ; 2 = 'Juive' ; 3 = 'Musulmane' ; 4 = 'Autre religion (protestante, boudhiste ou autre)' ; 5 = 'Sans religion'",
-            "Y7ECO2ST2": "1 = 'Moins de 1 250 euros' ; 2 = 'De 1 250 euros à 1 999 euros' ; 3 = 'De 2 000 à 3 499 euros' ; 4 = 'De 3 500 à 4 999 euros' ; 5 = '5 000 euros et plus'",
-            "Y7INTPOLST": "1 = 'Beaucoup' ; 2 = 'Un peu' ; 3 = 'Pas vraiment' ; 4 = 'Pas du tout'",
-            "Y7Q7ST": "1 = 'Très à gauche' ; 2 = 'Plutôt à gauche' ; 3 = 'Au centre' ; 4 = 'Plutôt à droite' ; 5 = 'Très à droite'",
-            "Y7PROXST": "1 = 'Très à gauche (Lutte Ouvrière, Nouveau Parti Anticapitaliste, Parti Communiste Français, France Insoumise)' ; 2 = 'Gauche (Parti Socialiste, Europe Ecologie - Les Verts)' ; 3 = 'Centre (Renaissance, Le MoDem (Mouvement Démocrate), Horizons, UDI (Union des Démocrates et Indépendants))' ; 4 = 'Droite (Les Républicains)' ; 5 = 'Très à droite (Debout la France, Rassemblement national (ex Front National), Reconquête!)' ; 6 = 'Autre parti ou aucun parti'"
-        }
-        # définir un dictionnaire qui contient l'ordre figé des modalités pour chaque variable socio-démographique
-        dico_ordre_modalites = {
-            "Y7SEXEST": [
-                "Homme",
-                "Femme"
-            ],
-            "Y7AGERST": [
-                "18 à 24 ans",
-                "25 à 34 ans",
-                "35 à 49 ans",
-                "50 à 59 ans",
-                "60 ans et plus"
-            ],
-            "Y7REG13ST": [
-                "Ile de France",
-                "Nord et Est (Hauts de France, Grand Est et Bourgogne Franche Comté)",
-                "Ouest (Normandie, Bretagne, Pays de la Loire et Centre Val de Loire)",
-                "Sud ouest (Nouvelle Aquitaine et Occitanie)",
-                "Sud est (Auvergne Rhône Alpes, Provence Alpes Côte d'Azur et Corse)"
-            ],
-            "Y7AGGLO5ST": [
-                "Zone rurale (moins de 2 000 habitants)",
-                "Zone urbaine de 2 000 à 9 999 habitants",
-                "Zone urbaine de 10 000 à 49 999 habitants",
-                "Zone urbaine de 50 000 à 199 999 habitants",
-                "Zone urbaine de 200 000 habitants et plus"
-            ],
-            "Y7EMPST": [
-                "Salarié (salarié à plein temps ou à temps partiel)",
-                "Indépendant (travaille à mon compte)",
-                "Sans emploi (ne travaille pas actuellement tout en recherchant un emploi ou non, personne au foyer, retraité, étudiant ou élève)"
-            ],
-            "Y7PCSIST": [
-                "Agriculteur exploitant, artisan, commerçant, chef d entreprise",
-                "Cadre supérieur",
-                "Profession intermédiaire",
-                "Employé",
-                "Ouvrier",
-                "Retraité, inactif"
-            ],
-            "Y7EDUST": [
-                "Aucun diplôme",
-                "CAP, BEP",
-                "Baccalauréat",
-                "Bac +2",
-                "Bac +3 et plus"
-            ],
-            "Y7REL1ST": [
-                "Catholique",
-                "Juive",
-                "Musulmane",
-                "Autre religion (protestante, boudhiste ou autre)",
-                "Sans religion"
-            ],
-            "Y7ECO2ST2": [
-                "Moins de 1 250 euros",
-                "De 1 250 euros à 1 999 euros",
-                "De 2 000 à 3 499 euros",
-                "De 3 500 à 4 999 euros",
-                "5 000 euros et plus"
-            ],
-            "Y7INTPOLST": [
-                "Beaucoup",
-                "Un peu",
-                "Pas vraiment",
-                "Pas du tout"
-            ],
-            "Y7Q7ST": [
-                "Très à gauche",
-                "Plutôt à gauche",
-                "Au centre",
-                "Plutôt à droite",
-                "Très à droite"
-            ],
-            "Y7PROXST": [
-                "Très à gauche (Lutte Ouvrière, Nouveau Parti Anticapitaliste, Parti Communiste Français, France Insoumise)",
-                "Gauche (Parti Socialiste, Europe Ecologie - Les Verts)",
-                "Centre (Renaissance, Le MoDem (Mouvement Démocrate), Horizons, UDI (Union des Démocrates et Indépendants))",
-                "Droite (Les Républicains)",
-                "Très à droite (Debout la France, Rassemblement national (ex Front National), Reconquête!)",
-                "Autre parti ou aucun parti"
-            ]
-        }
-        # définir une fonction qui affiche les étiquettes
-        # des modalités de la variablr SD choisie dans la légende
-        # sur plusieurs lignes si leur longueur initiale dépasse la
-        # largeur du cadre de la légende (version robuste avec gestion des erreurs)
-        def wrap_label(label, max_length=20):
-            try:
-                # Si le label est un float ou NaN
-                if pd.isna(label) or isinstance(label, float):
-                    return "Non renseigné"
-                # Convertir en string si ce n'est pas déjà le cas
-                label = str(label).strip()
-                # Si la chaîne est vide après nettoyage
-                if not label:
-                    return "Non renseigné"
-                if len(label) <= max_length:
-                    return label
-                words = label.split()
-                lines = []
-                current_line = []
-                current_length = 0
-                for word in words:
-                    if current_length + len(word) > max_length:
-                        lines.append(' '.join(current_line))
-                        current_line = [word]
-                        current_length = len(word)
-                    else:
-                        current_line.append(word)
-                        current_length += len(word) + 1  
-                if current_line:
-                    lines.append(' '.join(current_line))
-                return '<br>'.join(lines)
-            except Exception as e:
-                print(f"Erreur dans wrap_label avec {label}: {str(e)}")
-                return str(label) 
-                # retourner le label tel quel en cas d'erreur
-        # lire le fichier CSV des données
-        csvfile = "data/T_w7_pl4st_" + "%s" % input.Select_VarSD_SentRes_Legis_T2().lower()[2:] + ".csv"
-        df = pd.read_csv(csvfile)
-        # nettoyer les données lues
-        var_sd = input.Select_VarSD_SentRes_Legis_T2()
-        df[var_sd] = df[var_sd].fillna("Non renseigné")  # Gérer les NaN
-        df[var_sd] = df[var_sd].astype(str)  # Convertir en string
-        df['Y7PL4ST'] = df['Y7PL4ST'].fillna("Non renseigné")
-        # s'assurer que toutes les modalités sont des chaînes de caractères dans "dico_ordre_modalites"
-        dico_ordre_modalites[var_sd] = [str(modal) for modal in dico_ordre_modalites[var_sd]]
-        # filtrer pour ne garder que les modalités définies dans "dico_ordre_modalites"
-        df = df[df[var_sd].isin(dico_ordre_modalites[var_sd])]
-        # définir l'ordre des modalités pour Y7PL4ST
-        ordre_modalites = [
-            "Sentiment positif (joie, espoir ou soulagement)",
-            "Sentiment négatif (déception, colère ou peur)"
-        ]
-        # créer une colonne catégorielle avec l'ordre souhaité pour la variable socio-démographique
-        var_sd = input.Select_VarSD_SentRes_Legis_T2()
-        df[var_sd] = pd.Categorical(
-            df[var_sd],
-            categories=dico_ordre_modalites[var_sd],
-            ordered=True
-        )
-        # filtrer et pivoter les données
-        df_pivot = df[df['Y7PL4ST'].isin(ordre_modalites)].pivot(
-            index=var_sd,
-            columns='Y7PL4ST',
-            values='pct'
-        )
-        df_pivot = df_pivot.reindex(columns=ordre_modalites)
-        # créer une palette de couleurs automatique
-        nb_couleurs = len(df_pivot.index)
-        palette = px.colors.qualitative.Plotly[:nb_couleurs]
-        # créer le graphique
-        fig = go.Figure()
-        # ajouter les données
-        for i, VarSD in enumerate(df_pivot.index):
-            fig.add_trace(
-                go.Bar(
-                    x=ordre_modalites,
-                    y=df_pivot.loc[VarSD],
-                    name=wrap_label(VarSD),
-                    marker_color=palette[i],
-                    # afficher les valeurs sous le format 'xx.x%' dans la bulle qui s'affiche
-                    # au survol de la courbe par la souris, et supprimer toutes les autres
-                    # informations qui pourraient s'afficher en plus (nom de la modalité)
-                    hovertemplate='%{y:.1f}%<extra></extra>',
-                    # n'afficher la bulle contenant la valeur 'y' en % uniquement
-                    # au-dessus de la barre verticale survolée par la souris
-                    hoverinfo='y',
-                    # centrer ce texte 'y' dans la bulle
-                    hoverlabel=dict(
-                        align='auto'
-                    )
-                )
-            )
-         # mettre en forme le graphique
-        fig.update_layout(
-            barmode='group', # barres séparées et groupées pour les modalités de la VarSD choisie
-            title={
-                'text': "Sentiment personnel sur les résultats des élections en fonction %s" % dico_titre.get("%s" % input.Select_VarSD_SentRes_Legis_T2()),
-                'y':0.98,
-                'x':0.01,
-                'xanchor': 'left',
-                'yanchor': 'top'
-            },
-            # définir le titre de la légende
-            legend_title="%s" % dico_legende.get("%s" % input.Select_VarSD_SentRes_Legis_T2()),
-            # définir l'affichage séparé des valeurs de % affichées au-dessus de
-            # chaque barre verticale quand la souris la survole
-            hovermode="closest",
-            # définir le thème général de l'apparence du graphique
-            template="plotly_white",
-            # définir le titre de l'axe des ordonnées et son apparence
-            yaxis_title=dict(
-                text='Pourcentage de répondants (%)',
-                font_size=12
-            ),
-            # définir les sources des données
-            annotations=[
-                dict(
-                    xref='paper', # utiliser la largeur totale du graphique comme référence
-                    yref='paper', # utiliser la hauteur totale du graphique comme référence
-                    x=0.5, # placer le point d'ancrage au milieu de la largeur
-                    y=-0.1, # valeur à ajuster pour positionner verticalement le texte sous le graphique
-                    xanchor='center', # centrer le texte par rapport au point d'ancrage
-                    yanchor='top',
-                    text=
-                        'Enquête électorale française pour les ' +
-                        'élections européennes de juin 2024, ' +
-                        'par Ipsos Sopra Steria, Cevipof, ' +
-                        'Le Monde, Fondation Jean Jaurès et ' +
-                        'Institut Montaigne (2024)',
-                    font=dict(
-                        size=10,
-                        color='grey'
-                    ),
-                    showarrow=False
-                )
-            ],
-            # définir les marges de la zone graphique
-            # (augmentées à droite pour le cadre fixe de la légende)
-            margin=dict(
-                b=50, # b = bottom
-                t=50,  # t = top
-                l=50, # l = left
-                r=200 # r = right
-            ),
-            # fixer la position de la légende
-            legend=dict(
-                orientation="v",
-                valign='top',  # aligner le texte en haut de chaque marqueur de la légende
-                x=1.02, # position horizontale de la légende (1 = à droite du graphique)
-                y=1, # position verticale de la légende (1 = en haut)
-                xanchor='left', # ancrer la légende à gauche de sa position x
-                yanchor='top', # ancrer la légende en haut de sa position y
-                bgcolor='rgba(255,255,255,0.8)' # fond légèrement transparent
-            ),
-        )
-        # retourner le graphique
-        return fig
-
-
-    #######################################################
-    # onglet 06 : AVIS SUR LE FRONT REPUBLICAIN (2e tour) #
-    #######################################################
-
-    # bouton 01 : décrire la question posée dans l'enquête
-    @reactive.effect
-    @reactive.event(input.Show_AVFR_Question_Legis_T2)
-    def _():
-        m = ui.modal(
-            "La question posée aux répondants est la suivante : 'Le Front Républicain est le fait d’appeler les électeurs de gauche et de droite à voter au second tour d’une élection pour un même candidat, afin d’empêcher l’élection d’un candidat du Rassemblement National. De laquelle des deux opinions suivantes vous sentez-vous le plus proche ?'",
-            title="Informations complémentaires sur la question contenue dans l'enquête :",
-            easy_close=False
-        )
-        ui.modal_show(m)
-
-    # bouton 02 : décrire la variable de l'intention d'aller voter choisie
-    @reactive.effect
-    @reactive.event(input.Show_AVFRST_Info_Legis_T2)
-    def _():
-        m = ui.modal(
-            "La variable sur l'avis des répondants concernant le front républicain aux élections législatives (2e tour) \
-            présentée ici sur les graphiques contient deux modalités de réponse : \
-            'L’appel au Front Républicain exprime l’inquiétude de ceux qui pensent que le Rassemblement National est une menace pour la démocratie' \
-            et 'Le Front Républicain est une tactique permettant aux partis traditionnels de conserver le pouvoir'.",
-            title="Informations complémentaires sur la variable choisie pour les graphiques :",
-            easy_close=False
-        )
-        ui.modal_show(m)
-
-    # bouton 03 : afficher la description de la variable socio-démographique choisie
-    # avec plusieurs parties de texte qui dépendent de ce choix (via des dictionnaires)
-    @reactive.effect
-    @reactive.event(input.Show_VarSD_AvFr_Info_Legis_T2)
-    def _():
-        # définir le nom de la variable socio-démographique choisie
-        dico_nom_var = {
-            "Y7SEXEST": "Genre",
-            "Y7AGERST": "Âge",
-            "Y7REG13ST": "Région",
-            "Y7AGGLO5ST": "Taille d'agglomération",
-            "Y7EMPST": "Type d'emploi occupé",
-            "Y7PCSIST": "Catégorie professionnelle",
-            "Y7EDUST": "Niveau de scolarité atteint",
-            "Y7REL1ST": "Religion",
-            "Y7ECO2ST2": "Revenu mensuel du foyer",
-            "Y7INTPOLST": "Intérêt pour la politique",
-            "Y7Q7ST": "Positionnement idéologique",
-            "Y7PROXST": "Préférence partisane"
-        }
-        # définir la question de l'enquête associée à la variable socio-démographique choisie
-        dico_question_var = {
-            "Y7SEXEST": "Êtes-vous ?",
-            "Y7AGERST": "Quelle est votre date de naissance ?",
-            "Y7REG13ST": "Veuillez indiquer le département et la commune où vous résidez.",
-            "Y7AGGLO5ST": "Veuillez indiquer le département et la commune où vous résidez.",
-            "Y7EMPST": "Quelle est votre situation professionnelle actuelle ?",
-            "Y7PCSIST": "Quelle est votre situation professionnelle actuelle ?",
-            "Y7EDUST": "Choisissez votre niveau de scolarité le plus élevé.",
-            "Y7REL1ST": "Quelle est votre religion, si vous en avez une ?",
-            "Y7ECO2ST2": " Pour finir, nous avons besoin de connaître, à des fins statistiques uniquement, la tranche dans laquelle se situe le revenu MENSUEL NET de votre FOYER après déduction des impôts sur le revenu (veuillez considérer toutes vos sources de revenus: salaires, bourses, prestations retraite et sécurité sociale, dividendes, revenus immobiliers, pensions alimentaires etc.).",
-            "Y7INTPOLST": "De manière générale, diriez-vous que vous vous intéressez à la politique ?",
-            "Y7Q7ST": "Sur une échelle de 0 à 10, où 0 correspond à la gauche et 10 correspond à la droite, où diriez-vous que vous vous situez ?",
-            "Y7PROXST": "De quel parti vous sentez-vous proche ou moins éloigné que les autres ?"
-        }
-        # définir les modalités de réponse à la question de l'enquête associée à la variable socio-démographique choisie
-        dico_modalite_var = {
-            "Y7SEXEST": "1 = 'Homme' ; 2 = 'Femme'",
-            "Y7AGERST": "1 = '18 à 24 ans' ; 2 = '25 à 34 ans' ; 3 = '35 à 49 ans' ; 4 = '50 à 59 ans' ; 5 = '60 ans et plus'",
-            "Y7REG13ST": "1 = 'Ile de France' ; 2 = 'Nord et Est (Hauts de France, Grand Est et Bourgogne Franche Comté)' ; 3 = 'Ouest (Normandie, Bretagne, Pays de la Loire et Centre Val de Loire)' ; 4 = 'Sud ouest (Nouvelle Aquitaine et Occitanie)' ; 5 = 'Sud est (Auvergne Rhône Alpes, Provence Alpes Côte d'Azur et Corse)'",
-            "Y7AGGLO5ST": "1 = 'Zone rurale (moins de 2 000 habitants)' ; 2 = 'Zone urbaine de 2 000 à 9 999 habitants' ; 3 = 'Zone urbaine de 10 000 à 49 999 habitants' ; 4 = 'Zone urbaine de 50 000 à 199 999 habitants' ; 5 = 'Zone urbaine de 200 000 habitants et plus'",
-            "Y7EMPST": "1 = 'Salarié (salarié à plein temps ou à temps partiel)' ; 2 = 'Indépendant (travaille à mon compte)' ; 3 = 'Sans emploi (ne travaille pas actuellement tout en recherchant un emploi ou non, personne au foyer, retraité, étudiant ou élève)'",
-            "Y7PCSIST": "1 = 'Agriculteur exploitant, artisan, commerçant, chef d entreprise' ; 2 = 'Cadre supérieur' ; 3 = 'Profession intermédiaire' ; 4 = 'Employé' ; 5 = 'Ouvrier' ; 6 = 'Retraité, inactif'",
-            "Y7EDUST": "1 = 'Aucun diplôme' ; 2 = 'CAP, BEP' ; 3 = 'Baccalauréat' ; 4 = 'Bac +2' ; 5 = 'Bac +3 et plus'",
-            "Y7REL1ST": "1 = 'Catholique' ; 2 = 'Juive' ; 3 = 'Musulmane' ; 4 = 'Autre religion (protestante, boudhiste ou autre)' ; 5 = 'Sans religion'",
-            "Y7ECO2ST2": "1 = 'Moins de 1 250 euros' ; 2 = 'De 1 250 euros à 1 999 euros' ; 3 = 'De 2 000 à 3 499 euros' ; 4 = 'De 3 500 à 4 999 euros' ; 5 = '5 000 euros et plus'",
-            "Y7INTPOLST": "1 = 'Beaucoup' ; 2 = 'Un peu' ; 3 = 'Pas vraiment' ; 4 = 'Pas du tout'",
-            "Y7Q7ST": "1 = 'Très à gauche' ; 2 = 'Plutôt à gauche' ; 3 = 'Au centre' ; 4 = 'Plutôt à droite' ; 5 = 'Très à droite'",
-            "Y7PROXST": "1 = 'Extême gauche (Lutte Ouvrière, Nouveau Parti Anticapitaliste, Parti Communiste Français, France Insoumise)' ; 2 = 'Gauche (Parti Socialiste, Europe Ecologie - Les Verts)' ; 3 = 'Centre (Renaissance, Le MoDem (Mouvement Démocrate), Horizons, UDI (Union des Démocrates et Indépendants))' ; 4 = 'Droite (Les Républicains)' ; 5 = 'Très à droite (Debout la France, Rassemblement national (ex Front National), Reconquête!)' ; 6 = 'Autre parti ou aucun parti'"
-        }
-        # définir le texte complet à afficher (avec parties fixes et variables en fonction du choix effectué)
-        m = ui.modal(
-            "La variable '%s' correspond à ou est calculée à partir de la question suivante posée aux répondants : \
-            '%s', \
-            et ses modalités de réponse (inchangées par rapport au questionnaire ou regroupées pour les présents graphiques) sont : \
-            %s." % (
-                dico_nom_var.get(
-                    "%s" % input.Select_VarSD_AvFr_Legis_T2()
-                ),
-                dico_question_var.get("%s" % input.Select_VarSD_AvFr_Legis_T2()),
-                dico_modalite_var.get("%s" % input.Select_VarSD_AvFr_Legis_T2())
-            ),
-            title="Informations complémentaires sur la variable socio-démographique choisie :",
-            easy_close=False
-        )
-        ui.modal_show(m)
-
-    # graphique
-    @output
-    @render_plotly
-    def Graph_Croise_AvFr_Legis_T2():
-        # définir la partie variable du titre
-        dico_titre = {
-            "Y7SEXEST": "du genre",
-            "Y7AGERST": "de l'âge",
-            "Y7REG13ST": "de la région de résidence",
-            "Y7AGGLO5ST": "de la taille de l'agglomération de résidence",
-            "Y7EMPST": "du type d'emploi occupé",
-            "Y7PCSIST": "de la catégorie socio-professionnelle",
-            "Y7EDUST": "du niveau de scolarité atteint",
-            "Y7REL1ST": "de la religion",
-            "Y7ECO2ST2": "du revenu mensuel du foyer",
-            "Y7INTPOLST": "de l'intérêt pour la politique",
-            "Y7Q7ST": "du positionnement idéologique",
-            "Y7PROXST": "de la préférence partisane"
-        }
-        # définir la partie variable du titre de la légende
-        dico_legende = {
-            "Y7SEXEST": "Genre",
-            "Y7AGERST": "Âge",
-            "Y7REG13ST": "Région",
-            "Y7AGGLO5ST": "Taille d'agglomération",
-            "Y7EMPST": "Type d'emploi occupé",
-            "Y7PCSIST": "Catégorie professionnelle",
-            "Y7EDUST": "Niveau de scolarité atteint",
-            "Y7REL1ST": "Religion",
-            "Y7ECO2ST2": "Revenu mensuel du foyer",
-            "Y7INTPOLST": "Intérêt pour la politique",
-            "Y7Q7ST": "Positionnement idéologique",
-            "Y7PROXST": "Préférence partisane"
-        }
-        # définir l'échelle de l'axe des ordonnées en fonction des
-        # valeurs prises par la variable socio-démographique choisie
-        dico_echelleY = {
-            "Y7SEXEST": [10, 40],
-            "Y7AGERST": [10, 45],
-            "Y7REG13ST": [15, 35],
-            "Y7AGGLO5ST": [15, 35],
-            "Y7EMPST": [15, 40],
-            "Y7PCSIST": [10, 45],
-            "Y7EDUST": [15, 40],
-            "Y7REL1ST": [10, 45],
-            "Y7ECO2ST2": [10, 45],
-            "Y7INTPOLST": [0, 75],
-            "Y7Q7ST": [5, 40],
-            "Y7PROXST": [5, 55],
-        }
-        # définir les modalités des variables socio-démo et leur ordre
-        dico_modalite_var = {
-            "Y7SEXEST": "1 = 'Homme' ; 2 = 'Femme'",
-            "Y7AGERST": "1 = '18 à 24 ans' ; 2 = '25 à 34 ans' ; 3 = '35 à 49 ans' ; 4 = '50 à 59 ans' ; 5 = '60 ans et plus'",
-            "Y7REG13ST": "1 = 'Ile de France' ; 2 = 'Nord et Est (Hauts de France, Grand Est et Bourgogne Franche Comté)' ; 3 = 'Ouest (Normandie, Bretagne, Pays de la Loire et Centre Val de Loire)' ; 4 = 'Sud ouest (Nouvelle Aquitaine et Occitanie)' ; 5 = 'Sud est (Auvergne Rhône Alpes, Provence Alpes Côte d'Azur et Corse)'",
-            "Y7AGGLO5ST": "1 = 'Zone rurale (moins de 2 000 habitants)' ; 2 = 'Zone urbaine de 2 000 à 9 999 habitants' ; 3 = 'Zone urbaine de 10 000 à 49 999 habitants' ; 4 = 'Zone urbaine de 50 000 à 199 999 habitants' ; 5 = 'Zone urbaine de 200 000 habitants et plus'",
-            "Y7EMPST": "1 = 'Salarié (salarié à plein temps ou à temps partiel)' ; 2 = 'Indépendant (travaille à mon compte)' ; 3 = 'Sans emploi (ne travaille pas actuellement tout en recherchant un emploi ou non, personne au foyer, retraité, étudiant ou élève)'",
-            "Y7PCSIST": "1 = 'Agriculteur exploitant, artisan, commerçant, chef d entreprise' ; 2 = 'Cadre supérieur' ; 3 = 'Profession intermédiaire' ; 4 = 'Employé' ; 5 = 'Ouvrier' ; 6 = 'Retraité, inactif'",
-            "Y7EDUST": "1 = 'Aucun diplôme' ; 2 = 'CAP, BEP' ; 3 = 'Baccalauréat' ; 4 = 'Bac +2' ; 5 = 'Bac +3 et plus'",
-            "Y7REL1ST": "1 = 'Catholique' ; 2 = 'Juive' ; 3 = 'Musulmane' ; 4 = 'Autre religion (protestante, boudhiste ou autre)' ; 5 = 'Sans religion'",
-            "Y7ECO2ST2": "1 = 'Moins de 1 250 euros' ; 2 = 'De 1 250 euros à 1 999 euros' ; 3 = 'De 2 000 à 3 499 euros' ; 4 = 'De 3 500 à 4 999 euros' ; 5 = '5 000 euros et plus'",
-            "Y7INTPOLST": "1 = 'Beaucoup' ; 2 = 'Un peu' ; 3 = 'Pas vraiment' ; 4 = 'Pas du tout'",
-            "Y7Q7ST": "1 = 'Très à gauche' ; 2 = 'Plutôt à gauche' ; 3 = 'Au centre' ; 4 = 'Plutôt à droite' ; 5 = 'Très à droite'",
-            "Y7PROXST": "1 = 'Très à gauche (Lutte Ouvrière, Nouveau Parti Anticapitaliste, Parti Communiste Français, France Insoumise)' ; 2 = 'Gauche (Parti Socialiste, Europe Ecologie - Les Verts)' ; 3 = 'Centre (Renaissance, Le MoDem (Mouvement Démocrate), Horizons, UDI (Union des Démocrates et Indépendants))' ; 4 = 'Droite (Les Républicains)' ; 5 = 'Très à droite (Debout la France, Rassemblement national (ex Front National), Reconquête!)' ; 6 = 'Autre parti ou aucun parti'"
-        }
-        # définir un dictionnaire qui contient l'ordre figé des modalités pour chaque variable socio-démographique
-        dico_ordre_modalites = {
-            "Y7SEXEST": [
-                "Homme",
-                "Femme"
-            ],
-            "Y7AGERST": [
-                "18 à 24 ans",
-                "25 à 34 ans",
-                "35 à 49 ans",
-                "50 à 59 ans",
-                "60 ans et plus"
-            ],
-            "Y7REG13ST": [
-                "Ile de France",
-                "Nord et Est (Hauts de France, Grand Est et Bourgogne Franche Comté)",
-                "Ouest (Normandie, Bretagne, Pays de la Loire et Centre Val de Loire)",
-                "Sud ouest (Nouvelle Aquitaine et Occitanie)",
-                "Sud est (Auvergne Rhône Alpes, Provence Alpes Côte d'Azur et Corse)"
-            ],
-            "Y7AGGLO5ST": [
-                "Zone rurale (moins de 2 000 habitants)",
-                "Zone urbaine de 2 000 à 9 999 habitants",
-                "Zone urbaine de 10 000 à 49 999 habitants",
-                "Zone urbaine de 50 000 à 199 999 habitants",
-                "Zone urbaine de 200 000 habitants et plus"
-            ],
-            "Y7EMPST": [
-                "Salarié (salarié à plein temps ou à temps partiel)",
-                "Indépendant (travaille à mon compte)",
-                "Sans emploi (ne travaille pas actuellement tout en recherchant un emploi ou non, personne au foyer, retraité, étudiant ou élève)"
-            ],
-            "Y7PCSIST": [
-                "Agriculteur exploitant, artisan, commerçant, chef d entreprise",
-                "Cadre supérieur",
-                "Profession intermédiaire",
-                "Employé",
-                "Ouvrier",
-                "Retraité, inactif"
-            ],
-            "Y7EDUST": [
-                "Aucun diplôme",
-                "CAP, BEP",
-                "Baccalauréat",
-                "Bac +2",
-                "Bac +3 et plus"
-            ],
-            "Y7REL1ST": [
-                "Catholique",
-                "Juive",
-                "Musulmane",
-                "Autre religion (protestante, boudhiste ou autre)",
-                "Sans religion"
-            ],
-            "Y7ECO2ST2": [
-                "Moins de 1 250 euros",
-                "De 1 250 euros à 1 999 euros",
-                "De 2 000 à 3 499 euros",
-                "De 3 500 à 4 999 euros",
-                "5 000 euros et plus"
-            ],
-            "Y7INTPOLST": [
-                "Beaucoup",
-                "Un peu",
-                "Pas vraiment",
-                "Pas du tout"
-            ],
-            "Y7Q7ST": [
-                "Très à gauche",
-                "Plutôt à gauche",
-                "Au centre",
-                "Plutôt à droite",
-                "Très à droite"
-            ],
-            "Y7PROXST": [
-                "Très à gauche (Lutte Ouvrière, Nouveau Parti Anticapitaliste, Parti Communiste Français, France Insoumise)",
-                "Gauche (Parti Socialiste, Europe Ecologie - Les Verts)",
-                "Centre (Renaissance, Le MoDem (Mouvement Démocrate), Horizons, UDI (Union des Démocrates et Indépendants))",
-                "Droite (Les Républicains)",
-                "Très à droite (Debout la France, Rassemblement national (ex Front National), Reconquête!)",
-                "Autre parti ou aucun parti"
-            ]
-        }
-        # définir une fonction qui affiche les étiquettes
-        # des modalités de la variablr SD choisie dans la légende
-        # sur plusieurs lignes si leur longueur initiale dépasse la
-        # largeur du cadre de la légende (version robuste avec gestion des erreurs)
-        def wrap_label(label, max_length=20):
-            try:
-                # Si le label est un float ou NaN
-                if pd.isna(label) or isinstance(label, float):
-                    return "Non renseigné"
-                # Convertir en string si ce n'est pas déjà le cas
-                label = str(label).strip()
-                # Si la chaîne est vide après nettoyage
-                if not label:
-                    return "Non renseigné"
-                if len(label) <= max_length:
-                    return label
-                words = label.split()
-                lines = []
-                current_line = []
-                current_length = 0
-                for word in words:
-                    if current_length + len(word) > max_length:
-                        lines.append(' '.join(current_line))
-                        current_line = [word]
-                        current_length = len(word)
-                    else:
-                        current_line.append(word)
-                        current_length += len(word) + 1  
-                if current_line:
-                    lines.append(' '.join(current_line))
-                return '<br>'.join(lines)
-            except Exception as e:
-                print(f"Erreur dans wrap_label avec {label}: {str(e)}")
-                return str(label) 
-                # retourner le label tel quel en cas d'erreur
-        # lire le fichier CSV des données
-        csvfile = "data/T_w7_pl5st_" + "%s" % input.Select_VarSD_AvFr_Legis_T2().lower()[2:] + ".csv"
-        df = pd.read_csv(csvfile)
-        # nettoyer les données lues
-        var_sd = input.Select_VarSD_AvFr_Legis_T2()
-        df[var_sd] = df[var_sd].fillna("Non renseigné")  # Gérer les NaN
-        df[var_sd] = df[var_sd].astype(str)  # Convertir en string
-        df['Y7PL5ST'] = df['Y7PL5ST'].fillna("Non renseigné")
-        # s'assurer que toutes les modalités sont des chaînes de caractères dans "dico_ordre_modalites"
-        dico_ordre_modalites[var_sd] = [str(modal) for modal in dico_ordre_modalites[var_sd]]
-        # filtrer pour ne garder que les modalités définies dans "dico_ordre_modalites"
-        df = df[df[var_sd].isin(dico_ordre_modalites[var_sd])]
-        # définir l'ordre des modalités pour Y7PL5ST
-        ordre_modalites = [
-            "Le RN est une menace pour la démocratie",
-            "Tactique des partis traditionnels pour garder le pouvoir"
-        ]
-        # créer une colonne catégorielle avec l'ordre souhaité pour la variable socio-démographique
-        var_sd = input.Select_VarSD_AvFr_Legis_T2()
-        df[var_sd] = pd.Categorical(
-            df[var_sd],
-            categories=dico_ordre_modalites[var_sd],
-            ordered=True
-        )
-        # filtrer et pivoter les données
-        df_pivot = df[df['Y7PL5ST'].isin(ordre_modalites)].pivot(
-            index=var_sd,
-            columns='Y7PL5ST',
-            values='pct'
-        )
-        df_pivot = df_pivot.reindex(columns=ordre_modalites)
-        # créer une palette de couleurs automatique
-        nb_couleurs = len(df_pivot.index)
-        palette = px.colors.qualitative.Plotly[:nb_couleurs]
-        # créer le graphique
-        fig = go.Figure()
-        # ajouter les données
-        for i, VarSD in enumerate(df_pivot.index):
-            fig.add_trace(
-                go.Bar(
-                    x=ordre_modalites,
-                    y=df_pivot.loc[VarSD],
-                    name=wrap_label(VarSD),
-                    marker_color=palette[i],
-                    # afficher les valeurs sous le format 'xx.x%' dans la bulle qui s'affiche
-                    # au survol de la courbe par la souris, et supprimer toutes les autres
-                    # informations qui pourraient s'afficher en plus (nom de la modalité)
-                    hovertemplate='%{y:.1f}%<extra></extra>',
-                    # n'afficher la bulle contenant la valeur 'y' en % uniquement
-                    # au-dessus de la barre verticale survolée par la souris
-                    hoverinfo='y',
-                    # centrer ce texte 'y' dans la bulle
-                    hoverlabel=dict(
-                        align='auto'
-                    )
-                )
-            )
-         # mettre en forme le graphique
-        fig.update_layout(
-            barmode='group', # barres séparées et groupées pour les modalités de la VarSD choisie
-            title={
-                'text': "Avis sur le front républicain en fonction %s" % dico_titre.get("%s" % input.Select_VarSD_AvFr_Legis_T2()),
-                'y':0.98,
-                'x':0.01,
-                'xanchor': 'left',
-                'yanchor': 'top'
-            },
-            # définir le titre de la légende
-            legend_title="%s" % dico_legende.get("%s" % input.Select_VarSD_AvFr_Legis_T2()),
-            # définir l'affichage séparé des valeurs de % affichées au-dessus de
-            # chaque barre verticale quand la souris la survole
-            hovermode="closest",
-            # définir le thème général de l'apparence du graphique
-            template="plotly_white",
-            # définir le titre de l'axe des ordonnées et son apparence
-            yaxis_title=dict(
-                text='Pourcentage de répondants (%)',
-                font_size=12
-            ),
-            # définir les sources des données
-            annotations=[
-                dict(
-                    xref='paper', # utiliser la largeur totale du graphique comme référence
-                    yref='paper', # utiliser la hauteur totale du graphique comme référence
-                    x=0.5, # placer le point d'ancrage au milieu de la largeur
-                    y=-0.1, # valeur à ajuster pour positionner verticalement le texte sous le graphique
-                    xanchor='center', # centrer le texte par rapport au point d'ancrage
-                    yanchor='top',
-                    text=
-                        'Enquête électorale française pour les ' +
-                        'élections européennes de juin 2024, ' +
-                        'par Ipsos Sopra Steria, Cevipof, ' +
-                        'Le Monde, Fondation Jean Jaurès et ' +
-                        'Institut Montaigne (2024)',
-                    font=dict(
-                        size=10,
-                        color='grey'
-                    ),
-                    showarrow=False
-                )
-            ],
-            # définir les marges de la zone graphique
-            # (augmentées à droite pour le cadre fixe de la légende)
-            margin=dict(
-                b=50, # b = bottom
-                t=50,  # t = top
-                l=50, # l = left
-                r=200 # r = right
-            ),
-            # fixer la position de la légende
-            legend=dict(
-                orientation="v",
-                valign='top',  # aligner le texte en haut de chaque marqueur de la légende
-                x=1.02, # position horizontale de la légende (1 = à droite du graphique)
-                y=1, # position verticale de la légende (1 = en haut)
-                xanchor='left', # ancrer la légende à gauche de sa position x
-                yanchor='top', # ancrer la légende en haut de sa position y
-                bgcolor='rgba(255,255,255,0.8)' # fond légèrement transparent
-            ),
-        )
-        # retourner le graphique
-        return fig
-
-
-    ###############################################
-    # onglet 07 : ACCORD DE VUES AVEC L'ENTOURAGE #
-    ###############################################
-
-    # bouton 01 : décrire la question posée dans l'enquête
-    @reactive.effect
-    @reactive.event(input.Show_ACCVUES_Question_Legis_T2)
-    def _():
-        m = ui.modal(
-            "La question posée aux répondants est la suivante : 'À l’occasion de ces élections législatives, avez-vous eu de profonds désaccords ou des discussions animées avec des gens de votre entourage ?'",
-            title="Informations complémentaires sur la question contenue dans l'enquête :",
-            easy_close=False
-        )
-        ui.modal_show(m)
-
-    # bouton 02 : décrire la variable de l'intention d'aller voter choisie
-    @reactive.effect
-    @reactive.event(input.Show_ACCVUESST_Info_Legis_T2)
-    def _():
-        m = ui.modal(
-            "La variable sur l'accord des points de vue des répondants avec leur entourage à l'occasion des élections législatives présentée ici sur les graphiques est une modalité synthétique de la question posée aux répondants de l'enquête. \
-            Ainsi, à partir des quatre modalités de réponse à la question de l'enquête, on en construit deux : 'Souvent (très souvent ou assez souvent)' ou 'Rarement ou jamais'.",
-            title="Informations complémentaires sur la variable choisie pour les graphiques :",
-            easy_close=False
-        )
-        ui.modal_show(m)
-
-    # bouton 03 : afficher la description de la variable socio-démographique choisie
-    # avec plusieurs parties de texte qui dépendent de ce choix (via des dictionnaires)
-    @reactive.effect
-    @reactive.event(input.Show_VarSD_AccVues_Info_Legis_T2)
-    def _():
-        # définir le nom de la variable socio-démographique choisie
-        dico_nom_var = {
-            "Y7SEXEST": "Genre",
-            "Y7AGERST": "Âge",
-            "Y7REG13ST": "Région",
-            "Y7AGGLO5ST": "Taille d'agglomération",
-            "Y7EMPST": "Type d'emploi occupé",
-            "Y7PCSIST": "Catégorie professionnelle",
-            "Y7EDUST": "Niveau de scolarité atteint",
-            "Y7REL1ST": "Religion",
-            "Y7ECO2ST2": "Revenu mensuel du foyer",
-            "Y7INTPOLST": "Intérêt pour la politique",
-            "Y7Q7ST": "Positionnement idéologique",
-            "Y7PROXST": "Préférence partisane"
-        }
-        # définir la question de l'enquête associée à la variable socio-démographique choisie
-        dico_question_var = {
-            "Y7SEXEST": "Êtes-vous ?",
-            "Y7AGERST": "Quelle est votre date de naissance ?",
-            "Y7REG13ST": "Veuillez indiquer le département et la commune où vous résidez.",
-            "Y7AGGLO5ST": "Veuillez indiquer le département et la commune où vous résidez.",
-            "Y7EMPST": "Quelle est votre situation professionnelle actuelle ?",
-            "Y7PCSIST": "Quelle est votre situation professionnelle actuelle ?",
-            "Y7EDUST": "Choisissez votre niveau de scolarité le plus élevé.",
-            "Y7REL1ST": "Quelle est votre religion, si vous en avez une ?",
-            "Y7ECO2ST2": " Pour finir, nous avons besoin de connaître, à des fins statistiques uniquement, la tranche dans laquelle se situe le revenu MENSUEL NET de votre FOYER après déduction des impôts sur le revenu (veuillez considérer toutes vos sources de revenus: salaires, bourses, prestations retraite et sécurité sociale, dividendes, revenus immobiliers, pensions alimentaires etc.).",
-            "Y7INTPOLST": "De manière générale, diriez-vous que vous vous intéressez à la politique ?",
-            "Y7Q7ST": "Sur une échelle de 0 à 10, où 0 correspond à la gauche et 10 correspond à la droite, où diriez-vous que vous vous situez ?",
-            "Y7PROXST": "De quel parti vous sentez-vous proche ou moins éloigné que les autres ?"
-        }
-        # définir les modalités de réponse à la question de l'enquête associée à la variable socio-démographique choisie
-        dico_modalite_var = {
-            "Y7SEXEST": "1 = 'Homme' ; 2 = 'Femme'",
-            "Y7AGERST": "1 = '18 à 24 ans' ; 2 = '25 à 34 ans' ; 3 = '35 à 49 ans' ; 4 = '50 à 59 ans' ; 5 = '60 ans et plus'",
-            "Y7REG13ST": "1 = 'Ile de France' ; 2 = 'Nord et Est (Hauts de France, Grand Est et Bourgogne Franche Comté)' ; 3 = 'Ouest (Normandie, Bretagne, Pays de la Loire et Centre Val de Loire)' ; 4 = 'Sud ouest (Nouvelle Aquitaine et Occitanie)' ; 5 = 'Sud est (Auvergne Rhône Alpes, Provence Alpes Côte d'Azur et Corse)'",
-            "Y7AGGLO5ST": "1 = 'Zone rurale (moins de 2 000 habitants)' ; 2 = 'Zone urbaine de 2 000 à 9 999 habitants' ; 3 = 'Zone urbaine de 10 000 à 49 999 habitants' ; 4 = 'Zone urbaine de 50 000 à 199 999 habitants' ; 5 = 'Zone urbaine de 200 000 habitants et plus'",
-            "Y7EMPST": "1 = 'Salarié (salarié à plein temps ou à temps partiel)' ; 2 = 'Indépendant (travaille à mon compte)' ; 3 = 'Sans emploi (ne travaille pas actuellement tout en recherchant un emploi ou non, personne au foyer, retraité, étudiant ou élève)'",
-            "Y7PCSIST": "1 = 'Agriculteur exploitant, artisan, commerçant, chef d entreprise' ; 2 = 'Cadre supérieur' ; 3 = 'Profession intermédiaire' ; 4 = 'Employé' ; 5 = 'Ouvrier' ; 6 = 'Retraité, inactif'",
-            "Y7EDUST": "1 = 'Aucun diplôme' ; 2 = 'CAP, BEP' ; 3 = 'Baccalauréat' ; 4 = 'Bac +2' ; 5 = 'Bac +3 et plus'",
-            "Y7REL1ST": "1 = 'Catholique' ; 2 = 'Juive' ; 3 = 'Musulmane' ; 4 = 'Autre religion (protestante, boudhiste ou autre)' ; 5 = 'Sans religion'",
-            "Y7ECO2ST2": "1 = 'Moins de 1 250 euros' ; 2 = 'De 1 250 euros à 1 999 euros' ; 3 = 'De 2 000 à 3 499 euros' ; 4 = 'De 3 500 à 4 999 euros' ; 5 = '5 000 euros et plus'",
-            "Y7INTPOLST": "1 = 'Beaucoup' ; 2 = 'Un peu' ; 3 = 'Pas vraiment' ; 4 = 'Pas du tout'",
-            "Y7Q7ST": "1 = 'Très à gauche' ; 2 = 'Plutôt à gauche' ; 3 = 'Au centre' ; 4 = 'Plutôt à droite' ; 5 = 'Très à droite'",
-            "Y7PROXST": "1 = 'Extême gauche (Lutte Ouvrière, Nouveau Parti Anticapitaliste, Parti Communiste Français, France Insoumise)' ; 2 = 'Gauche (Parti Socialiste, Europe Ecologie - Les Verts)' ; 3 = 'Centre (Renaissance, Le MoDem (Mouvement Démocrate), Horizons, UDI (Union des Démocrates et Indépendants))' ; 4 = 'Droite (Les Républicains)' ; 5 = 'Très à droite (Debout la France, Rassemblement national (ex Front National), Reconquête!)' ; 6 = 'Autre parti ou aucun parti'"
-        }
-        # définir le texte complet à afficher (avec parties fixes et variables en fonction du choix effectué)
-        m = ui.modal(
-            "La variable '%s' correspond à ou est calculée à partir de la question suivante posée aux répondants : \
-            '%s', \
-            et ses modalités de réponse (inchangées par rapport au questionnaire ou regroupées pour les présents graphiques) sont : \
-            %s." % (
-                dico_nom_var.get(
-                    "%s" % input.Select_VarSD_AccVues_Legis_T2()
-                ),
-                dico_question_var.get("%s" % input.Select_VarSD_AccVues_Legis_T2()),
-                dico_modalite_var.get("%s" % input.Select_VarSD_AccVues_Legis_T2())
-            ),
-            title="Informations complémentaires sur la variable socio-démographique choisie :",
-            easy_close=False
-        )
-        ui.modal_show(m)
-
-    # graphique
-    @output
-    @render_plotly
-    def Graph_Croise_AccVues_Legis_T2():
-        # définir la partie variable du titre
-        dico_titre = {
-            "Y7SEXEST": "du genre",
-            "Y7AGERST": "de l'âge",
-            "Y7REG13ST": "de la région de résidence",
-            "Y7AGGLO5ST": "de la taille de l'agglomération de résidence",
-            "Y7EMPST": "du type d'emploi occupé",
-            "Y7PCSIST": "de la catégorie socio-professionnelle",
-            "Y7EDUST": "du niveau de scolarité atteint",
-            "Y7REL1ST": "de la religion",
-            "Y7ECO2ST2": "du revenu mensuel du foyer",
-            "Y7INTPOLST": "de l'intérêt pour la politique",
-            "Y7Q7ST": "du positionnement idéologique",
-            "Y7PROXST": "de la préférence partisane"
-        }
-        # définir la partie variable du titre de la légende
-        dico_legende = {
-            "Y7SEXEST": "Genre",
-            "Y7AGERST": "Âge",
-            "Y7REG13ST": "Région",
-            "Y7AGGLO5ST": "Taille d'agglomération",
-            "Y7EMPST": "Type d'emploi occupé",
-            "Y7PCSIST": "Catégorie professionnelle",
-            "Y7EDUST": "Niveau de scolarité atteint",
-            "Y7REL1ST": "Religion",
-            "Y7ECO2ST2": "Revenu mensuel du foyer",
-            "Y7INTPOLST": "Intérêt pour la politique",
-            "Y7Q7ST": "Positionnement idéologique",
-            "Y7PROXST": "Préférence partisane"
-        }
-        # définir l'échelle de l'axe des ordonnées en fonction des
-        # valeurs prises par la variable socio-démographique choisie
-        dico_echelleY = {
-            "Y7SEXEST": [10, 40],
-            "Y7AGERST": [10, 45],
-            "Y7REG13ST": [15, 35],
-            "Y7AGGLO5ST": [15, 35],
-            "Y7EMPST": [15, 40],
-            "Y7PCSIST": [10, 45],
-            "Y7EDUST": [15, 40],
-            "Y7REL1ST": [10, 45],
-            "Y7ECO2ST2": [10, 45],
-            "Y7INTPOLST": [0, 75],
-            "Y7Q7ST": [5, 40],
-            "Y7PROXST": [5, 55],
-        }
-        # définir les modalités des variables socio-démo et leur ordre
-        dico_modalite_var = {
-            "Y7SEXEST": "1 = 'Homme' ; 2 = 'Femme'",
-            "Y7AGERST": "1 = '18 à 24 ans' ; 2 = '25 à 34 ans' ; 3 = '35 à 49 ans' ; 4 = '50 à 59 ans' ; 5 = '60 ans et plus'",
-            "Y7REG13ST": "1 = 'Ile de France' ; 2 = 'Nord et Est (Hauts de France, Grand Est et Bourgogne Franche Comté)' ; 3 = 'Ouest (Normandie, Bretagne, Pays de la Loire et Centre Val de Loire)' ; 4 = 'Sud ouest (Nouvelle Aquitaine et Occitanie)' ; 5 = 'Sud est (Auvergne Rhône Alpes, Provence Alpes Côte d'Azur et Corse)'",
-            "Y7AGGLO5ST": "1 = 'Zone rurale (moins de 2 000 habitants)' ; 2 = 'Zone urbaine de 2 000 à 9 999 habitants' ; 3 = 'Zone urbaine de 10 000 à 49 999 habitants' ; 4 = 'Zone urbaine de 50 000 à 199 999 habitants' ; 5 = 'Zone urbaine de 200 000 habitants et plus'",
-            "Y7EMPST": "1 = 'Salarié (salarié à plein temps ou à temps partiel)' ; 2 = 'Indépendant (travaille à mon compte)' ; 3 = 'Sans emploi (ne travaille pas actuellement tout en recherchant un emploi ou non, personne au foyer, retraité, étudiant ou élève)'",
-            "Y7PCSIST": "1 = 'Agriculteur exploitant, artisan, commerçant, chef d entreprise' ; 2 = 'Cadre supérieur' ; 3 = 'Profession intermédiaire' ; 4 = 'Employé' ; 5 = 'Ouvrier' ; 6 = 'Retraité, inactif'",
-            "Y7EDUST": "1 = 'Aucun diplôme' ; 2 = 'CAP, BEP' ; 3 = 'Baccalauréat' ; 4 = 'Bac +2' ; 5 = 'Bac +3 et plus'",
-            "Y7REL1ST": "1 = 'Catholique' ; 2 = 'Juive' ; 3 = 'Musulmane' ; 4 = 'Autre religion (protestante, boudhiste ou autre)' ; 5 = 'Sans religion'",
-            "Y7ECO2ST2": "1 = 'Moins de 1 250 euros' ; 2 = 'De 1 250 euros à 1 999 euros' ; 3 = 'De 2 000 à 3 499 euros' ; 4 = 'De 3 500 à 4 999 euros' ; 5 = '5 000 euros et plus'",
-            "Y7INTPOLST": "1 = 'Beaucoup' ; 2 = 'Un peu' ; 3 = 'Pas vraiment' ; 4 = 'Pas du tout'",
-            "Y7Q7ST": "1 = 'Très à gauche' ; 2 = 'Plutôt à gauche' ; 3 = 'Au centre' ; 4 = 'Plutôt à droite' ; 5 = 'Très à droite'",
-            "Y7PROXST": "1 = 'Très à gauche (Lutte Ouvrière, Nouveau Parti Anticapitaliste, Parti Communiste Français, France Insoumise)' ; 2 = 'Gauche (Parti Socialiste, Europe Ecologie - Les Verts)' ; 3 = 'Centre (Renaissance, Le MoDem (Mouvement Démocrate), Horizons, UDI (Union des Démocrates et Indépendants))' ; 4 = 'Droite (Les Républicains)' ; 5 = 'Très à droite (Debout la France, Rassemblement national (ex Front National), Reconquête!)' ; 6 = 'Autre parti ou aucun parti'"
-        }
-        # définir un dictionnaire qui contient l'ordre figé des modalités pour chaque variable socio-démographique
-        dico_ordre_modalites = {
-            "Y7SEXEST": [
-                "Homme",
-                "Femme"
-            ],
-            "Y7AGERST": [
-                "18 à 24 ans",
-                "25 à 34 ans",
-                "35 à 49 ans",
-                "50 à 59 ans",
-                "60 ans et plus"
-            ],
-            "Y7REG13ST": [
-                "Ile de France",
-                "Nord et Est (Hauts de France, Grand Est et Bourgogne Franche Comté)",
-                "Ouest (Normandie, Bretagne, Pays de la Loire et Centre Val de Loire)",
-                "Sud ouest (Nouvelle Aquitaine et Occitanie)",
-                "Sud est (Auvergne Rhône Alpes, Provence Alpes Côte d'Azur et Corse)"
-            ],
-            "Y7AGGLO5ST": [
-                "Zone rurale (moins de 2 000 habitants)",
-                "Zone urbaine de 2 000 à 9 999 habitants",
-                "Zone urbaine de 10 000 à 49 999 habitants",
-                "Zone urbaine de 50 000 à 199 999 habitants",
-                "Zone urbaine de 200 000 habitants et plus"
-            ],
-            "Y7EMPST": [
-                "Salarié (salarié à plein temps ou à temps partiel)",
-                "Indépendant (travaille à mon compte)",
-                "Sans emploi (ne travaille pas actuellement tout en recherchant un emploi ou non, personne au foyer, retraité, étudiant ou élève)"
-            ],
-            "Y7PCSIST": [
-                "Agriculteur exploitant, artisan, commerçant, chef d entreprise",
-                "Cadre supérieur",
-                "Profession intermédiaire",
-                "Employé",
-                "Ouvrier",
-                "Retraité, inactif"
-            ],
-            "Y7EDUST": [
-                "Aucun diplôme",
-                "CAP, BEP",
-                "Baccalauréat",
-                "Bac +2",
-                "Bac +3 et plus"
-            ],
-            "Y7REL1ST": [
-                "Catholique",
-                "Juive",
-                "Musulmane",
-                "Autre religion (protestante, boudhiste ou autre)",
-                "Sans religion"
-            ],
-            "Y7ECO2ST2": [
-                "Moins de 1 250 euros",
-                "De 1 250 euros à 1 999 euros",
-                "De 2 000 à 3 499 euros",
-                "De 3 500 à 4 999 euros",
-                "5 000 euros et plus"
-            ],
-            "Y7INTPOLST": [
-                "Beaucoup",
-                "Un peu",
-                "Pas vraiment",
-                "Pas du tout"
-            ],
-            "Y7Q7ST": [
-                "Très à gauche",
-                "Plutôt à gauche",
-                "Au centre",
-                "Plutôt à droite",
-                "Très à droite"
-            ],
-            "Y7PROXST": [
-                "Très à gauche (Lutte Ouvrière, Nouveau Parti Anticapitaliste, Parti Communiste Français, France Insoumise)",
-                "Gauche (Parti Socialiste, Europe Ecologie - Les Verts)",
-                "Centre (Renaissance, Le MoDem (Mouvement Démocrate), Horizons, UDI (Union des Démocrates et Indépendants))",
-                "Droite (Les Républicains)",
-                "Très à droite (Debout la France, Rassemblement national (ex Front National), Reconquête!)",
-                "Autre parti ou aucun parti"
-            ]
-        }
-        # définir une fonction qui affiche les étiquettes
-        # des modalités de la variablr SD choisie dans la légende
-        # sur plusieurs lignes si leur longueur initiale dépasse la
-        # largeur du cadre de la légende (version robuste avec gestion des erreurs)
-        def wrap_label(label, max_length=20):
-            try:
-                # Si le label est un float ou NaN
-                if pd.isna(label) or isinstance(label, float):
-                    return "Non renseigné"
-                # Convertir en string si ce n'est pas déjà le cas
-                label = str(label).strip()
-                # Si la chaîne est vide après nettoyage
-                if not label:
-                    return "Non renseigné"
-                if len(label) <= max_length:
-                    return label
-                words = label.split()
-                lines = []
-                current_line = []
-                current_length = 0
-                for word in words:
-                    if current_length + len(word) > max_length:
-                        lines.append(' '.join(current_line))
-                        current_line = [word]
-                        current_length = len(word)
-                    else:
-                        current_line.append(word)
-                        current_length += len(word) + 1  
-                if current_line:
-                    lines.append(' '.join(current_line))
-                return '<br>'.join(lines)
-            except Exception as e:
-                print(f"Erreur dans wrap_label avec {label}: {str(e)}")
-                return str(label) 
-                # retourner le label tel quel en cas d'erreur
-        # lire le fichier CSV des données
-        csvfile = "data/T_w7_pl6st_" + "%s" % input.Select_VarSD_AccVues_Legis_T2().lower()[2:] + ".csv"
-        df = pd.read_csv(csvfile)
-        # nettoyer les données lues
-        var_sd = input.Select_VarSD_AccVues_Legis_T2()
-        df[var_sd] = df[var_sd].fillna("Non renseigné")  # Gérer les NaN
-        df[var_sd] = df[var_sd].astype(str)  # Convertir en string
-        df['Y7PL6ST'] = df['Y7PL6ST'].fillna("Non renseigné")
-        # s'assurer que toutes les modalités sont des chaînes de caractères dans "dico_ordre_modalites"
-        dico_ordre_modalites[var_sd] = [str(modal) for modal in dico_ordre_modalites[var_sd]]
-        # filtrer pour ne garder que les modalités définies dans "dico_ordre_modalites"
-        df = df[df[var_sd].isin(dico_ordre_modalites[var_sd])]
-        # définir l'ordre des modalités pour Y7PL6ST
-        ordre_modalites = [
-            "Souvent",
-            "Rarement ou jamais"
-        ]
-        # créer une colonne catégorielle avec l'ordre souhaité pour la variable socio-démographique
-        var_sd = input.Select_VarSD_AccVues_Legis_T2()
-        df[var_sd] = pd.Categorical(
-            df[var_sd],
-            categories=dico_ordre_modalites[var_sd],
-            ordered=True
-        )
-        # filtrer et pivoter les données
-        df_pivot = df[df['Y7PL6ST'].isin(ordre_modalites)].pivot(
-            index=var_sd,
-            columns='Y7PL6ST',
-            values='pct'
-        )
-        df_pivot = df_pivot.reindex(columns=ordre_modalites)
-        # créer une palette de couleurs automatique
-        nb_couleurs = len(df_pivot.index)
-        palette = px.colors.qualitative.Plotly[:nb_couleurs]
-        # créer le graphique
-        fig = go.Figure()
-        # ajouter les données
-        for i, VarSD in enumerate(df_pivot.index):
-            fig.add_trace(
-                go.Bar(
-                    x=ordre_modalites,
-                    y=df_pivot.loc[VarSD],
-                    name=wrap_label(VarSD),
-                    marker_color=palette[i],
-                    # afficher les valeurs sous le format 'xx.x%' dans la bulle qui s'affiche
-                    # au survol de la courbe par la souris, et supprimer toutes les autres
-                    # informations qui pourraient s'afficher en plus (nom de la modalité)
-                    hovertemplate='%{y:.1f}%<extra></extra>',
-                    # n'afficher la bulle contenant la valeur 'y' en % uniquement
-                    # au-dessus de la barre verticale survolée par la souris
-                    hoverinfo='y',
-                    # centrer ce texte 'y' dans la bulle
-                    hoverlabel=dict(
-                        align='auto'
-                    )
-                )
-            )
-         # mettre en forme le graphique
-        fig.update_layout(
-            barmode='group', # barres séparées et groupées pour les modalités de la VarSD choisie
-            title={
-                'text': "Accord de vues avec l'entourage en fonction %s" % dico_titre.get("%s" % input.Select_VarSD_AccVues_Legis_T2()),
-                'y':0.98,
-                'x':0.01,
-                'xanchor': 'left',
-                'yanchor': 'top'
-            },
-            # définir le titre de la légende
-            legend_title="%s" % dico_legende.get("%s" % input.Select_VarSD_AccVues_Legis_T2()),
-            # définir l'affichage séparé des valeurs de % affichées au-dessus de
-            # chaque barre verticale quand la souris la survole
-            hovermode="closest",
-            # définir le thème général de l'apparence du graphique
-            template="plotly_white",
-            # définir le titre de l'axe des ordonnées et son apparence
-            yaxis_title=dict(
-                text='Pourcentage de répondants (%)',
-                font_size=12
-            ),
-            # définir les sources des données
-            annotations=[
-                dict(
-                    xref='paper', # utiliser la largeur totale du graphique comme référence
-                    yref='paper', # utiliser la hauteur totale du graphique comme référence
-                    x=0.5, # placer le point d'ancrage au milieu de la largeur
-                    y=-0.1, # valeur à ajuster pour positionner verticalement le texte sous le graphique
-                    xanchor='center', # centrer le texte par rapport au point d'ancrage
-                    yanchor='top',
-                    text=
-                        'Enquête électorale française pour les ' +
-                        'élections européennes de juin 2024, ' +
-                        'par Ipsos Sopra Steria, Cevipof, ' +
-                        'Le Monde, Fondation Jean Jaurès et ' +
-                        'Institut Montaigne (2024)',
-                    font=dict(
-                        size=10,
-                        color='grey'
-                    ),
-                    showarrow=False
-                )
-            ],
-            # définir les marges de la zone graphique
-            # (augmentées à droite pour le cadre fixe de la légende)
-            margin=dict(
-                b=50, # b = bottom
-                t=50,  # t = top
-                l=50, # l = left
-                r=200 # r = right
-            ),
-            # fixer la position de la légende
-            legend=dict(
-                orientation="v",
-                valign='top',  # aligner le texte en haut de chaque marqueur de la légende
-                x=1.02, # position horizontale de la légende (1 = à droite du graphique)
-                y=1, # position verticale de la légende (1 = en haut)
-                xanchor='left', # ancrer la légende à gauche de sa position x
-                yanchor='top', # ancrer la légende en haut de sa position y
-                bgcolor='rgba(255,255,255,0.8)' # fond légèrement transparent
-            ),
-        )
-        # retourner le graphique
-        return fig
-
-
-    ###########################################################
-    # onglet 08 : AVIS SUR LES CONSEQUENCES DE LA DISSOLUTION #
-    ###########################################################
-
-    # bouton 01 : décrire la question posée dans l'enquête
-    @reactive.effect
-    @reactive.event(input.Show_AVCONSDISS_Question_Legis_T2)
-    def _():
-        m = ui.modal(
-            "La question posée aux répondants est la suivante : 'Diriez-vous que la décision d’Emmanuel Macron de dissoudre l’Assemblée nationale, et les résultats des élections législatives qui ont suivi cette décision, ont eu des conséquences positives ou négatives pour la France ?'",
-            title="Informations complémentaires sur la question contenue dans l'enquête :",
-            easy_close=False
-        )
-        ui.modal_show(m)
-
-    # bouton 02 : décrire la variable de l'intention d'aller voter choisie
-    @reactive.effect
-    @reactive.event(input.Show_AVCONSDISSST_Info_Legis_T2)
-    def _():
-        m = ui.modal(
-            "La variable sur l'avis sur les conséquences de la dissolution de l'Assemblée nationale de la part des répondants présentée ici sur les graphiques est une modalité synthétique de la question posée aux répondants de l'enquête. \
-            Ainsi, à partir des quatre modalités de réponse à la question de l'enquête, on en construit deux : 'Des conséquences positives (très positives ou plutôt positives)' ou 'Des conséquences négatives (très négatives ou plutôt négatives)'.",
-            title="Informations complémentaires sur la variable choisie pour les graphiques :",
-            easy_close=False
-        )
-        ui.modal_show(m)
-
-    # bouton 03 : afficher la description de la variable socio-démographique choisie
-    # avec plusieurs parties de texte qui dépendent de ce choix (via des dictionnaires)
-    @reactive.effect
-    @reactive.event(input.Show_VarSD_AvConsDiss_Info_Legis_T2)
-    def _():
-        # définir le nom de la variable socio-démographique choisie
-        dico_nom_var = {
-            "Y7SEXEST": "Genre",
-            "Y7AGERST": "Âge",
-            "Y7REG13ST": "Région",
-            "Y7AGGLO5ST": "Taille d'agglomération",
-            "Y7EMPST": "Type d'emploi occupé",
-            "Y7PCSIST": "Catégorie professionnelle",
-            "Y7EDUST": "Niveau de scolarité atteint",
-            "Y7REL1ST": "Religion",
-            "Y7ECO2ST2": "Revenu mensuel du foyer",
-            "Y7INTPOLST": "Intérêt pour la politique",
-            "Y7Q7ST": "Positionnement idéologique",
-            "Y7PROXST": "Préférence partisane"
-        }
-        # définir la question de l'enquête associée à la variable socio-démographique choisie
-        dico_question_var = {
-            "Y7SEXEST": "Êtes-vous ?",
-            "Y7AGERST": "Quelle est votre date de naissance ?",
-            "Y7REG13ST": "Veuillez indiquer le département et la commune où vous résidez.",
-            "Y7AGGLO5ST": "Veuillez indiquer le département et la commune où vous résidez.",
-            "Y7EMPST": "Quelle est votre situation professionnelle actuelle ?",
-            "Y7PCSIST": "Quelle est votre situation professionnelle actuelle ?",
-            "Y7EDUST": "Choisissez votre niveau de scolarité le plus élevé.",
-            "Y7REL1ST": "Quelle est votre religion, si vous en avez une ?",
-            "Y7ECO2ST2": " Pour finir, nous avons besoin de connaître, à des fins statistiques uniquement, la tranche dans laquelle se situe le revenu MENSUEL NET de votre FOYER après déduction des impôts sur le revenu (veuillez considérer toutes vos sources de revenus: salaires, bourses, prestations retraite et sécurité sociale, dividendes, revenus immobiliers, pensions alimentaires etc.).",
-            "Y7INTPOLST": "De manière générale, diriez-vous que vous vous intéressez à la politique ?",
-            "Y7Q7ST": "Sur une échelle de 0 à 10, où 0 correspond à la gauche et 10 correspond à la droite, où diriez-vous que vous vous situez ?",
-            "Y7PROXST": "De quel parti vous sentez-vous proche ou moins éloigné que les autres ?"
-        }
-        # définir les modalités de réponse à la question de l'enquête associée à la variable socio-démographique choisie
-        dico_modalite_var = {
-            "Y7SEXEST": "1 = 'Homme' ; 2 = 'Femme'",
-            "Y7AGERST": "1 = '18 à 24 ans' ; 2 = '25 à 34 ans' ; 3 = '35 à 49 ans' ; 4 = '50 à 59 ans' ; 5 = '60 ans et plus'",
-            "Y7REG13ST": "1 = 'Ile de France' ; 2 = 'Nord et Est (Hauts de France, Grand Est et Bourgogne Franche Comté)' ; 3 = 'Ouest (Normandie, Bretagne, Pays de la Loire et Centre Val de Loire)' ; 4 = 'Sud ouest (Nouvelle Aquitaine et Occitanie)' ; 5 = 'Sud est (Auvergne Rhône Alpes, Provence Alpes Côte d'Azur et Corse)'",
-            "Y7AGGLO5ST": "1 = 'Zone rurale (moins de 2 000 habitants)' ; 2 = 'Zone urbaine de 2 000 à 9 999 habitants' ; 3 = 'Zone urbaine de 10 000 à 49 999 habitants' ; 4 = 'Zone urbaine de 50 000 à 199 999 habitants' ; 5 = 'Zone urbaine de 200 000 habitants et plus'",
-            "Y7EMPST": "1 = 'Salarié (salarié à plein temps ou à temps partiel)' ; 2 = 'Indépendant (travaille à mon compte)' ; 3 = 'Sans emploi (ne travaille pas actuellement tout en recherchant un emploi ou non, personne au foyer, retraité, étudiant ou élève)'",
-            "Y7PCSIST": "1 = 'Agriculteur exploitant, artisan, commerçant, chef d entreprise' ; 2 = 'Cadre supérieur' ; 3 = 'Profession intermédiaire' ; 4 = 'Employé' ; 5 = 'Ouvrier' ; 6 = 'Retraité, inactif'",
-            "Y7EDUST": "1 = 'Aucun diplôme' ; 2 = 'CAP, BEP' ; 3 = 'Baccalauréat' ; 4 = 'Bac +2' ; 5 = 'Bac +3 et plus'",
-            "Y7REL1ST": "1 = 'Catholique' ; 2 = 'Juive' ; 3 = 'Musulmane' ; 4 = 'Autre religion (protestante, boudhiste ou autre)' ; 5 = 'Sans religion'",
-            "Y7ECO2ST2": "1 = 'Moins de 1 250 euros' ; 2 = 'De 1 250 euros à 1 999 euros' ; 3 = 'De 2 000 à 3 499 euros' ; 4 = 'De 3 500 à 4 999 euros' ; 5 = '5 000 euros et plus'",
-            "Y7INTPOLST": "1 = 'Beaucoup' ; 2 = 'Un peu' ; 3 = 'Pas vraiment' ; 4 = 'Pas du tout'",
-            "Y7Q7ST": "1 = 'Très à gauche' ; 2 = 'Plutôt à gauche' ; 3 = 'Au centre' ; 4 = 'Plutôt à droite' ; 5 = 'Très à droite'",
-            "Y7PROXST": "1 = 'Extême gauche (Lutte Ouvrière, Nouveau Parti Anticapitaliste, Parti Communiste Français, France Insoumise)' ; 2 = 'Gauche (Parti Socialiste, Europe Ecologie - Les Verts)' ; 3 = 'Centre (Renaissance, Le MoDem (Mouvement Démocrate), Horizons, UDI (Union des Démocrates et Indépendants))' ; 4 = 'Droite (Les Républicains)' ; 5 = 'Très à droite (Debout la France, Rassemblement national (ex Front National), Reconquête!)' ; 6 = 'Autre parti ou aucun parti'"
-        }
-        # définir le texte complet à afficher (avec parties fixes et variables en fonction du choix effectué)
-        m = ui.modal(
-            "La variable '%s' correspond à ou est calculée à partir de la question suivante posée aux répondants : \
-            '%s', \
-            et ses modalités de réponse (inchangées par rapport au questionnaire ou regroupées pour les présents graphiques) sont : \
-            %s." % (
-                dico_nom_var.get(
-                    "%s" % input.Select_VarSD_AvConsDiss_Legis_T2()
-                ),
-                dico_question_var.get("%s" % input.Select_VarSD_AvConsDiss_Legis_T2()),
-                dico_modalite_var.get("%s" % input.Select_VarSD_AvConsDiss_Legis_T2())
-            ),
-            title="Informations complémentaires sur la variable socio-démographique choisie :",
-            easy_close=False
-        )
-        ui.modal_show(m)
-
-    # graphique
-    @output
-    @render_plotly
-    def Graph_Croise_AvConsDiss_Legis_T2():
-        # définir la partie variable du titre
-        dico_titre = {
-            "Y7SEXEST": "du genre",
-            "Y7AGERST": "de l'âge",
-            "Y7REG13ST": "de la région de résidence",
-            "Y7AGGLO5ST": "de la taille de l'agglomération de résidence",
-            "Y7EMPST": "du type d'emploi occupé",
-            "Y7PCSIST": "de la catégorie socio-professionnelle",
-            "Y7EDUST": "du niveau de scolarité atteint",
-            "Y7REL1ST": "de la religion",
-            "Y7ECO2ST2": "du revenu mensuel du foyer",
-            "Y7INTPOLST": "de l'intérêt pour la politique",
-            "Y7Q7ST": "du positionnement idéologique",
-            "Y7PROXST": "de la préférence partisane"
-        }
-        # définir la partie variable du titre de la légende
-        dico_legende = {
-            "Y7SEXEST": "Genre",
-            "Y7AGERST": "Âge",
-            "Y7REG13ST": "Région",
-            "Y7AGGLO5ST": "Taille d'agglomération",
-            "Y7EMPST": "Type d'emploi occupé",
-            "Y7PCSIST": "Catégorie professionnelle",
-            "Y7EDUST": "Niveau de scolarité atteint",
-            "Y7REL1ST": "Religion",
-            "Y7ECO2ST2": "Revenu mensuel du foyer",
-            "Y7INTPOLST": "Intérêt pour la politique",
-            "Y7Q7ST": "Positionnement idéologique",
-            "Y7PROXST": "Préférence partisane"
-        }
-        # définir l'échelle de l'axe des ordonnées en fonction des
-        # valeurs prises par la variable socio-démographique choisie
-        dico_echelleY = {
-            "Y7SEXEST": [10, 40],
-            "Y7AGERST": [10, 45],
-            "Y7REG13ST": [15, 35],
-            "Y7AGGLO5ST": [15, 35],
-            "Y7EMPST": [15, 40],
-            "Y7PCSIST": [10, 45],
-            "Y7EDUST": [15, 40],
-            "Y7REL1ST": [10, 45],
-            "Y7ECO2ST2": [10, 45],
-            "Y7INTPOLST": [0, 75],
-            "Y7Q7ST": [5, 40],
-            "Y7PROXST": [5, 55],
-        }
-        # définir les modalités des variables socio-démo et leur ordre
-        dico_modalite_var = {
-            "Y7SEXEST": "1 = 'Homme' ; 2 = 'Femme'",
-            "Y7AGERST": "1 = '18 à 24 ans' ; 2 = '25 à 34 ans' ; 3 = '35 à 49 ans' ; 4 = '50 à 59 ans' ; 5 = '60 ans et plus'",
-            "Y7REG13ST": "1 = 'Ile de France' ; 2 = 'Nord et Est (Hauts de France, Grand Est et Bourgogne Franche Comté)' ; 3 = 'Ouest (Normandie, Bretagne, Pays de la Loire et Centre Val de Loire)' ; 4 = 'Sud ouest (Nouvelle Aquitaine et Occitanie)' ; 5 = 'Sud est (Auvergne Rhône Alpes, Provence Alpes Côte d'Azur et Corse)'",
-            "Y7AGGLO5ST": "1 = 'Zone rurale (moins de 2 000 habitants)' ; 2 = 'Zone urbaine de 2 000 à 9 999 habitants' ; 3 = 'Zone urbaine de 10 000 à 49 999 habitants' ; 4 = 'Zone urbaine de 50 000 à 199 999 habitants' ; 5 = 'Zone urbaine de 200 000 habitants et plus'",
-            "Y7EMPST": "1 = 'Salarié (salarié à plein temps ou à temps partiel)' ; 2 = 'Indépendant (travaille à mon compte)' ; 3 = 'Sans emploi (ne travaille pas actuellement tout en recherchant un emploi ou non, personne au foyer, retraité, étudiant ou élève)'",
-            "Y7PCSIST": "1 = 'Agriculteur exploitant, artisan, commerçant, chef d entreprise' ; 2 = 'Cadre supérieur' ; 3 = 'Profession intermédiaire' ; 4 = 'Employé' ; 5 = 'Ouvrier' ; 6 = 'Retraité, inactif'",
-            "Y7EDUST": "1 = 'Aucun diplôme' ; 2 = 'CAP, BEP' ; 3 = 'Baccalauréat' ; 4 = 'Bac +2' ; 5 = 'Bac +3 et plus'",
-            "Y7REL1ST": "1 = 'Catholique' ; 2 = 'Juive' ; 3 = 'Musulmane' ; 4 = 'Autre religion (protestante, boudhiste ou autre)' ; 5 = 'Sans religion'",
-            "Y7ECO2ST2": "1 = 'Moins de 1 250 euros' ; 2 = 'De 1 250 euros à 1 999 euros' ; 3 = 'De 2 000 à 3 499 euros' ; 4 = 'De 3 500 à 4 999 euros' ; 5 = '5 000 euros et plus'",
-            "Y7INTPOLST": "1 = 'Beaucoup' ; 2 = 'Un peu' ; 3 = 'Pas vraiment' ; 4 = 'Pas du tout'",
-            "Y7Q7ST": "1 = 'Très à gauche' ; 2 = 'Plutôt à gauche' ; 3 = 'Au centre' ; 4 = 'Plutôt à droite' ; 5 = 'Très à droite'",
-            "Y7PROXST": "1 = 'Très à gauche (Lutte Ouvrière, Nouveau Parti Anticapitaliste, Parti Communiste Français, France Insoumise)' ; 2 = 'Gauche (Parti Socialiste, Europe Ecologie - Les Verts)' ; 3 = 'Centre (Renaissance, Le MoDem (Mouvement Démocrate), Horizons, UDI (Union des Démocrates et Indépendants))' ; 4 = 'Droite (Les Républicains)' ; 5 = 'Très à droite (Debout la France, Rassemblement national (ex Front National), Reconquête!)' ; 6 = 'Autre parti ou aucun parti'"
-        }
-        # définir un dictionnaire qui contient l'ordre figé des modalités pour chaque variable socio-démographique
-        dico_ordre_modalites = {
-            "Y7SEXEST": [
-                "Homme",
-                "Femme"
-            ],
-            "Y7AGERST": [
-                "18 à 24 ans",
-                "25 à 34 ans",
-                "35 à 49 ans",
-                "50 à 59 ans",
-                "60 ans et plus"
-            ],
-            "Y7REG13ST": [
-                "Ile de France",
-                "Nord et Est (Hauts de France, Grand Est et Bourgogne Franche Comté)",
-                "Ouest (Normandie, Bretagne, Pays de la Loire et Centre Val de Loire)",
-                "Sud ouest (Nouvelle Aquitaine et Occitanie)",
-                "Sud est (Auvergne Rhône Alpes, Provence Alpes Côte d'Azur et Corse)"
-            ],
-            "Y7AGGLO5ST": [
-                "Zone rurale (moins de 2 000 habitants)",
-                "Zone urbaine de 2 000 à 9 999 habitants",
-                "Zone urbaine de 10 000 à 49 999 habitants",
-                "Zone urbaine de 50 000 à 199 999 habitants",
-                "Zone urbaine de 200 000 habitants et plus"
-            ],
-            "Y7EMPST": [
-                "Salarié (salarié à plein temps ou à temps partiel)",
-                "Indépendant (travaille à mon compte)",
-                "Sans emploi (ne travaille pas actuellement tout en recherchant un emploi ou non, personne au foyer, retraité, étudiant ou élève)"
-            ],
-            "Y7PCSIST": [
-                "Agriculteur exploitant, artisan, commerçant, chef d entreprise",
-                "Cadre supérieur",
-                "Profession intermédiaire",
-                "Employé",
-                "Ouvrier",
-                "Retraité, inactif"
-            ],
-            "Y7EDUST": [
-                "Aucun diplôme",
-                "CAP, BEP",
-                "Baccalauréat",
-                "Bac +2",
-                "Bac +3 et plus"
-            ],
-            "Y7REL1ST": [
-                "Catholique",
-                "Juive",
-                "Musulmane",
-                "Autre religion (protestante, boudhiste ou autre)",
-                "Sans religion"
-            ],
-            "Y7ECO2ST2": [
-                "Moins de 1 250 euros",
-                "De 1 250 euros à 1 999 euros",
-                "De 2 000 à 3 499 euros",
-                "De 3 500 à 4 999 euros",
-                "5 000 euros et plus"
-            ],
-            "Y7INTPOLST": [
-                "Beaucoup",
-                "Un peu",
-                "Pas vraiment",
-                "Pas du tout"
-            ],
-            "Y7Q7ST": [
-                "Très à gauche",
-                "Plutôt à gauche",
-                "Au centre",
-                "Plutôt à droite",
-                "Très à droite"
-            ],
-            "Y7PROXST": [
-                "Très à gauche (Lutte Ouvrière, Nouveau Parti Anticapitaliste, Parti Communiste Français, France Insoumise)",
-                "Gauche (Parti Socialiste, Europe Ecologie - Les Verts)",
-                "Centre (Renaissance, Le MoDem (Mouvement Démocrate), Horizons, UDI (Union des Démocrates et Indépendants))",
-                "Droite (Les Républicains)",
-                "Très à droite (Debout la France, Rassemblement national (ex Front National), Reconquête!)",
-                "Autre parti ou aucun parti"
-            ]
-        }
-        # définir une fonction qui affiche les étiquettes
-        # des modalités de la variablr SD choisie dans la légende
-        # sur plusieurs lignes si leur longueur initiale dépasse la
-        # largeur du cadre de la légende (version robuste avec gestion des erreurs)
-        def wrap_label(label, max_length=20):
-            try:
-                # Si le label est un float ou NaN
-                if pd.isna(label) or isinstance(label, float):
-                    return "Non renseigné"
-                # Convertir en string si ce n'est pas déjà le cas
-                label = str(label).strip()
-                # Si la chaîne est vide après nettoyage
-                if not label:
-                    return "Non renseigné"
-                if len(label) <= max_length:
-                    return label
-                words = label.split()
-                lines = []
-                current_line = []
-                current_length = 0
-                for word in words:
-                    if current_length + len(word) > max_length:
-                        lines.append(' '.join(current_line))
-                        current_line = [word]
-                        current_length = len(word)
-                    else:
-                        current_line.append(word)
-                        current_length += len(word) + 1  
-                if current_line:
-                    lines.append(' '.join(current_line))
-                return '<br>'.join(lines)
-            except Exception as e:
-                print(f"Erreur dans wrap_label avec {label}: {str(e)}")
-                return str(label) 
-                # retourner le label tel quel en cas d'erreur
-        # lire le fichier CSV des données
-        csvfile = "data/T_w7_pl13st_" + "%s" % input.Select_VarSD_AvConsDiss_Legis_T2().lower()[2:] + ".csv"
-        df = pd.read_csv(csvfile)
-        # nettoyer les données lues
-        var_sd = input.Select_VarSD_AvConsDiss_Legis_T2()
-        df[var_sd] = df[var_sd].fillna("Non renseigné")  # Gérer les NaN
-        df[var_sd] = df[var_sd].astype(str)  # Convertir en string
-        df['Y7PL13ST'] = df['Y7PL13ST'].fillna("Non renseigné")
-        # s'assurer que toutes les modalités sont des chaînes de caractères dans "dico_ordre_modalites"
-        dico_ordre_modalites[var_sd] = [str(modal) for modal in dico_ordre_modalites[var_sd]]
-        # filtrer pour ne garder que les modalités définies dans "dico_ordre_modalites"
-        df = df[df[var_sd].isin(dico_ordre_modalites[var_sd])]
-        # définir l'ordre des modalités pour Y7PL13ST
-        ordre_modalites = [
-            "Des conséquences positives",
-            "Des conséquences négatives"
-        ]
-        # créer une colonne catégorielle avec l'ordre souhaité pour la variable socio-démographique
-        var_sd = input.Select_VarSD_AvConsDiss_Legis_T2()
-        df[var_sd] = pd.Categorical(
-            df[var_sd],
-            categories=dico_ordre_modalites[var_sd],
-            ordered=True
-        )
-        # filtrer et pivoter les données
-        df_pivot = df[df['Y7PL13ST'].isin(ordre_modalites)].pivot(
-            index=var_sd,
-            columns='Y7PL13ST',
-            values='pct'
-        )
-        df_pivot = df_pivot.reindex(columns=ordre_modalites)
-        # créer une palette de couleurs automatique
-        nb_couleurs = len(df_pivot.index)
-        palette = px.colors.qualitative.Plotly[:nb_couleurs]
-        # créer le graphique
-        fig = go.Figure()
-        # ajouter les données
-        for i, VarSD in enumerate(df_pivot.index):
-            fig.add_trace(
-                go.Bar(
-                    x=ordre_modalites,
-                    y=df_pivot.loc[VarSD],
-                    name=wrap_label(VarSD),
-                    marker_color=palette[i],
-                    # afficher les valeurs sous le format 'xx.x%' dans la bulle qui s'affiche
-                    # au survol de la courbe par la souris, et supprimer toutes les autres
-                    # informations qui pourraient s'afficher en plus (nom de la modalité)
-                    hovertemplate='%{y:.1f}%<extra></extra>',
-                    # n'afficher la bulle contenant la valeur 'y' en % uniquement
-                    # au-dessus de la barre verticale survolée par la souris
-                    hoverinfo='y',
-                    # centrer ce texte 'y' dans la bulle
-                    hoverlabel=dict(
-                        align='auto'
-                    )
-                )
-            )
-         # mettre en forme le graphique
-        fig.update_layout(
-            barmode='group', # barres séparées et groupées pour les modalités de la VarSD choisie
-            title={
-                'text': "Avis sur les conséquences de la dissolution en fonction %s" % dico_titre.get("%s" % input.Select_VarSD_AvConsDiss_Legis_T2()),
-                'y':0.98,
-                'x':0.01,
-                'xanchor': 'left',
-                'yanchor': 'top'
-            },
-            # définir le titre de la légende
-            legend_title="%s" % dico_legende.get("%s" % input.Select_VarSD_AvConsDiss_Legis_T2()),
-            # définir l'affichage séparé des valeurs de % affichées au-dessus de
-            # chaque barre verticale quand la souris la survole
-            hovermode="closest",
-            # définir le thème général de l'apparence du graphique
-            template="plotly_white",
-            # définir le titre de l'axe des ordonnées et son apparence
-            yaxis_title=dict(
-                text='Pourcentage de répondants (%)',
-                font_size=12
-            ),
-            # définir les sources des données
-            annotations=[
-                dict(
-                    xref='paper', # utiliser la largeur totale du graphique comme référence
-                    yref='paper', # utiliser la hauteur totale du graphique comme référence
-                    x=0.5, # placer le point d'ancrage au milieu de la largeur
-                    y=-0.1, # valeur à ajuster pour positionner verticalement le texte sous le graphique
-                    xanchor='center', # centrer le texte par rapport au point d'ancrage
-                    yanchor='top',
-                    text=
-                        'Enquête électorale française pour les ' +
-                        'élections européennes de juin 2024, ' +
-                        'par Ipsos Sopra Steria, Cevipof, ' +
-                        'Le Monde, Fondation Jean Jaurès et ' +
-                        'Institut Montaigne (2024)',
-                    font=dict(
-                        size=10,
-                        color='grey'
-                    ),
-                    showarrow=False
-                )
-            ],
-            # définir les marges de la zone graphique
-            # (augmentées à droite pour le cadre fixe de la légende)
-            margin=dict(
-                b=50, # b = bottom
-                t=50,  # t = top
-                l=50, # l = left
-                r=200 # r = right
-            ),
-            # fixer la position de la légende
-            legend=dict(
-                orientation="v",
-                valign='top',  # aligner le texte en haut de chaque marqueur de la légende
-                x=1.02, # position horizontale de la légende (1 = à droite du graphique)
-                y=1, # position verticale de la légende (1 = en haut)
-                xanchor='left', # ancrer la légende à gauche de sa position x
-                yanchor='top', # ancrer la légende en haut de sa position y
-                bgcolor='rgba(255,255,255,0.8)' # fond légèrement transparent
-            ),
-        )
-        # retourner le graphique
-        return fig
-
-
-    #####################################################################
-    # onglet 09 : DEGRE DE CONFIANCE EN LA NOUVELLE ASSEMBLEE NATIONALE #
-    #####################################################################
-
-    # bouton 01 : décrire la question posée dans l'enquête
-    @reactive.effect
-    @reactive.event(input.Show_DEGCONFAN_Question_Legis_T2)
-    def _():
-        m = ui.modal(
-            "La question posée aux répondants est la suivante : 'Diriez-vous que vous avez confiance ou non dans la nouvelle Assemblée nationale, issue des élections législatives des 30 juin et 7 juillet dernier ?'",
-            title="Informations complémentaires sur la question contenue dans l'enquête :",
-            easy_close=False
-        )
-        ui.modal_show(m)
-
-    # bouton 02 : décrire la variable de l'intention d'aller voter choisie
-    @reactive.effect
-    @reactive.event(input.Show_DEGCONFANST_Info_Legis_T2)
-    def _():
-        m = ui.modal(
-            "La variable sur le degré de confiance des répondants envers la nouvelle Assemblée nationale présentée ici sur les graphiques est une modalité synthétique de la question posée aux répondants de l'enquête. \
-            Ainsi, à partir des quatre modalités de réponse à la question de l'enquête, on en construit deux : 'Confiance (tout à fait confiance ou plutôt confiance)' ou 'Pas confiance (pas du tout confiance ou plutôt pas confiance)'.",
-            title="Informations complémentaires sur la variable choisie pour les graphiques :",
-            easy_close=False
-        )
-        ui.modal_show(m)
-
-    # bouton 03 : afficher la description de la variable socio-démographique choisie
-    # avec plusieurs parties de texte qui dépendent de ce choix (via des dictionnaires)
-    @reactive.effect
-    @reactive.event(input.Show_VarSD_DegConfAN_Info_Legis_T2)
-    def _():
-        # définir le nom de la variable socio-démographique choisie
-        dico_nom_var = {
-            "Y7SEXEST": "Genre",
-            "Y7AGERST": "Âge",
-            "Y7REG13ST": "Région",
-            "Y7AGGLO5ST": "Taille d'agglomération",
-            "Y7EMPST": "Type d'emploi occupé",
-            "Y7PCSIST": "Catégorie professionnelle",
-            "Y7EDUST": "Niveau de scolarité atteint",
-            "Y7REL1ST": "Religion",
-            "Y7ECO2ST2": "Revenu mensuel du foyer",
-            "Y7INTPOLST": "Intérêt pour la politique",
-            "Y7Q7ST": "Positionnement idéologique",
-            "Y7PROXST": "Préférence partisane"
-        }
-        # définir la question de l'enquête associée à la variable socio-démographique choisie
-        dico_question_var = {
-            "Y7SEXEST": "Êtes-vous ?",
-            "Y7AGERST": "Quelle est votre date de naissance ?",
-            "Y7REG13ST": "Veuillez indiquer le département et la commune où vous résidez.",
-            "Y7AGGLO5ST": "Veuillez indiquer le département et la commune où vous résidez.",
-            "Y7EMPST": "Quelle est votre situation professionnelle actuelle ?",
-            "Y7PCSIST": "Quelle est votre situation professionnelle actuelle ?",
-            "Y7EDUST": "Choisissez votre niveau de scolarité le plus élevé.",
-            "Y7REL1ST": "Quelle est votre religion, si vous en avez une ?",
-            "Y7ECO2ST2": " Pour finir, nous avons besoin de connaître, à des fins statistiques uniquement, la tranche dans laquelle se situe le revenu MENSUEL NET de votre FOYER après déduction des impôts sur le revenu (veuillez considérer toutes vos sources de revenus: salaires, bourses, prestations retraite et sécurité sociale, dividendes, revenus immobiliers, pensions alimentaires etc.).",
-            "Y7INTPOLST": "De manière générale, diriez-vous que vous vous intéressez à la politique ?",
-            "Y7Q7ST": "Sur une échelle de 0 à 10, où 0 correspond à la gauche et 10 correspond à la droite, où diriez-vous que vous vous situez ?",
-            "Y7PROXST": "De quel parti vous sentez-vous proche ou moins éloigné que les autres ?"
-        }
-        # définir les modalités de réponse à la question de l'enquête associée à la variable socio-démographique choisie
-        dico_modalite_var = {
-            "Y7SEXEST": "1 = 'Homme' ; 2 = 'Femme'",
-            "Y7AGERST": "1 = '18 à 24 ans' ; 2 = '25 à 34 ans' ; 3 = '35 à 49 ans' ; 4 = '50 à 59 ans' ; 5 = '60 ans et plus'",
-            "Y7REG13ST": "1 = 'Ile de France' ; 2 = 'Nord et Est (Hauts de France, Grand Est et Bourgogne Franche Comté)' ; 3 = 'Ouest (Normandie, Bretagne, Pays de la Loire et Centre Val de Loire)' ; 4 = 'Sud ouest (Nouvelle Aquitaine et Occitanie)' ; 5 = 'Sud est (Auvergne Rhône Alpes, Provence Alpes Côte d'Azur et Corse)'",
-            "Y7AGGLO5ST": "1 = 'Zone rurale (moins de 2 000 habitants)' ; 2 = 'Zone urbaine de 2 000 à 9 999 habitants' ; 3 = 'Zone urbaine de 10 000 à 49 999 habitants' ; 4 = 'Zone urbaine de 50 000 à 199 999 habitants' ; 5 = 'Zone urbaine de 200 000 habitants et plus'",
-            "Y7EMPST": "1 = 'Salarié (salarié à plein temps ou à temps partiel)' ; 2 = 'Indépendant (travaille à mon compte)' ; 3 = 'Sans emploi (ne travaille pas actuellement tout en recherchant un emploi ou non, personne au foyer, retraité, étudiant ou élève)'",
-            "Y7PCSIST": "1 = 'Agriculteur exploitant, artisan, commerçant, chef d entreprise' ; 2 = 'Cadre supérieur' ; 3 = 'Profession intermédiaire' ; 4 = 'Employé' ; 5 = 'Ouvrier' ; 6 = 'Retraité, inactif'",
-            "Y7EDUST": "1 = 'Aucun diplôme' ; 2 = 'CAP, BEP' ; 3 = 'Baccalauréat' ; 4 = 'Bac +2' ; 5 = 'Bac +3 et plus'",
-            "Y7REL1ST": "1 = 'Catholique' ; 2 = 'Juive' ; 3 = 'Musulmane' ; 4 = 'Autre religion (protestante, boudhiste ou autre)' ; 5 = 'Sans religion'",
-            "Y7ECO2ST2": "1 = 'Moins de 1 250 euros' ; 2 = 'De 1 250 euros à 1 999 euros' ; 3 = 'De 2 000 à 3 499 euros' ; 4 = 'De 3 500 à 4 999 euros' ; 5 = '5 000 euros et plus'",
-            "Y7INTPOLST": "1 = 'Beaucoup' ; 2 = 'Un peu' ; 3 = 'Pas vraiment' ; 4 = 'Pas du tout'",
-            "Y7Q7ST": "1 = 'Très à gauche' ; 2 = 'Plutôt à gauche' ; 3 = 'Au centre' ; 4 = 'Plutôt à droite' ; 5 = 'Très à droite'",
-            "Y7PROXST": "1 = 'Extême gauche (Lutte Ouvrière, Nouveau Parti Anticapitaliste, Parti Communiste Français, France Insoumise)' ; 2 = 'Gauche (Parti Socialiste, Europe Ecologie - Les Verts)' ; 3 = 'Centre (Renaissance, Le MoDem (Mouvement Démocrate), Horizons, UDI (Union des Démocrates et Indépendants))' ; 4 = 'Droite (Les Républicains)' ; 5 = 'Très à droite (Debout la France, Rassemblement national (ex Front National), Reconquête!)' ; 6 = 'Autre parti ou aucun parti'"
-        }
-        # définir le texte complet à afficher (avec parties fixes et variables en fonction du choix effectué)
-        m = ui.modal(
-            "La variable '%s' correspond à ou est calculée à partir de la question suivante posée aux répondants : \
-            '%s', \
-            et ses modalités de réponse (inchangées par rapport au questionnaire ou regroupées pour les présents graphiques) sont : \
-            %s." % (
-                dico_nom_var.get(
-                    "%s" % input.Select_VarSD_DegConfAN_Legis_T2()
-                ),
-                dico_question_var.get("%s" % input.Select_VarSD_DegConfAN_Legis_T2()),
-                dico_modalite_var.get("%s" % input.Select_VarSD_DegConfAN_Legis_T2())
-            ),
-            title="Informations complémentaires sur la variable socio-démographique choisie :",
-            easy_close=False
-        )
-        ui.modal_show(m)
-
-    # graphique
-    @output
-    @render_plotly
-    def Graph_Croise_DegConfAN_Legis_T2():
-        # définir la partie variable du titre
-        dico_titre = {
-            "Y7SEXEST": "du genre",
-            "Y7AGERST": "de l'âge",
-            "Y7REG13ST": "de la région de résidence",
-            "Y7AGGLO5ST": "de la taille de l'agglomération de résidence",
-            "Y7EMPST": "du type d'emploi occupé",
-            "Y7PCSIST": "de la catégorie socio-professionnelle",
-            "Y7EDUST": "du niveau de scolarité atteint",
-            "Y7REL1ST": "de la religion",
-            "Y7ECO2ST2": "du revenu mensuel du foyer",
-            "Y7INTPOLST": "de l'intérêt pour la politique",
-            "Y7Q7ST": "du positionnement idéologique",
-            "Y7PROXST": "de la préférence partisane"
-        }
-        # définir la partie variable du titre de la légende
-        dico_legende = {
-            "Y7SEXEST": "Genre",
-            "Y7AGERST": "Âge",
-            "Y7REG13ST": "Région",
-            "Y7AGGLO5ST": "Taille d'agglomération",
-            "Y7EMPST": "Type d'emploi occupé",
-            "Y7PCSIST": "Catégorie professionnelle",
-            "Y7EDUST": "Niveau de scolarité atteint",
-            "Y7REL1ST": "Religion",
-            "Y7ECO2ST2": "Revenu mensuel du foyer",
-            "Y7INTPOLST": "Intérêt pour la politique",
-            "Y7Q7ST": "Positionnement idéologique",
-            "Y7PROXST": "Préférence partisane"
-        }
-        # définir l'échelle de l'axe des ordonnées en fonction des
-        # valeurs prises par la variable socio-démographique choisie
-        dico_echelleY = {
-            "Y7SEXEST": [10, 40],
-            "Y7AGERST": [10, 45],
-            "Y7REG13ST": [15, 35],
-            "Y7AGGLO5ST": [15, 35],
-            "Y7EMPST": [15, 40],
-            "Y7PCSIST": [10, 45],
-            "Y7EDUST": [15, 40],
-            "Y7REL1ST": [10, 45],
-            "Y7ECO2ST2": [10, 45],
-            "Y7INTPOLST": [0, 75],
-            "Y7Q7ST": [5, 40],
-            "Y7PROXST": [5, 55],
-        }
-        # définir les modalités des variables socio-démo et leur ordre
-        dico_modalite_var = {
-            "Y7SEXEST": "1 = 'Homme' ; 2 = 'Femme'",
-            "Y7AGERST": "1 = '18 à 24 ans' ; 2 = '25 à 34 ans' ; 3 = '35 à 49 ans' ; 4 = '50 à 59 ans' ; 5 = '60 ans et plus'",
-            "Y7REG13ST": "1 = 'Ile de France' ; 2 = 'Nord et Est (Hauts de France, Grand Est et Bourgogne Franche Comté)' ; 3 = 'Ouest (Normandie, Bretagne, Pays de la Loire et Centre Val de Loire)' ; 4 = 'Sud ouest (Nouvelle Aquitaine et Occitanie)' ; 5 = 'Sud est (Auvergne Rhône Alpes, Provence Alpes Côte d'Azur et Corse)'",
-            "Y7AGGLO5ST": "1 = 'Zone rurale (moins de 2 000 habitants)' ; 2 = 'Zone urbaine de 2 000 à 9 999 habitants' ; 3 = 'Zone urbaine de 10 000 à 49 999 habitants' ; 4 = 'Zone urbaine de 50 000 à 199 999 habitants' ; 5 = 'Zone urbaine de 200 000 habitants et plus'",
-            "Y7EMPST": "1 = 'Salarié (salarié à plein temps ou à temps partiel)' ; 2 = 'Indépendant (travaille à mon compte)' ; 3 = 'Sans emploi (ne travaille pas actuellement tout en recherchant un emploi ou non, personne au foyer, retraité, étudiant ou élève)'",
-            "Y7PCSIST": "1 = 'Agriculteur exploitant, artisan, commerçant, chef d entreprise' ; 2 = 'Cadre supérieur' ; 3 = 'Profession intermédiaire' ; 4 = 'Employé' ; 5 = 'Ouvrier' ; 6 = 'Retraité, inactif'",
-            "Y7EDUST": "1 = 'Aucun diplôme' ; 2 = 'CAP, BEP' ; 3 = 'Baccalauréat' ; 4 = 'Bac +2' ; 5 = 'Bac +3 et plus'",
-            "Y7REL1ST": "1 = 'Catholique' ; 2 = 'Juive' ; 3 = 'Musulmane' ; 4 = 'Autre religion (protestante, boudhiste ou autre)' ; 5 = 'Sans religion'",
-            "Y7ECO2ST2": "1 = 'Moins de 1 250 euros' ; 2 = 'De 1 250 euros à 1 999 euros' ; 3 = 'De 2 000 à 3 499 euros' ; 4 = 'De 3 500 à 4 999 euros' ; 5 = '5 000 euros et plus'",
-            "Y7INTPOLST": "1 = 'Beaucoup' ; 2 = 'Un peu' ; 3 = 'Pas vraiment' ; 4 = 'Pas du tout'",
-            "Y7Q7ST": "1 = 'Très à gauche' ; 2 = 'Plutôt à gauche' ; 3 = 'Au centre' ; 4 = 'Plutôt à droite' ; 5 = 'Très à droite'",
-            "Y7PROXST": "1 = 'Très à gauche (Lutte Ouvrière, Nouveau Parti Anticapitaliste, Parti Communiste Français, France Insoumise)' ; 2 = 'Gauche (Parti Socialiste, Europe Ecologie - Les Verts)' ; 3 = 'Centre (Renaissance, Le MoDem (Mouvement Démocrate), Horizons, UDI (Union des Démocrates et Indépendants))' ; 4 = 'Droite (Les Républicains)' ; 5 = 'Très à droite (Debout la France, Rassemblement national (ex Front National), Reconquête!)' ; 6 = 'Autre parti ou aucun parti'"
-        }
-        # définir un dictionnaire qui contient l'ordre figé des modalités pour chaque variable socio-démographique
-        dico_ordre_modalites = {
-            "Y7SEXEST": [
-                "Homme",
-                "Femme"
-            ],
-            "Y7AGERST": [
-                "18 à 24 ans",
-                "25 à 34 ans",
-                "35 à 49 ans",
-                "50 à 59 ans",
-                "60 ans et plus"
-            ],
-            "Y7REG13ST": [
-                "Ile de France",
-                "Nord et Est (Hauts de France, Grand Est et Bourgogne Franche Comté)",
-                "Ouest (Normandie, Bretagne, Pays de la Loire et Centre Val de Loire)",
-                "Sud ouest (Nouvelle Aquitaine et Occitanie)",
-                "Sud est (Auvergne Rhône Alpes, Provence Alpes Côte d'Azur et Corse)"
-            ],
-            "Y7AGGLO5ST": [
-                "Zone rurale (moins de 2 000 habitants)",
-                "Zone urbaine de 2 000 à 9 999 habitants",
-                "Zone urbaine de 10 000 à 49 999 habitants",
-                "Zone urbaine de 50 000 à 199 999 habitants",
-                "Zone urbaine de 200 000 habitants et plus"
-            ],
-            "Y7EMPST": [
-                "Salarié (salarié à plein temps ou à temps partiel)",
-                "Indépendant (travaille à mon compte)",
-                "Sans emploi (ne travaille pas actuellement tout en recherchant un emploi ou non, personne au foyer, retraité, étudiant ou élève)"
-            ],
-            "Y7PCSIST": [
-                "Agriculteur exploitant, artisan, commerçant, chef d entreprise",
-                "Cadre supérieur",
-                "Profession intermédiaire",
-                "Employé",
-                "Ouvrier",
-                "Retraité, inactif"
-            ],
-            "Y7EDUST": [
-                "Aucun diplôme",
-                "CAP, BEP",
-                "Baccalauréat",
-                "Bac +2",
-                "Bac +3 et plus"
-            ],
-            "Y7REL1ST": [
-                "Catholique",
-                "Juive",
-                "Musulmane",
-                "Autre religion (protestante, boudhiste ou autre)",
-                "Sans religion"
-            ],
-            "Y7ECO2ST2": [
-                "Moins de 1 250 euros",
-                "De 1 250 euros à 1 999 euros",
-                "De 2 000 à 3 499 euros",
-                "De 3 500 à 4 999 euros",
-                "5 000 euros et plus"
-            ],
-            "Y7INTPOLST": [
-                "Beaucoup",
-                "Un peu",
-                "Pas vraiment",
-                "Pas du tout"
-            ],
-            "Y7Q7ST": [
-                "Très à gauche",
-                "Plutôt à gauche",
-                "Au centre",
-                "Plutôt à droite",
-                "Très à droite"
-            ],
-            "Y7PROXST": [
-                "Très à gauche (Lutte Ouvrière, Nouveau Parti Anticapitaliste, Parti Communiste Français, France Insoumise)",
-                "Gauche (Parti Socialiste, Europe Ecologie - Les Verts)",
-                "Centre (Renaissance, Le MoDem (Mouvement Démocrate), Horizons, UDI (Union des Démocrates et Indépendants))",
-                "Droite (Les Républicains)",
-                "Très à droite (Debout la France, Rassemblement national (ex Front National), Reconquête!)",
-                "Autre parti ou aucun parti"
-            ]
-        }
-       # définir une fonction qui affiche les étiquettes
-        # des modalités de la variablr SD choisie dans la légende
-        # sur plusieurs lignes si leur longueur initiale dépasse la
-        # largeur du cadre de la légende (version robuste avec gestion des erreurs)
-        def wrap_label(label, max_length=20):
-            try:
-                # Si le label est un float ou NaN
-                if pd.isna(label) or isinstance(label, float):
-                    return "Non renseigné"
-                # Convertir en string si ce n'est pas déjà le cas
-                label = str(label).strip()
-                # Si la chaîne est vide après nettoyage
-                if not label:
-                    return "Non renseigné"
-                if len(label) <= max_length:
-                    return label
-                words = label.split()
-                lines = []
-                current_line = []
-                current_length = 0
-                for word in words:
-                    if current_length + len(word) > max_length:
-                        lines.append(' '.join(current_line))
-                        current_line = [word]
-                        current_length = len(word)
-                    else:
-                        current_line.append(word)
-                        current_length += len(word) + 1  
-                if current_line:
-                    lines.append(' '.join(current_line))
-                return '<br>'.join(lines)
-            except Exception as e:
-                print(f"Erreur dans wrap_label avec {label}: {str(e)}")
-                return str(label) 
-                # retourner le label tel quel en cas d'erreur
-        # lire le fichier CSV des données
-        csvfile = "data/T_w7_pl15st_" + "%s" % input.Select_VarSD_DegConfAN_Legis_T2().lower()[2:] + ".csv"
-        df = pd.read_csv(csvfile)
-        # nettoyer les données lues
-        var_sd = input.Select_VarSD_DegConfAN_Legis_T2()
-        df[var_sd] = df[var_sd].fillna("Non renseigné")  # Gérer les NaN
-        df[var_sd] = df[var_sd].astype(str)  # Convertir en string
-        df['Y7PL15ST'] = df['Y7PL15ST'].fillna("Non renseigné")
-        # s'assurer que toutes les modalités sont des chaînes de caractères dans "dico_ordre_modalites"
-        dico_ordre_modalites[var_sd] = [str(modal) for modal in dico_ordre_modalites[var_sd]]
-        # filtrer pour ne garder que les modalités définies dans "dico_ordre_modalites"
-        df = df[df[var_sd].isin(dico_ordre_modalites[var_sd])]
-        # définir l'ordre des modalités pour Y7PL15ST
-        ordre_modalites = [
-            "Confiance",
-            "Pas confiance"
-        ]
-        # créer une colonne catégorielle avec l'ordre souhaité pour la variable socio-démographique
-        var_sd = input.Select_VarSD_DegConfAN_Legis_T2()
-        df[var_sd] = pd.Categorical(
-            df[var_sd],
-            categories=dico_ordre_modalites[var_sd],
-            ordered=True
+        m = ui.modal(
+            "La question posée aux répondants est la suivante : 'Diriez-vous que la décision d’Emmanuel Macron de dissoudre l’Assemblée nationale, et les résultats des élections législatives qui ont suivi cette décision, ont eu des conséquences positives ou négatives pour la France ?'",
+            title="Informations complémentaires sur la question contenue dans l'enquête :",
+            easy_close=False
         )
-        # filtrer et pivoter les données
-        df_pivot = df[df['Y7PL15ST'].isin(ordre_modalites)].pivot(
-            index=var_sd,
-            columns='Y7PL15ST',
-            values='pct'
+        ui.modal_show(m)
+
+    # bouton 02 : décrire la variable de l'intention d'aller voter choisie
+    @reactive.effect
+    @reactive.event(input.Show_AVCONSDISSST_Info_Legis_T2)
+    def _():
+        m = ui.modal(
+            "La variable sur l'avis sur les conséquences de la dissolution de l'Assemblée nationale de la part des répondants présentée ici sur les graphiques est une modalité synthétique de la question posée aux répondants de l'enquête. \
+            Ainsi, à partir des quatre modalités de réponse à la question de l'enquête, on en construit deux : 'Des conséquences positives (très positives ou plutôt positives)' ou 'Des conséquences négatives (très négatives ou plutôt négatives)'.",
+            title="Informations complémentaires sur la variable choisie pour les graphiques :",
+            easy_close=False
         )
-        df_pivot = df_pivot.reindex(columns=ordre_modalites)
-        # créer une palette de couleurs automatique
-        nb_couleurs = len(df_pivot.index)
-        palette = px.colors.qualitative.Plotly[:nb_couleurs]
-        # créer le graphique
-        fig = go.Figure()
-        # ajouter les données
-        for i, VarSD in enumerate(df_pivot.index):
-            fig.add_trace(
-                go.Bar(
-                    x=ordre_modalites,
-                    y=df_pivot.loc[VarSD],
-                    name=wrap_label(VarSD),
-                    marker_color=palette[i],
-                    # afficher les valeurs sous le format 'xx.x%' dans la bulle qui s'affiche
-                    # au survol de la courbe par la souris, et supprimer toutes les autres
-                    # informations qui pourraient s'afficher en plus (nom de la modalité)
-                    hovertemplate='%{y:.1f}%<extra></extra>',
-                    # n'afficher la bulle contenant la valeur 'y' en % uniquement
-                    # au-dessus de la barre verticale survolée par la souris
-                    hoverinfo='y',
-                    # centrer ce texte 'y' dans la bulle
-                    hoverlabel=dict(
-                        align='auto'
-                    )
-                )
-            )
-         # mettre en forme le graphique
-        fig.update_layout(
-            barmode='group', # barres séparées et groupées pour les modalités de la VarSD choisie
-            title={
-                'text': "Degré de confiance envers la nouvelle Assemblée nationale en fonction %s" % dico_titre.get("%s" % input.Select_VarSD_DegConfAN_Legis_T2()),
-                'y':0.98,
-                'x':0.01,
-                'xanchor': 'left',
-                'yanchor': 'top'
-            },
-            # définir le titre de la légende
-            legend_title="%s" % dico_legende.get("%s" % input.Select_VarSD_DegConfAN_Legis_T2()),
-            # définir l'affichage séparé des valeurs de % affichées au-dessus de
-            # chaque barre verticale quand la souris la survole
-            hovermode="closest",
-            # définir le thème général de l'apparence du graphique
-            template="plotly_white",
-            # définir le titre de l'axe des ordonnées et son apparence
-            yaxis_title=dict(
-                text='Pourcentage de répondants (%)',
-                font_size=12
-            ),
-            # définir les sources des données
-            annotations=[
-                dict(
-                    xref='paper', # utiliser la largeur totale du graphique comme référence
-                    yref='paper', # utiliser la hauteur totale du graphique comme référence
-                    x=0.5, # placer le point d'ancrage au milieu de la largeur
-                    y=-0.1, # valeur à ajuster pour positionner verticalement le texte sous le graphique
-                    xanchor='center', # centrer le texte par rapport au point d'ancrage
-                    yanchor='top',
-                    text=
-                        'Enquête électorale française pour les ' +
-                        'élections européennes de juin 2024, ' +
-                        'par Ipsos Sopra Steria, Cevipof, ' +
-                        'Le Monde, Fondation Jean Jaurès et ' +
-                        'Institut Montaigne (2024)',
-                    font=dict(
-                        size=10,
-                        color='grey'
-                    ),
-                    showarrow=False
-                )
-            ],
-            # définir les marges de la zone graphique
-            # (augmentées à droite pour le cadre fixe de la légende)
-            margin=dict(
-                b=50, # b = bottom
-                t=50,  # t = top
-                l=50, # l = left
-                r=200 # r = right
-            ),
-            # fixer la position de la légende
-            legend=dict(
-                orientation="v",
-                valign='top',  # aligner le texte en haut de chaque marqueur de la légende
-                x=1.02, # position horizontale de la légende (1 = à droite du graphique)
-                y=1, # position verticale de la légende (1 = en haut)
-                xanchor='left', # ancrer la légende à gauche de sa position x
-                yanchor='top', # ancrer la légende en haut de sa position y
-                bgcolor='rgba(255,255,255,0.8)' # fond légèrement transparent
-            ),
+        ui.modal_show(m)
+
+    # bouton 03 : afficher la description de la variable socio-démographique choisie
+    _show_varsd_info(input.Show_VarSD_AvConsDiss_Info_Legis_T2, input.Select_VarSD_AvConsDiss_Legis_T2)
+
+    # graphique
+    @output
+    @render_plotly
+    def Graph_Croise_AvConsDiss_Legis_T2():
+        # récupérer le graphique mémorisé pour la variable socio-démographique choisie
+        return _fig_croise_avconsdiss_legis_t2(input.Select_VarSD_AvConsDiss_Legis_T2())
+
+
+    #####################################################################
+    # onglet 09 : DEGRE DE CONFIANCE EN LA NOUVELLE ASSEMBLEE NATIONALE #
+    #####################################################################
+
+    # bouton 01 : décrire la question posée dans l'enquête
+    @reactive.effect
+    @reactive.event(input.Show_DEGCONFAN_Question_Legis_T2)
+    def _():
+        m = ui.modal(
+            "La question posée aux répondants est la suivante : 'Diriez-vous que vous avez confiance ou non dans la nouvelle Assemblée nationale, issue des élections législatives des 30 juin et 7 juillet dernier ?'",
+            title="Informations complémentaires sur la question contenue dans l'enquête :",
+            easy_close=False
         )
-        # retourner le graphique
-        return fig
+        ui.modal_show(m)
+
+    # bouton 02 : décrire la variable de l'intention d'aller voter choisie
+    @reactive.effect
+    @reactive.event(input.Show_DEGCONFANST_Info_Legis_T2)
+    def _():
+        m = ui.modal(
+            "La variable sur le degré de confiance des répondants envers la nouvelle Assemblée nationale présentée ici sur les graphiques est une modalité synthétique de la question posée aux répondants de l'enquête. \
+            Ainsi, à partir des quatre modalités de réponse à la question de l'enquête, on en construit deux : 'Confiance (tout à fait confiance ou plutôt confiance)' ou 'Pas confiance (pas du tout confiance ou plutôt pas confiance)'.",
+            title="Informations complémentaires sur la variable choisie pour les graphiques :",
+            easy_close=False
+        )
+        ui.modal_show(m)
+
+    # bouton 03 : afficher la description de la variable socio-démographique choisie
+    _show_varsd_info(input.Show_VarSD_DegConfAN_Info_Legis_T2, input.Select_VarSD_DegConfAN_Legis_T2)
+
+    # graphique
+    @output
+    @render_plotly
+    def Graph_Croise_DegConfAN_Legis_T2():
+        # retourner le graphique mémorisé pour la variable socio-démographique choisie
+        return _fig_croise_degconfan_legis_t2(input.Select_VarSD_DegConfAN_Legis_T2())
 
 
     #####################################################################
@@ -5708,71 +3945,7 @@ def server(input, output, session):
         ui.modal_show(m)
 
     # bouton 03 : afficher la description de la variable socio-démographique choisie
-    # avec plusieurs parties de texte qui dépendent de ce choix (via des dictionnaires)
-    @reactive.effect
-    @reactive.event(input.Show_VarSD_SouhDemPR_Info_Legis_T2)
-    def _():
-        # définir le nom de la variable socio-démographique choisie
-        dico_nom_var = {
-            "Y7SEXEST": "Genre",
-            "Y7AGERST": "Âge",
-            "Y7REG13ST": "Région",
-            "Y7AGGLO5ST": "Taille d'agglomération",
-            "Y7EMPST": "Type d'emploi occupé",
-            "Y7PCSIST": "Catégorie professionnelle",
-            "Y7EDUST": "Niveau de scolarité atteint",
-            "Y7REL1ST": "Religion",
-            "Y7ECO2ST2": "Revenu mensuel du foyer",
-            "Y7INTPOLST": "Intérêt pour la politique",
-            "Y7Q7ST": "Positionnement idéologique",
-            "Y7PROXST": "Préférence partisane"
-        }
-        # définir la question de l'enquête associée à la variable socio-démographique choisie
-        dico_question_var = {
-            "Y7SEXEST": "Êtes-vous ?",
-            "Y7AGERST": "Quelle est votre date de naissance ?",
-            "Y7REG13ST": "Veuillez indiquer le département et la commune où vous résidez.",
-            "Y7AGGLO5ST": "Veuillez indiquer le département et la commune où vous résidez.",
-            "Y7EMPST": "Quelle est votre situation professionnelle actuelle ?",
-            "Y7PCSIST": "Quelle est votre situation professionnelle actuelle ?",
-            "Y7EDUST": "Choisissez votre niveau de scolarité le plus élevé.",
-            "Y7REL1ST": "Quelle est votre religion, si vous en avez une ?",
-            "Y7ECO2ST2": " Pour finir, nous avons besoin de connaître, à des fins statistiques uniquement, la tranche dans laquelle se situe le revenu MENSUEL NET de votre FOYER après déduction des impôts sur le revenu (veuillez considérer toutes vos sources de revenus: salaires, bourses, prestations retraite et sécurité sociale, dividendes, revenus immobiliers, pensions alimentaires etc.).",
-            "Y7INTPOLST": "De manière générale, diriez-vous que vous vous intéressez à la politique ?",
-            "Y7Q7ST": "Sur une échelle de 0 à 10, où 0 correspond à la gauche et 10 correspond à la droite, où diriez-vous que vous vous situez ?",
-            "Y7PROXST": "De quel parti vous sentez-vous proche ou moins éloigné que les autres ?"
-        }
-        # définir les modalités de réponse à la question de l'enquête associée à la variable socio-démographique choisie
-        dico_modalite_var = {
-            "Y7SEXEST": "1 = 'Homme' ; 2 = 'Femme'",
-            "Y7AGERST": "1 = '18 à 24 ans' ; 2 = '25 à 34 ans' ; 3 = '35 à 49 ans' ; 4 = '50 à 59 ans' ; 5 = '60 ans et plus'",
-            "Y7REG13ST": "1 = 'Ile de France' ; 2 = 'Nord et Est (Hauts de France, Grand Est et Bourgogne Franche Comté)' ; 3 = 'Ouest (Normandie, Bretagne, Pays de la Loire et Centre Val de Loire)' ; 4 = 'Sud ouest (Nouvelle Aquitaine et Occitanie)' ; 5 = 'Sud est (Auvergne Rhône Alpes, Provence Alpes Côte d'Azur et Corse)'",
-            "Y7AGGLO5ST": "1 = 'Zone rurale (moins de 2 000 habitants)' ; 2 = 'Zone urbaine de 2 000 à 9 999 habitants' ; 3 = 'Zone urbaine de 10 000 à 49 999 habitants' ; 4 = 'Zone urbaine de 50 000 à 199 999 habitants' ; 5 = 'Zone urbaine de 200 000 habitants et plus'",
-            "Y7EMPST": "1 = 'Salarié (salarié à plein temps ou à temps partiel)' ; 2 = 'Indépendant (travaille à mon compte)' ; 3 = 'Sans emploi (ne travaille pas actuellement tout en recherchant un emploi ou non, personne au foyer, retraité, étudiant ou élève)'",
-            "Y7PCSIST": "1 = 'Agriculteur exploitant, artisan, commerçant, chef d entreprise' ; 2 = 'Cadre supérieur' ; 3 = 'Profession intermédiaire' ; 4 = 'Employé' ; 5 = 'Ouvrier' ; 6 = 'Retraité, inactif'",
-            "Y7EDUST": "1 = 'Aucun diplôme' ; 2 = 'CAP, BEP' ; 3 = 'Baccalauréat' ; 4 = 'Bac +2' ; 5 = 'Bac +3 et plus'",
-            "Y7REL1ST": "1 = 'Catholique' ; 2 = 'Juive' ; 3 = 'Musulmane' ; 4 = 'Autre religion (protestante, boudhiste ou autre)' ; 5 = 'Sans religion'",
-            "Y7ECO2ST2": "1 = 'Moins de 1 250 euros' ; 2 = 'De 1 250 euros à 1 999 euros' ; 3 = 'De 2 000 à 3 499 euros' ; 4 = 'De 3 500 à 4 999 euros' ; 5 = '5 000 euros et plus'",
-            "Y7INTPOLST": "1 = 'Beaucoup' ; 2 = 'Un peu' ; 3 = 'Pas vraiment' ; 4 = 'Pas du tout'",
-            "Y7Q7ST": "1 = 'Très à gauche' ; 2 = 'Plutôt à gauche' ; 3 = 'Au centre' ; 4 = 'Plutôt à droite' ; 5 = 'Très à droite'",
-            "Y7PROXST": "1 = 'Extême gauche (Lutte Ouvrière, Nouveau Parti Anticapitaliste, Parti Communiste Français, France Insoumise)' ; 2 = 'Gauche (Parti Socialiste, Europe Ecologie - Les Verts)' ; 3 = 'Centre (Renaissance, Le MoDem (Mouvement Démocrate), Horizons, UDI (Union des Démocrates et Indépendants))' ; 4 = 'Droite (Les Républicains)' ; 5 = 'Très à droite (Debout la France, Rassemblement national (ex Front National), Reconquête!)' ; 6 = 'Autre parti ou aucun parti'"
-        }
-        # définir le texte complet à afficher (avec parties fixes et variables en fonction du choix effectué)
-        m = ui.modal(
-            "La variable '%s' correspond à ou est calculée à partir de la question suivante posée aux répondants : \
-            '%s', \
-            et ses modalités de réponse (inchangées par rapport au questionnaire ou regroupées pour les présents graphiques) sont : \
-            %s." % (
-                dico_nom_var.get(
-                    "%s" % input.Select_VarSD_SouhDemPR_Legis_T2()
-                ),
-                dico_question_var.get("%s" % input.Select_VarSD_SouhDemPR_Legis_T2()),
-                dico_modalite_var.get("%s" % input.Select_VarSD_SouhDemPR_Legis_T2())
-            ),
-            title="Informations complémentaires sur la variable socio-démographique choisie :",
-            easy_close=False
-        )
-        ui.modal_show(m)
+    _show_varsd_info(input.Show_VarSD_SouhDemPR_Info_Legis_T2, input.Select_VarSD_SouhDemPR_Legis_T2)
 
     # graphique
     @output
@@ -5990,7 +4163,7 @@ def server(input, output, session):
         df_pivot = df_pivot.reindex(columns=ordre_modalites)
         # créer une palette de couleurs automatique
         nb_couleurs = len(df_pivot.index)
-        palette = px.colors.qualitative.Plotly[:nb_couleurs]
+        palette = pc.qualitative.Plotly[:nb_couleurs]
         # créer le graphique
         fig = go.Figure()
         # ajouter les données
@@ -6004,14 +4177,7 @@ def server(input, output, session):
                     # afficher les valeurs sous le format 'xx.x%' dans la bulle qui s'affiche
                     # au survol de la courbe par la souris, et supprimer toutes les autres
                     # informations qui pourraient s'afficher en plus (nom de la modalité)
-                    hovertemplate='%{y:.1f}%<extra></extra>',
-                    # n'afficher la bulle contenant la valeur 'y' en % uniquement
-                    # au-dessus de la barre verticale survolée par la souris
-                    hoverinfo='y',
-                    # centrer ce texte 'y' dans la bulle
-                    hoverlabel=dict(
-                        align='auto'
-                    )
+                    hovertemplate='%{y:.1f}%<extra></extra>'
                 )
             )
          # mettre en forme le graphique
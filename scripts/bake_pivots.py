@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Précalcul des tableaux croisés des graphiques de l'application
+
+Le script est à lancer une seule fois (à la construction de l'application),
+depuis la racine du projet :
+
+    python scripts/bake_pivots.py
+
+Pour chaque variable socio-démographique, les tableaux croisés de la participation
+au 2e tour des législatives, du sentiment personnel sur les résultats des
+élections, de l'avis sur le front républicain, de l'accord de vues avec
+l'entourage, de l'avis sur les conséquences de la dissolution et du degré de
+confiance envers la nouvelle Assemblée nationale (fichiers
+"data/T_w7_<nom>_<var>.csv") sont calculés directement à partir des fichiers
+CSV, puis enregistrés dans "data/T_w7_<nom>_<var>_pivot.parquet". L'application
+lit ensuite ces tableaux, sans pivoter les données à l'affichage des graphiques,
+tant qu'ils ne sont pas plus anciens que les fichiers CSV (le script est alors
+à relancer).
+"""
+
+
+
+#####################
+## BLOC LIBRAIRIES ##
+#####################
+
+import os
+import sys
+
+# rendre importable le module "app" situé à la racine du projet
+# (l'ordre des modalités, les chemins des fichiers et le calcul des tableaux
+# croisés y sont définis)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import _TABLEAUX_CROISES_PRECALCULES, _pivot_croise, _pivot_path, _read_data_csv
+
+
+
+####################
+## BLOC PRÉCALCUL ##
+####################
+
+def main():
+    # parcourir tous les tableaux croisés précalculés et toutes les variables
+    # socio-démographiques
+    for csvfiles, variable, ordre_modalites in _TABLEAUX_CROISES_PRECALCULES:
+        for var_sd, csvfile in csvfiles.items():
+            pivotfile = _pivot_path(csvfile)
+            # calculer le tableau à partir du fichier CSV lui-même (et non de sa
+            # copie Parquet ou d'un tableau déjà précalculé, qui peuvent être
+            # anciens), en conservant l'index (modalités de la variable SD)
+            _pivot_croise(_read_data_csv(csvfile), var_sd, variable, ordre_modalites).to_parquet(
+                pivotfile,
+                engine="pyarrow",
+                compression="zstd"
+            )
+            print(f"{csvfile} -> {pivotfile}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Conversion des fichiers CSV de données de l'application au format Parquet
+
+Le script est à lancer une seule fois (à la construction de l'application),
+depuis la racine du projet :
+
+    python scripts/convert_to_parquet.py
+
+Chaque fichier "data/<nom>.csv" lu par l'application au moyen de la fonction
+"_load_static_csv" (votes en faveur des candidats et tableaux croisés des
+législatives) est converti en "data/<nom>.parquet". L'application lit ensuite
+ces fichiers Parquet à la place des CSV, ce qui évite l'analyse du texte à
+chaque lecture, tant qu'ils ne sont pas plus anciens que les fichiers CSV
+(le script est alors à relancer).
+"""
+
+
+
+#####################
+## BLOC LIBRAIRIES ##
+#####################
+
+import os
+import sys
+
+# rendre importable le module "app" situé à la racine du projet
+# (la liste et la lecture des fichiers CSV y sont définies)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import _FICHIERS_DONNEES_PARQUET, _read_data_csv
+
+
+
+#####################
+## BLOC CONVERSION ##
+#####################
+
+def main():
+    # parcourir les fichiers CSV lus par l'application au moyen de "_load_static_csv"
+    # (les autres fichiers du dossier des données sont lus directement en CSV)
+    for csvfile in _FICHIERS_DONNEES_PARQUET:
+        parquetfile = os.path.splitext(csvfile)[0] + ".parquet"
+        # lire le fichier comme le fait l'application (colonnes utilisées seulement,
+        # première colonne sans nom comme index) et conserver l'index tel quel,
+        # pour que la table lue soit la même qu'à partir du fichier CSV
+        _read_data_csv(csvfile).to_parquet(
+            parquetfile,
+            engine="pyarrow",
+            compression="zstd"
+        )
+        print(f"{csvfile} -> {parquetfile}")
+
+
+if __name__ == "__main__":
+    main()